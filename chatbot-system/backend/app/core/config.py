@@ -94,6 +94,9 @@ class AppSettings(BaseSettings):
         env="VISUALIZATION_DEFAULT_COLORS"
     )
 
+    # Enabled Backends (comma-separated: postgresql, oracle, anthropic)
+    enabled_backends: str = Field("postgresql,oracle,anthropic", env="ENABLED_BACKENDS")
+
     # Per-Agent Model Configuration
     execution_planner_model: Optional[str] = Field(None, env="EXECUTION_PLANNER_MODEL")
     tool_selector_model: Optional[str] = Field(None, env="TOOL_SELECTOR_MODEL")
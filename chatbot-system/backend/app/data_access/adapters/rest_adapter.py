@@ -6,7 +6,7 @@ Includes retry logic, authentication, and response caching.
 import httpx
 import logging
 import json
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import urljoin
 from tenacity import (
     retry,
@@ -30,7 +30,7 @@ class RESTAdapter(BaseDataAdapter):
     Handles authentication, retries, and caching.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], client: Optional[httpx.AsyncClient] = None):
         """
         Initialize REST adapter with configuration.
 
@@ -41,6 +41,10 @@ class RESTAdapter(BaseDataAdapter):
                 - timeout: Request timeout in seconds
                 - retry_attempts: Number of retry attempts
                 - headers: Default headers
+            client: Optional shared HTTP client. The caller owns it and its pool
+                limits: connect() reuses it and disconnect() leaves it open.
+                This adapter's auth, headers and timeout go on each request,
+                never onto the shared client.
         """
         super().__init__(config)
 
@@ -53,10 +57,14 @@ class RESTAdapter(BaseDataAdapter):
         self.timeout = config.get('config', {}).get('timeout', 30)
         self.retry_attempts = config.get('config', {}).get('retry_attempts', 3)
 
-        # Initialize connection pool
-        self.client: Optional[httpx.AsyncClient] = None
+        # Initialize connection pool (or reuse the caller's shared client)
+        self.client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
         self.default_headers = config.get('headers', {})
 
+        # Credentials are sent per request so a shared client never carries them
+        self._auth_headers, self._auth = self._build_authentication()
+
         # Cache configuration
         self.cache_enabled = config.get('cache_enabled', False)
         self.cache_ttl = config.get('cache_ttl', 300)  # 5 minutes default
@@ -71,18 +79,16 @@ class RESTAdapter(BaseDataAdapter):
         """
         try:
             # Create async HTTP client with connection pooling
-            self.client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers=self.default_headers,
-                limits=httpx.Limits(
-                    max_keepalive_connections=10,
-                    max_connections=20
+            if self._owns_client:
+                self.client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    timeout=httpx.Timeout(self.timeout),
+                    headers=self.default_headers,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10,
+                        max_connections=20
+                    )
                 )
-            )
-
-            # Set up authentication
-            await self._setup_authentication()
 
             # Test connection
             await self.health_check()
@@ -97,29 +103,37 @@ class RESTAdapter(BaseDataAdapter):
     async def disconnect(self) -> None:
         """Close HTTP client and cleanup resources."""
         if self.client:
-            await self.client.aclose()
-            self.client = None
+            if self._owns_client:
+                await self.client.aclose()
+                self.client = None
             self.is_connected = False
             logger.info(f"Disconnected from REST API at {self.base_url}")
 
-    async def _setup_authentication(self):
-        """Set up authentication based on configured type."""
+    def _build_authentication(self) -> Tuple[Dict[str, str], Optional[httpx.Auth]]:
+        """
+        Build the auth headers and httpx auth for the configured type.
+
+        Returns:
+            Tuple of (headers to add to each request, auth to pass per request)
+        """
         if self.auth_type == 'bearer':
             token = self.config.get('auth_token') or self.config.get('api_key')
             if token:
-                self.client.headers['Authorization'] = f'Bearer {token}'
+                return {'Authorization': f'Bearer {token}'}, None
 
         elif self.auth_type == 'api_key':
             api_key = self.config.get('api_key')
             api_key_header = self.config.get('api_key_header', 'X-API-Key')
             if api_key:
-                self.client.headers[api_key_header] = api_key
+                return {api_key_header: api_key}, None
 
         elif self.auth_type == 'basic':
             username = self.config.get('username')
             password = self.config.get('password')
             if username and password:
-                self.client.auth = httpx.BasicAuth(username, password)
+                return {}, httpx.BasicAuth(username, password)
+
+        return {}, None
 
     @retry(
         stop=stop_after_attempt(3),
@@ -163,13 +177,17 @@ class RESTAdapter(BaseDataAdapter):
                 return cached
 
         try:
-            # Step 2: Authentication headers are already set in client
+            # Step 2: Add this adapter's headers and auth to the request
+            headers = {**self.default_headers, **self._auth_headers, **(kwargs.pop('headers', None) or {})}
+            kwargs.setdefault('timeout', self.timeout)
 
             # Step 3: Make async HTTP request
             logger.debug(f"Making {method} request to {url}")
             response = await self.client.request(
                 method=method,
                 url=url,
+                headers=headers,
+                auth=self._auth,
                 **kwargs
             )
 
@@ -13,6 +13,48 @@ from app.llm.base_provider import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Returned by an extractor when the field doesn't hold text in its format
+_NO_TEXT = object()
+
+
+def _anthropic_text(content: Any) -> Any:
+    """Anthropic: content[0]["text"]"""
+    if isinstance(content, list) and content and "text" in content[0]:
+        return content[0]["text"]
+    return _NO_TEXT
+
+
+def _openai_text(choices: Any) -> Any:
+    """OpenAI: choices[0]["message"]["content"], or choices[0]["text"]"""
+    if len(choices) > 0:
+        choice = choices[0]
+        if "message" in choice and "content" in choice["message"]:
+            return choice["message"]["content"]
+        if "text" in choice:
+            return choice["text"]
+    return _NO_TEXT
+
+
+def _plain_text(content: Any) -> Any:
+    """Simple content string (Eliza and others)"""
+    return content if isinstance(content, str) else _NO_TEXT
+
+
+def _message_text(message: Any) -> Any:
+    """message["content"]"""
+    return message["content"] if "content" in message else _NO_TEXT
+
+
+# (response key, extractor) pairs tried in order by _extract_response_text;
+# an extractor only runs when its key is present
+_RESPONSE_EXTRACTORS = (
+    ("content", _anthropic_text),
+    ("choices", _openai_text),
+    ("content", _plain_text),
+    ("message", _message_text),
+    ("text", lambda text: text),
+)
+
 
 class ConsolidatorNode(BaseNode):
     """
@@ -458,30 +500,11 @@ class ConsolidatorNode(BaseNode):
         - OpenAI: response["choices"][0]["message"]["content"]
         - Eliza: response["message"]["content"] or response["content"]
         """
-        # Try Anthropic format
-        if "content" in response and isinstance(response["content"], list):
-            if len(response["content"]) > 0 and "text" in response["content"][0]:
-                return response["content"][0]["text"]
-
-        # Try OpenAI format
-        if "choices" in response and len(response["choices"]) > 0:
-            choice = response["choices"][0]
-            if "message" in choice and "content" in choice["message"]:
-                return choice["message"]["content"]
-            if "text" in choice:
-                return choice["text"]
-
-        # Try simple content format (Eliza and others)
-        if "content" in response and isinstance(response["content"], str):
-            return response["content"]
-
-        # Try message.content format
-        if "message" in response and "content" in response["message"]:
-            return response["message"]["content"]
-
-        # Try direct text field
-        if "text" in response:
-            return response["text"]
+        for key, extract in _RESPONSE_EXTRACTORS:
+            if key in response:
+                text = extract(response[key])
+                if text is not _NO_TEXT:
+                    return text
 
         # Fallback - return as JSON string
         logger.warning(f"⚠️ Unknown response format, returning as JSON")
@@ -8,6 +8,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Stands in for a field absent from a record (None is a valid value)
+_MISSING = object()
+
 
 class DataMerger:
     """
@@ -316,16 +319,15 @@ class DataMerger:
         for record in data:
             # Create key from specified fields or all fields
             if key_fields:
-                key_data = {k: record.get(k) for k in key_fields if k in record}
+                # Fast path: a tuple of the fields' hashable values, typed so
+                # that 1, 1.0 and True stay distinct as they are in JSON
+                key = tuple((k, type(record[k]), record[k]) for k in key_fields if k in record)
+                try:
+                    hash(key)
+                except TypeError:
+                    key = self._json_key({k: record.get(k) for k in key_fields if k in record})
             else:
-                key_data = {k: v for k, v in record.items() if k != "_source" and k != "_sources"}
-
-            # Convert to hashable key
-            try:
-                key = json.dumps(key_data, sort_keys=True)
-            except (TypeError, ValueError):
-                # If not JSON serializable, use str representation
-                key = str(key_data)
+                key = self._json_key({k: v for k, v in record.items() if k != "_source" and k != "_sources"})
 
             if key not in seen:
                 seen.add(key)
@@ -334,6 +336,15 @@ class DataMerger:
         logger.info(f"✅ Deduplication complete: {len(unique)} unique records")
         return unique
 
+    @staticmethod
+    def _json_key(key_data: Dict[str, Any]) -> str:
+        """Hashable key for deduplicate from field values that may not be hashable"""
+        try:
+            return json.dumps(key_data, sort_keys=True)
+        except (TypeError, ValueError):
+            # If not JSON serializable, use str representation
+            return str(key_data)
+
     def correlate_by_field(
         self,
         data: List[Dict[str, Any]],
@@ -364,12 +375,16 @@ class DataMerger:
 
         correlated: Dict[Any, List[Dict[str, Any]]] = {}
 
+        # One lookup per record and per group, since this runs over full result sets
         for record in data:
-            if field_name in record:
-                value = record[field_name]
-                if value not in correlated:
-                    correlated[value] = []
-                correlated[value].append(record)
+            value = record.get(field_name, _MISSING)
+            if value is _MISSING:
+                continue
+            group = correlated.get(value)
+            if group is None:
+                correlated[value] = [record]
+            else:
+                group.append(record)
 
         logger.info(f"✅ Correlated into {len(correlated)} groups")
         return correlated
@@ -8,6 +8,14 @@ from app.intelligence.orchestration.types import AgentState, AgentType, RoutingD
 
 logger = logging.getLogger(__name__)
 
+# Map AgentType to routing decision; built once, as routing runs on every step
+_SUPERVISOR_ROUTES = {
+    AgentType.SQL_AGENT: "sql_agent",
+    AgentType.API_AGENT: "api_agent",
+    AgentType.SOAP_AGENT: "soap_agent",
+    AgentType.CONSOLIDATOR: "consolidator"
+}
+
 
 def route_from_supervisor(state: AgentState) -> RoutingDecision:
     """
@@ -29,15 +37,7 @@ def route_from_supervisor(state: AgentState) -> RoutingDecision:
         logger.info("🏁 No next agent, routing to END")
         return "end"
 
-    # Map AgentType to routing decision
-    routing_map = {
-        AgentType.SQL_AGENT: "sql_agent",
-        AgentType.API_AGENT: "api_agent",
-        AgentType.SOAP_AGENT: "soap_agent",
-        AgentType.CONSOLIDATOR: "consolidator"
-    }
-
-    decision = routing_map.get(next_agent, "end")
+    decision = _SUPERVISOR_ROUTES.get(next_agent, "end")
 
     logger.info(f"🔀 Routing from supervisor to: {decision}")
 
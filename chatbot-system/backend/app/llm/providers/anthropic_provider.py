@@ -43,9 +43,17 @@ class AnthropicProvider(BaseLLMProvider):
 
     async def connect(self) -> bool:
         """Initialize Anthropic client"""
+        if self.client:
+            return True  # already connected; keep the pooled connections
         try:
+            # Kept-alive connections let every request after the first skip
+            # the TCP and TLS handshakes
             self.client = httpx.AsyncClient(
                 timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0
+                ),
                 headers={
                     "x-api-key": self.api_key,
                     "anthropic-version": "2023-06-01",
@@ -348,6 +348,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=api_config.host,
         port=api_config.port,
+        loop="auto",  # uvloop when installed, asyncio otherwise
         reload=settings.environment == "development"#,
         #log_level=(settings.debug and "debug" or "info")
     )
\ No newline at end of file
@@ -3,10 +3,15 @@ Session Manager for maintaining conversation state.
 Uses Redis for distributed session storage.
 """
 
+import os
 import json
+import time
 import uuid
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from collections import deque
+from itertools import chain, islice
+from typing import Callable, Deque, Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import redis.asyncio as redis
 from pydantic import BaseModel, Field
@@ -36,18 +41,25 @@ class SessionManager:
     Uses Redis for persistence and distributed access.
     """
 
-    def __init__(self, redis_config: dict):
+    def __init__(self, redis_config: dict, clock: Callable[[], float] = time.monotonic):
         """
         Initialize SessionManager with Redis configuration.
 
         Args:
             redis_config: Redis connection configuration
+            clock: Monotonic time source for per-session TTLs (injectable for tests)
         """
         self.redis_config = redis_config
         self.redis_client: Optional[redis.Redis] = None
         self.ttl = redis_config.get('ttl', 3600)  # Default 1 hour
+        self._clock = clock
+        self._session_expiry: Dict[str, float] = {}  # in-memory fallback: session_id -> clock deadline
         self.max_history_length = 100  # Maximum messages to keep in history
 
+        # Striped per-session locks: one session's writes serialize, other sessions don't contend
+        stripes = max(32, (os.cpu_count() or 1) * 4)
+        self._locks = [asyncio.Lock() for _ in range(1 << (stripes - 1).bit_length())]
+
     async def connect(self):
         """Connect to Redis."""
         try:
@@ -69,6 +81,8 @@ class SessionManager:
             logger.warning("Using in-memory session storage (not recommended for production)")
             self.redis_client = None
             self._memory_storage = {}
+            # History lives apart from the Session objects; maxlen evicts the oldest in O(1)
+            self._memory_history: Dict[str, Deque[Dict[str, Any]]] = {}
 
     async def disconnect(self):
         """Disconnect from Redis."""
@@ -126,7 +140,9 @@ class SessionManager:
             # Step 1: Retrieve from Redis
             if self.redis_client:
                 session_key = f"session:{session_id}"
-                session_data = await self.redis_client.get(session_key)
+                session_data, fixed_ttl = await self.redis_client.mget(
+                    session_key, f"session_ttl:{session_id}"
+                )
 
                 if not session_data:
                     return None
@@ -136,20 +152,55 @@ class SessionManager:
                 session = Session(**session_dict)
 
                 # Step 3: Check expiry (handled by Redis TTL)
-                # Step 4: Refresh TTL if active
-                if session.is_active:
+                # Step 4: Refresh TTL if active, unless an explicit TTL was set
+                if session.is_active and not fixed_ttl:
                     await self.redis_client.expire(session_key, self.ttl)
 
                 # Step 5: Return session
                 return session
             else:
-                # Fallback to memory storage
+                # Fallback to memory storage; explicit TTLs expire on the manager's clock
+                expiry = self._session_expiry.get(session_id)
+                if expiry is not None and self._clock() >= expiry:
+                    self._expire_session(session_id)
+                    return None
                 return self._memory_storage.get(session_id)
 
         except Exception as e:
             logger.error(f"Error retrieving session {session_id}: {e}")
             return None
 
+    async def set_session_ttl(self, session_id: str, ttl_seconds: float):
+        """
+        Expire a session a fixed number of seconds from now.
+
+        Unlike the default sliding TTL, reads do not extend this deadline.
+
+        Args:
+            session_id: Session identifier
+            ttl_seconds: Seconds until the session expires
+        """
+        if self.redis_client:
+            # Redis owns the deadline, so every worker sees the same expiry
+            ttl_ms = int(ttl_seconds * 1000)
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.pexpire(f"session:{session_id}", ttl_ms)
+                    pipe.pexpire(f"history:{session_id}", ttl_ms)
+                    pipe.set(f"session_ttl:{session_id}", 1, px=ttl_ms)
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f"Error setting TTL for session {session_id}: {e}")
+        else:
+            self._session_expiry[session_id] = self._clock() + ttl_seconds
+
+    def _expire_session(self, session_id: str):
+        """Drop an in-memory session whose explicit TTL has passed."""
+        self._session_expiry.pop(session_id, None)
+        self._memory_storage.pop(session_id, None)
+        self._memory_history.pop(session_id, None)
+        logger.debug(f"Session {session_id} expired")
+
     async def get_or_create_session(self, session_id: str = None, user_id: str = None) -> Session:
         """
         Get existing session or create a new one.
@@ -214,22 +265,23 @@ class SessionManager:
         5. Trigger any hooks
         """
         try:
-            # Step 1: Retrieve existing session
-            session = await self.get_session(session_id)
-            if not session:
-                logger.warning(f"Session {session_id} not found for update")
-                return
+            async with self._lock_for(session_id):
+                # Step 1: Retrieve existing session
+                session = await self.get_session(session_id)
+                if not session:
+                    logger.warning(f"Session {session_id} not found for update")
+                    return
 
-            # Step 2: Apply updates atomically
-            for key, value in updates.items():
-                if hasattr(session, key):
-                    setattr(session, key, value)
+                # Step 2: Apply updates atomically
+                for key, value in updates.items():
+                    if hasattr(session, key):
+                        setattr(session, key, value)
 
-            # Step 3: Validate state consistency
-            # (Pydantic handles validation automatically)
+                # Step 3: Validate state consistency
+                # (Pydantic handles validation automatically)
 
-            # Step 4: Save to Redis
-            await self.save_session(session)
+                # Step 4: Save to Redis
+                await self.save_session(session)
 
             # Step 5: Trigger any hooks (placeholder for future extensions)
             await self._trigger_update_hooks(session_id, updates)
@@ -245,10 +297,11 @@ class SessionManager:
             session_id: Session identifier
             context: Context dictionary to merge
         """
-        session = await self.get_session(session_id)
-        if session:
-            session.context.update(context)
-            await self.save_session(session)
+        async with self._lock_for(session_id):
+            session = await self.get_session(session_id)
+            if session:
+                session.context.update(context)
+                await self.save_session(session)
 
     async def add_message(self, session_id: str, message: Dict[str, Any]):
         """
@@ -258,45 +311,60 @@ class SessionManager:
             session_id: Session identifier
             message: Message dictionary with role and content
         """
+        await self.add_messages(session_id, [message])
+
+    async def add_messages(self, session_id: str, messages: List[Dict[str, Any]]):
+        """
+        Add several messages to session history in one update.
+
+        Args:
+            session_id: Session identifier
+            messages: Message dictionaries with role and content, oldest first
+        """
+        if not messages:
+            return
+
         try:
             if self.redis_client:
                 history_key = f"history:{session_id}"
 
-                # Add message to list
-                await self.redis_client.rpush(
-                    history_key,
-                    json.dumps(message)
-                )
-
-                # Trim to max length
-                await self.redis_client.ltrim(
-                    history_key,
-                    -self.max_history_length,
-                    -1
-                )
-
-                # Set TTL
-                await self.redis_client.expire(history_key, self.ttl)
+                # Append, trim and refresh the TTL in a single round trip
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.rpush(history_key, *(json.dumps(message) for message in messages))
+                    pipe.ltrim(history_key, -self.max_history_length, -1)
+                    pipe.expire(history_key, self.ttl)
+                    await pipe.execute()
             else:
                 # Fallback to memory storage
                 if session_id not in self._memory_storage:
                     self._memory_storage[session_id] = Session(id=session_id)
 
-                if 'history' not in self._memory_storage[session_id].metadata:
-                    self._memory_storage[session_id].metadata['history'] = []
-
-                history = self._memory_storage[session_id].metadata['history']
-                history.append(message)
+                history = self._memory_history.get(session_id)
+                if history is None:
+                    history = deque(maxlen=self.max_history_length)
+                    self._memory_history[session_id] = history
 
-                # Trim to max length
-                if len(history) > self.max_history_length:
-                    self._memory_storage[session_id].metadata['history'] = \
-                        history[-self.max_history_length:]
+                # Bounded deque trims to max length as it extends
+                history.extend(messages)
 
-            logger.debug(f"Added message to session {session_id}")
+            logger.debug(f"Added {len(messages)} message(s) to session {session_id}")
 
         except Exception as e:
-            logger.error(f"Error adding message to session {session_id}: {e}")
+            logger.error(f"Error adding messages to session {session_id}: {e}")
+
+    async def add_messages_bulk(self, session_id: str, batches: List[List[Dict[str, Any]]]):
+        """
+        Add several batches of messages to session history as one update.
+
+        Args:
+            session_id: Session identifier
+            batches: Message batches, oldest first
+        """
+        await self.add_messages(session_id, list(chain.from_iterable(batches)))
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Return the lock stripe guarding a session."""
+        return self._locks[hash(session_id) & (len(self._locks) - 1)]
 
     async def get_history(self, session_id: str, limit: int = None) -> List[Dict[str, Any]]:
         """
@@ -332,12 +400,12 @@ class SessionManager:
                 return history
             else:
                 # Fallback to memory storage
-                if session_id in self._memory_storage:
-                    history = self._memory_storage[session_id].metadata.get('history', [])
-                    if limit:
-                        return history[-limit:]
-                    return history
-                return []
+                history = self._memory_history.get(session_id)
+                if not history:
+                    return []
+                if limit:
+                    return list(islice(history, max(len(history) - limit, 0), None))
+                return list(history)
 
         except Exception as e:
             logger.error(f"Error retrieving history for session {session_id}: {e}")
@@ -355,8 +423,7 @@ class SessionManager:
                 history_key = f"history:{session_id}"
                 await self.redis_client.delete(history_key)
             else:
-                if session_id in self._memory_storage:
-                    self._memory_storage[session_id].metadata['history'] = []
+                self._memory_history.pop(session_id, None)
 
             logger.info(f"Cleared history for session {session_id}")
 
@@ -381,7 +448,11 @@ class SessionManager:
         if not self.redis_client:
             # Clean up memory storage
             current_time = datetime.utcnow()
-            expired_sessions = []
+            now = self._clock()
+            expired_sessions = [
+                session_id for session_id, expiry in self._session_expiry.items()
+                if now >= expiry
+            ]
 
             for session_id, session in self._memory_storage.items():
                 if hasattr(session, 'updated_at'):
@@ -389,7 +460,7 @@ class SessionManager:
                         expired_sessions.append(session_id)
 
             for session_id in expired_sessions:
-                del self._memory_storage[session_id]
+                self._expire_session(session_id)
                 logger.debug(f"Cleaned up expired session {session_id}")
 
     async def get_active_sessions_count(self) -> int:
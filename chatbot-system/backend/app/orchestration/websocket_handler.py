@@ -7,13 +7,96 @@ import json
 import asyncio
 import logging
 import hashlib
-from typing import Dict, Optional, Set, List, Any
+from typing import Dict, Optional, Set, List, Any, Literal, Union
+from typing_extensions import Annotated
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from datetime import datetime
 import uuid
+import orjson
+import msgpack
 
 logger = logging.getLogger(__name__)
 
+# Subprotocol a client offers to exchange MessagePack binary frames
+MSGPACK_SUBPROTOCOL = 'msgpack'
+
+
+class _InboundMessage(BaseModel):
+    """Fields shared by all client messages."""
+    model_config = ConfigDict(extra='allow')
+
+    id: Optional[Union[str, int]] = None
+
+
+class ChatMessage(_InboundMessage):
+    """Chat message from the user."""
+    type: Literal['chat']
+    content: str = Field(min_length=1)
+    context: Optional[Dict[str, Any]] = None
+
+
+class PingMessage(_InboundMessage):
+    """Connection health check."""
+    type: Literal['ping']
+
+
+class ContextUpdateMessage(_InboundMessage):
+    """Page context update from the parent application."""
+    type: Literal['context_update']
+    context: Dict[str, Any] = Field(default_factory=dict)
+
+
+class FilterRequestMessage(_InboundMessage):
+    """Request to generate filters from a natural-language query."""
+    type: Literal['filter_request']
+    query: str = ''
+
+
+# Dispatches on 'type' and validates the whole message in one pydantic-core call
+_inbound_message_validator = TypeAdapter(Annotated[
+    Union[ChatMessage, PingMessage, ContextUpdateMessage, FilterRequestMessage],
+    Field(discriminator='type')
+])
+
+
+def _describe_validation_error(error: ValidationError) -> str:
+    """Turn the first validation error into a client-facing message."""
+    detail = error.errors()[0]
+    if detail['type'] == 'union_tag_invalid':
+        return f"Unknown message type: {detail['ctx']['tag']}"
+
+    field = '.'.join(str(part) for part in detail['loc'][1:])
+    return f"Invalid message: {field + ': ' if field else ''}{detail['msg']}"
+
+
+def _encode_frame(message: dict) -> str:
+    """Serialize an outbound message with orjson for a text frame."""
+    # Frames stay text: the frontend JSON.parse()s event.data
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+# Fixed-shape control frames are pre-serialized; only their variable fields are
+# spliced in per send, skipping a dict build and encoder call on hot paths
+_PONG_PREFIX = '{"type":"pong","timestamp":"'
+_HEARTBEAT_PREFIX = '{"type":"heartbeat","timestamp":"'
+_CONNECTED_PREFIX = '{"type":"connection_established","session_id":'
+_TIMESTAMP_INFIX = ',"timestamp":"'
+_TIMESTAMP_SUFFIX = '"}'
+
+
+def _timestamped_frame(prefix: str) -> str:
+    """Complete a pre-serialized frame whose last field is the current timestamp."""
+    return prefix + datetime.utcnow().isoformat() + _TIMESTAMP_SUFFIX
+
+
+def _connection_frame(session_id: str) -> str:
+    """Serialize the connection_established frame for a session."""
+    # session_id may come from the client, so it is still JSON-escaped
+    return _timestamped_frame(
+        _CONNECTED_PREFIX + orjson.dumps(session_id).decode('utf-8') + _TIMESTAMP_INFIX
+    )
+
 
 class ConnectionManager:
     """Manages active WebSocket connections."""
@@ -21,10 +104,17 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.connection_sessions: Dict[str, str] = {}  # connection_id -> session_id
+        self.msgpack_connections: Set[str] = set()  # connections using binary MessagePack frames
+        # One reusable packer keeps its output buffer instead of building a Packer per frame
+        self._packer = msgpack.Packer()
 
     async def connect(self, websocket: WebSocket, connection_id: str, session_id: str):
-        """Accept and store a new WebSocket connection."""
-        await websocket.accept()
+        """Accept and store a new WebSocket connection, negotiating MessagePack if offered."""
+        if MSGPACK_SUBPROTOCOL in websocket.scope.get('subprotocols', []):
+            await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+            self.msgpack_connections.add(connection_id)
+        else:
+            await websocket.accept()
         self.active_connections[connection_id] = websocket
         self.connection_sessions[connection_id] = session_id
         logger.info(f"WebSocket connected: {connection_id} for session {session_id}")
@@ -34,19 +124,128 @@ class ConnectionManager:
         if connection_id in self.active_connections:
             del self.active_connections[connection_id]
             del self.connection_sessions[connection_id]
+            self.msgpack_connections.discard(connection_id)
             logger.info(f"WebSocket disconnected: {connection_id}")
 
-    async def send_message(self, connection_id: str, message: dict):
-        """Send a message to a specific connection."""
+    async def receive_message(self, connection_id: str) -> dict:
+        """Receive and decode the next message from a specific connection."""
+        websocket = self.active_connections[connection_id]
+        # Read the raw ASGI frame so the payload is decoded once, text or binary
+        frame = await websocket.receive()
+        if frame['type'] == 'websocket.disconnect':
+            raise WebSocketDisconnect(frame.get('code', 1000))
+
+        if connection_id in self.msgpack_connections:
+            return msgpack.unpackb(frame['bytes'], raw=False)
+
+        # JSON clients may send binary frames; orjson parses the bytes in place
+        payload = frame.get('text')
+        if payload is None:
+            payload = frame['bytes']
+        return orjson.loads(payload)
+
+    async def send_message(self, connection_id: str, message: Union[dict, str]):
+        """
+        Send a message to a specific connection.
+
+        message may be a dict or an already-serialized JSON frame (str), which
+        is sent to JSON clients as-is without re-encoding.
+        """
         if connection_id in self.active_connections:
             websocket = self.active_connections[connection_id]
-            await websocket.send_json(message)
-
-    async def broadcast(self, message: dict, exclude: Optional[str] = None):
-        """Broadcast a message to all connections except the excluded one."""
+            if connection_id in self.msgpack_connections:
+                if isinstance(message, str):
+                    message = orjson.loads(message)
+                await websocket.send_bytes(self._packer.pack(message))
+            elif isinstance(message, str):
+                await websocket.send_text(message)
+            else:
+                await websocket.send_text(_encode_frame(message))
+
+    async def broadcast(self, message: Union[dict, str], exclude: Optional[str] = None):
+        """Broadcast a message (dict or serialized JSON frame) to all connections except the excluded one."""
+        text_frame = message if isinstance(message, str) else None
+        binary_frame = None
+        if text_frame is not None and self.msgpack_connections:
+            message = orjson.loads(text_frame)
         for connection_id, websocket in self.active_connections.items():
-            if connection_id != exclude:
-                await websocket.send_json(message)
+            if connection_id == exclude:
+                continue
+            if connection_id in self.msgpack_connections:
+                if binary_frame is None:
+                    binary_frame = self._packer.pack(message)
+                await websocket.send_bytes(binary_frame)
+            else:
+                if text_frame is None:
+                    text_frame = _encode_frame(message)
+                await websocket.send_text(text_frame)
+
+
+class StreamChunkCoalescer:
+    """
+    Coalesces streamed LLM tokens into fewer stream_chunk frames.
+
+    Tokens are buffered and flushed as one frame once the buffer reaches
+    max_buffer_size characters or flush_delay seconds after the first
+    buffered token, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        connection_id: str,
+        message_id: str,
+        flush_delay: float = 0.005,
+        max_buffer_size: int = 16 * 1024
+    ):
+        self.connection_manager = connection_manager
+        self.connection_id = connection_id
+        self.message_id = message_id
+        self.flush_delay = flush_delay
+        self.max_buffer_size = max_buffer_size
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def add(self, content: str):
+        """Buffer a token, flushing immediately if the buffer is full."""
+        self._buffer.append(content)
+        self._buffer_size += len(content)
+
+        if self._buffer_size >= self.max_buffer_size:
+            await self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.flush_delay, self._schedule_flush
+            )
+
+    def _schedule_flush(self):
+        """Timer callback: flush the buffer from a task."""
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        """Send all buffered tokens as a single stream_chunk frame."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # The lock keeps timer and explicit flushes in order
+        async with self._lock:
+            if not self._buffer:
+                return
+
+            content = ''.join(self._buffer)
+            self._buffer = []
+            self._buffer_size = 0
+
+            await self.connection_manager.send_message(self.connection_id, {
+                'type': 'stream_chunk',
+                'content': content,
+                'id': self.message_id
+            })
 
 
 class WebSocketHandler:
@@ -169,11 +368,7 @@ class WebSocketHandler:
             session = await self.session_manager.get_or_create_session(session_id)
 
             # Send welcome message
-            await self.connection_manager.send_message(connection_id, {
-                'type': 'connection_established',
-                'session_id': session_id,
-                'timestamp': datetime.utcnow().isoformat()
-            })
+            await self.connection_manager.send_message(connection_id, _connection_frame(session_id))
 
             # Start heartbeat task
             heartbeat_task = asyncio.create_task(
@@ -207,7 +402,22 @@ class WebSocketHandler:
         while True:
             try:
                 # Receive message from client
-                data = await websocket.receive_json()
+                data = await self.connection_manager.receive_message(connection_id)
+
+                # Messages without a 'type' are chat, as clients have always relied on
+                if isinstance(data, dict):
+                    data.setdefault('type', 'chat')
+
+                # Validate the message shape before routing it
+                try:
+                    _inbound_message_validator.validate_python(data)
+                except ValidationError as e:
+                    await self.connection_manager.send_message(connection_id, {
+                        'type': 'error',
+                        'message': _describe_validation_error(e),
+                        'id': data.get('id') if isinstance(data, dict) else None
+                    })
+                    continue
 
                 # Process the message
                 await self.process_message(data, session, connection_id)
@@ -219,6 +429,11 @@ class WebSocketHandler:
                     'type': 'error',
                     'message': f'Invalid JSON: {str(e)}'
                 })
+            except msgpack.UnpackException as e:
+                await self.connection_manager.send_message(connection_id, {
+                    'type': 'error',
+                    'message': f'Invalid MessagePack: {str(e)}'
+                })
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
                 await self.connection_manager.send_message(connection_id, {
@@ -232,36 +447,36 @@ class WebSocketHandler:
 
         Steps:
         1. Parse message type and content
-        2. Add to session history
-        3. Route to appropriate handler
-        4. Stream response back
-        5. Update session state
+        2. Route to appropriate handler
+        3. Stream response back
+        4. Add the exchange to session history in one write
         """
         # Step 1: Parse message type and content
-        message_type = message.get('type', 'chat')
+        message_type = message['type']
         content = message.get('content', '')
         message_id = message.get('id', str(uuid.uuid4()))
 
         logger.debug(f"Processing message: type={message_type}, id={message_id}")
 
-        # Step 2: Add to session history
+        # The user turn is recorded after handling: handlers append the current
+        # message to the history they read, so storing it first duplicated it
+        history_entries = []
         if message_type == 'chat':
-            await self.session_manager.add_message(session.id, {
+            history_entries.append({
                 'role': 'user',
                 'content': content,
                 'timestamp': datetime.utcnow().isoformat()
             })
 
-        # Step 3: Route to appropriate handler
+        # Step 2: Route to appropriate handler
         handler = self.message_handlers.get(message_type, self._handle_unknown)
 
         try:
-            # Step 4: Stream response back
+            # Step 3: Stream response back
             response = await handler(message, session, connection_id)
 
-            # Step 5: Update session state
             if response and message_type == 'chat':
-                await self.session_manager.add_message(session.id, {
+                history_entries.append({
                     'role': 'assistant',
                     'content': response.get('content', ''),
                     'timestamp': datetime.utcnow().isoformat()
@@ -275,6 +490,10 @@ class WebSocketHandler:
                 'id': message_id
             })
 
+        # Step 4: Update session state with the user turn and reply together
+        if history_entries:
+            await self.session_manager.add_messages(session.id, history_entries)
+
     async def stream_response(self, response: str, connection_id: str, message_id: str = None):
         """
         Stream response to client in chunks while preserving markdown formatting.
@@ -399,6 +618,9 @@ class WebSocketHandler:
             full_response = ""
             # Generate new ID for assistant response (different from user message ID)
             assistant_msg_id = f"assistant_{message_id}" if message_id else str(uuid.uuid4())
+            coalescer = StreamChunkCoalescer(
+                self.connection_manager, connection_id, assistant_msg_id
+            )
 
             # Stream tokens from LLM provider
             async for chunk in self.llm_provider.stream_completion(
@@ -409,18 +631,15 @@ class WebSocketHandler:
                 if content:
                     full_response += content
 
-                    # Send token immediately to client with assistant message ID
-                    await self.connection_manager.send_message(connection_id, {
-                        'type': 'stream_chunk',
-                        'content': content,
-                        'id': assistant_msg_id
-                    })
+                    # Buffer token; the coalescer sends it within a few ms
+                    await coalescer.add(content)
 
                 # Check if done
                 if chunk.get('done'):
                     break
 
-            # Send completion signal
+            # Flush remaining tokens, then send completion signal
+            await coalescer.flush()
             await self.connection_manager.send_message(connection_id, {
                 'type': 'stream_complete',
                 'id': assistant_msg_id
@@ -751,10 +970,7 @@ class WebSocketHandler:
 
     async def _handle_ping(self, message: dict, session, connection_id: str):
         """Handle ping messages for connection health check."""
-        await self.connection_manager.send_message(connection_id, {
-            'type': 'pong',
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        await self.connection_manager.send_message(connection_id, _timestamped_frame(_PONG_PREFIX))
 
     async def _handle_context_update(self, message: dict, session, connection_id: str):
         """Handle context updates from the client."""
@@ -802,10 +1018,9 @@ class WebSocketHandler:
         try:
             while connection_id in self.connection_manager.active_connections:
                 await asyncio.sleep(self.heartbeat_interval)
-                await self.connection_manager.send_message(connection_id, {
-                    'type': 'heartbeat',
-                    'timestamp': datetime.utcnow().isoformat()
-                })
+                await self.connection_manager.send_message(
+                    connection_id, _timestamped_frame(_HEARTBEAT_PREFIX)
+                )
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """
 Simple test runner for chatbot system
-Usage: python run_tests.py [--coverage] [--verbose] [--markers MARKERS]
+Usage: python run_tests.py [--coverage] [--verbose] [--markers MARKERS] [--workers N]
 """
 import sys
 import subprocess
 from pathlib import Path
 
 
-def run_tests(coverage=False, verbose=False, markers=None, html_report=False):
+def run_tests(coverage=False, verbose=False, markers=None, html_report=False, workers=None):
     """Run pytest with specified options"""
     cmd = ["pytest"]
 
     if markers:
         cmd.extend(["-m", markers])
 
+    if workers:
+        cmd.extend(["-n", workers])
+
     if verbose:
         cmd.append("-v")
 
@@ -36,6 +39,7 @@ if __name__ == "__main__":
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     parser.add_argument("-m", "--markers", help="Run specific markers (unit, integration, e2e)")
     parser.add_argument("-r", "--html-report", action="store_true", help="Generate HTML coverage report")
+    parser.add_argument("-n", "--workers", help="Run tests in parallel with pytest-xdist (number or 'auto')")
 
     args = parser.parse_args()
 
@@ -43,7 +47,8 @@ if __name__ == "__main__":
         coverage=args.coverage,
         verbose=args.verbose,
         markers=args.markers,
-        html_report=args.html_report
+        html_report=args.html_report,
+        workers=args.workers
     )
 
     sys.exit(exit_code)
@@ -1,6 +1,7 @@
 """
 Pytest configuration and fixtures for integration tests
 """
+import os
 import pytest
 import asyncio
 from typing import AsyncGenerator, Dict, Any
@@ -8,7 +9,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import json
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
-from websocket import create_connection
+from httpx_ws import aconnect_ws
+from httpx_ws.transport import ASGIWebSocketTransport
 import redis
 from asyncpg import create_pool
 
@@ -17,6 +19,39 @@ from app.core.config import ConfigLoader
 from app.orchestration.session_manager import SessionManager
 from app.orchestration.websocket_handler import WebSocketHandler
 from app.llm.providers.eliza_provider import ElizaProvider
+from tests.mocks.mock_clock import FakeClock
+from tests.mocks.mock_responses import MockDataAdapterResponses, MockSessionData
+
+
+_MOCK_API_RESPONSES = {
+    "/api/cases": {
+        "cases": [
+            {"id": "12345", "title": "Account Issue", "status": "open"},
+            {"id": "67890", "title": "Payment Problem", "status": "resolved"}
+        ],
+        "total": 2
+    },
+    "/api/cases/12345": {
+        "id": "12345",
+        "title": "Account Issue",
+        "status": "open",
+        "description": "Customer unable to access account",
+        "priority": "high",
+        "assigned_to": "agent-001"
+    },
+    "/api/user/profile": {
+        "id": "user-123",
+        "name": "Test User",
+        "email": "test@example.com",
+        "role": "customer"
+    }
+}
+_MOCK_API_RESPONSES_JSON = json.dumps(_MOCK_API_RESPONSES)
+
+# Under pytest-xdist each worker (gw0, gw1, ...) gets its own Redis DB so
+# parallel runs never share or flush each other's keys
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+_REDIS_TEST_DB = 1 + int(_XDIST_WORKER[2:]) % 15
 
 
 @pytest.fixture(scope="session")
@@ -46,7 +81,7 @@ async def test_config():
         "redis": {
             "host": "localhost",
             "port": 6379,
-            "db": 1,
+            "db": _REDIS_TEST_DB,
             "decode_responses": True
         },
         "postgres": {
@@ -75,54 +110,101 @@ async def test_config():
     return config
 
 
-@pytest.fixture
-async def mock_redis():
-    """Mock Redis client"""
+def _build_mock_redis():
+    """Build a mock Redis client with async command stubs"""
     redis_mock = MagicMock()
     redis_mock.get = AsyncMock(return_value=None)
     redis_mock.set = AsyncMock(return_value=True)
     redis_mock.delete = AsyncMock(return_value=1)
     redis_mock.exists = AsyncMock(return_value=False)
     redis_mock.expire = AsyncMock(return_value=True)
+    redis_mock.ping = AsyncMock(return_value=True)
+    redis_mock.mget = AsyncMock(return_value=[None, None])
     return redis_mock
 
 
 @pytest.fixture
-async def mock_session_manager(mock_redis):
-    """Mock session manager with Redis"""
-    with patch('app.orchestration.session_manager.redis.from_url', return_value=mock_redis):
-        manager = SessionManager(redis_url="redis://localhost:6379/1")
-        await manager.initialize()
+async def mock_redis():
+    """Mock Redis client"""
+    return _build_mock_redis()
+
+
+@pytest.fixture(scope="module")
+async def shared_session_manager():
+    """Session manager over a mock Redis, constructed once per test module"""
+    with patch('app.orchestration.session_manager.redis.Redis', return_value=_build_mock_redis()):
+        manager = SessionManager({"host": "localhost", "port": 6379, "db": _REDIS_TEST_DB})
+        await manager.connect()
         return manager
 
 
 @pytest.fixture
-async def mock_eliza_provider():
-    """Mock Eliza LLM provider"""
-    provider = AsyncMock(spec=ElizaProvider)
+def fake_clock():
+    """Manually advanced clock for TTL tests"""
+    return FakeClock()
+
+
+@pytest.fixture
+def mock_session_manager(shared_session_manager):
+    """Mock session manager with Redis, reset to a clean state for each test"""
+    # Drop locally held state; the mock Redis keeps nothing between tests
+    shared_session_manager._session_expiry.clear()
+    return shared_session_manager
+
+
+@pytest.fixture(scope="module")
+def module_monkeypatch():
+    """Monkeypatch whose changes last for a whole test module"""
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+# Canned Eliza output is constant, so it is built once at import
+_MOCK_ELIZA_COMPLETION = {
+    "response": "This is a mock response from Eliza",
+    "message_id": "mock-msg-123",
+    "usage": {
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "total_tokens": 30
+    }
+}
+_MOCK_ELIZA_STREAM = tuple(
+    [{"content": chunk, "done": False} for chunk in ["This ", "is ", "a ", "streamed ", "response"]]
+    + [{"content": "", "done": True}]
+)
+
+
+def _configure_mock_eliza_provider(provider):
+    """Give a mock Eliza LLM provider its canned completion and stream output"""
     provider.connect = AsyncMock(return_value=True)
     provider.disconnect = AsyncMock(return_value=True)
-    provider.chat_completion = AsyncMock(return_value={
-        "response": "This is a mock response from Eliza",
-        "message_id": "mock-msg-123",
-        "usage": {
-            "prompt_tokens": 10,
-            "completion_tokens": 20,
-            "total_tokens": 30
-        }
-    })
+    provider.chat_completion = AsyncMock(return_value=_MOCK_ELIZA_COMPLETION)
     provider.stream_completion = AsyncMock()
 
     async def mock_stream():
-        chunks = ["This ", "is ", "a ", "streamed ", "response"]
-        for chunk in chunks:
-            yield {"content": chunk, "done": False}
-        yield {"content": "", "done": True}
+        for chunk in _MOCK_ELIZA_STREAM:
+            yield chunk
 
-    provider.stream_completion.return_value = mock_stream()
+    # A fresh generator per call lets one mock serve every test in a module
+    provider.stream_completion.side_effect = lambda *args, **kwargs: mock_stream()
     return provider
 
 
+@pytest.fixture(scope="module")
+def shared_eliza_provider():
+    """Mock Eliza LLM provider shared across a test module"""
+    return _configure_mock_eliza_provider(AsyncMock(spec=ElizaProvider))
+
+
+@pytest.fixture
+def mock_eliza_provider(shared_eliza_provider):
+    """Mock Eliza LLM provider reset to its canned behaviour for each test"""
+    # Also drop return values and side effects an earlier test configured
+    shared_eliza_provider.reset_mock(return_value=True, side_effect=True)
+    return _configure_mock_eliza_provider(shared_eliza_provider)
+
+
 @pytest.fixture
 async def mock_websocket_handler(mock_session_manager, mock_eliza_provider):
     """Mock WebSocket handler"""
@@ -139,22 +221,48 @@ async def test_client():
 
 
 @pytest.fixture
+async def async_ws_client():
+    """Open WebSocket sessions against the app on the test's own event loop"""
+    async with AsyncClient(transport=ASGIWebSocketTransport(app), base_url="http://test") as client:
+        def connect(path: str, **kwargs):
+            return aconnect_ws(path, client, **kwargs)
+
+        yield connect
+
+
+@pytest.fixture(scope="module")
 def sync_test_client():
-    """Create synchronous test client for WebSocket testing"""
+    """Create synchronous test client for WebSocket testing, shared across a module"""
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def sync_test_client_uvloop():
+    """Synchronous test client whose ASGI app runs on a uvloop event loop"""
+    pytest.importorskip("uvloop")
+    return TestClient(app, backend="asyncio", backend_options={"use_uvloop": True})
+
+
 @pytest.fixture
-async def mock_postgres_pool():
-    """Mock PostgreSQL connection pool"""
+def msgpack_ws_client(sync_test_client):
+    """WebSocket session on /ws/chat negotiated to the MessagePack subprotocol"""
+    with sync_test_client.websocket_connect("/ws/chat", subprotocols=["msgpack"]) as ws:
+        yield ws
+
+
+def _build_mock_postgres_pool():
+    """Build a mock asyncpg pool whose connections return canned rows"""
     pool = MagicMock()
 
-    # Mock connection
-    conn = AsyncMock()
-    conn.fetch = AsyncMock(return_value=[
+    # Mock connection; the catalog reads made on connect find no tables
+    rows = [
         {"id": 1, "name": "Test Case", "status": "open"},
         {"id": 2, "name": "Another Case", "status": "closed"}
-    ])
+    ]
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(
+        side_effect=lambda query, *args: [] if "information_schema" in query else rows
+    )
     conn.fetchrow = AsyncMock(return_value={"id": 1, "name": "Test Case"})
     conn.execute = AsyncMock(return_value="INSERT 0 1")
 
@@ -169,10 +277,41 @@ async def mock_postgres_pool():
     acquire_context.__aenter__ = AsyncMock(return_value=conn)
     acquire_context.__aexit__ = AsyncMock(return_value=None)
     pool.acquire = MagicMock(return_value=acquire_context)
+    pool.close = AsyncMock()
 
     return pool
 
 
+@pytest.fixture
+async def mock_postgres_pool():
+    """Mock PostgreSQL connection pool"""
+    return _build_mock_postgres_pool()
+
+
+@pytest.fixture(scope="session")
+def pg_config():
+    """Connection settings for the test PostgreSQL adapter"""
+    return {
+        "host": "localhost",
+        "port": 5432,
+        "db": "test_db",
+        "user": "test_user",
+        "password": "test_password"
+    }
+
+
+@pytest.fixture(scope="module")
+async def pg_adapter(pg_config):
+    """Connected PostgreSQL adapter over a mock pool, shared across a test module"""
+    from app.data_access.adapters.postgresql_adapter import PostgreSQLAdapter
+
+    with patch('asyncpg.create_pool', new=AsyncMock(return_value=_build_mock_postgres_pool())):
+        adapter = PostgreSQLAdapter(pg_config)
+        await adapter.connect()
+    yield adapter
+    await adapter.disconnect()
+
+
 @pytest.fixture
 def sample_messages():
     """Sample chat messages for testing"""
@@ -202,37 +341,57 @@ def sample_messages():
 @pytest.fixture
 def mock_api_responses():
     """Mock responses for REST API adapter testing"""
+    # Decoding the cached JSON is cheaper than deep-copying the dict graph
+    return json.loads(_MOCK_API_RESPONSES_JSON)
+
+
+@pytest.fixture(scope="session")
+def mock_api_response_bytes():
+    """Mock REST API responses pre-serialized to JSON bytes, keyed by path"""
     return {
-        "/api/cases": {
-            "cases": [
-                {"id": "12345", "title": "Account Issue", "status": "open"},
-                {"id": "67890", "title": "Payment Problem", "status": "resolved"}
-            ],
-            "total": 2
-        },
-        "/api/cases/12345": {
-            "id": "12345",
-            "title": "Account Issue",
-            "status": "open",
-            "description": "Customer unable to access account",
-            "priority": "high",
-            "assigned_to": "agent-001"
-        },
-        "/api/user/profile": {
-            "id": "user-123",
-            "name": "Test User",
-            "email": "test@example.com",
-            "role": "customer"
-        }
+        path: json.dumps(body).encode("utf-8")
+        for path, body in _MOCK_API_RESPONSES.items()
     }
 
 
+# Static mock payloads are read-only, so build them once per test session
+
+@pytest.fixture(scope="session")
+def postgres_cases():
+    """Mock PostgreSQL cases query result"""
+    return MockDataAdapterResponses.get_postgres_cases()
+
+
+@pytest.fixture(scope="session")
+def rest_case_details():
+    """Mock REST API case details"""
+    return MockDataAdapterResponses.get_rest_api_case_details()
+
+
+@pytest.fixture(scope="session")
+def oracle_transactions():
+    """Mock Oracle transaction data"""
+    return MockDataAdapterResponses.get_oracle_transaction_data()
+
+
+@pytest.fixture(scope="session")
+def soap_service_response():
+    """Mock SOAP service XML response"""
+    return MockDataAdapterResponses.get_soap_service_response()
+
+
+@pytest.fixture(scope="session")
+def session_with_history():
+    """Mock session with conversation history"""
+    return MockSessionData.get_session_with_history()
+
+
 @pytest.fixture
 async def cleanup_redis():
     """Cleanup Redis after tests"""
     yield
     try:
-        r = redis.Redis(host='localhost', port=6379, db=1)
+        r = redis.Redis(host='localhost', port=6379, db=_REDIS_TEST_DB)
         r.flushdb()
     except:
         pass  # Redis might not be available in test environment
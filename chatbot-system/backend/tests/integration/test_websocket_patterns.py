@@ -10,15 +10,45 @@ from app.session.session_manager import SessionManager
 from tests.mocks import MockLLMProvider
 
 
+# Batch frame for test_message_batching, serialized once at import
+_BATCH_PAYLOAD = json.dumps({
+    "type": "batch",
+    "messages": [
+        {"type": "message", "content": "Message 1", "metadata": {}},
+        {"type": "message", "content": "Message 2", "metadata": {}},
+        {"type": "message", "content": "Message 3", "metadata": {}}
+    ]
+})
+
+
 class MockWebSocketConnection:
     """Mock WebSocket with connection state tracking"""
 
-    def __init__(self):
-        self.messages_sent: List[Dict[str, Any]] = []
+    def __init__(self, raw_mode: bool = True):
+        """
+        Args:
+            raw_mode: If True, send_json logs the dict itself with no
+                serialization; if False, it logs a JSON round-tripped copy
+                so tests can check payloads survive the wire format
+        """
+        self.raw_mode = raw_mode
+        # Raw text frames are kept as-is and only decoded when a test reads messages_sent
+        self._sent: List[Any] = []
+        self._decoded_upto = 0
         self.is_connected = True
         self.close_code = None
         self.send_delay = 0  # Simulate network delay
 
+    @property
+    def messages_sent(self) -> List[Dict[str, Any]]:
+        """Sent messages, decoding any pending text frames on first access"""
+        sent = self._sent
+        for i in range(self._decoded_upto, len(sent)):
+            if isinstance(sent[i], str):
+                sent[i] = json.loads(sent[i])
+        self._decoded_upto = len(sent)
+        return sent
+
     async def send_text(self, message: str):
         """Mock send with delay"""
         if not self.is_connected:
@@ -27,7 +57,7 @@ class MockWebSocketConnection:
         if self.send_delay > 0:
             await asyncio.sleep(self.send_delay)
 
-        self.messages_sent.append(json.loads(message))
+        self._sent.append(message)
 
     async def send_json(self, data: Dict[str, Any]):
         """Mock send JSON"""
@@ -37,7 +67,7 @@ class MockWebSocketConnection:
         if self.send_delay > 0:
             await asyncio.sleep(self.send_delay)
 
-        self.messages_sent.append(data)
+        self._sent.append(data if self.raw_mode else json.loads(json.dumps(data)))
 
     async def close(self, code: int = 1000):
         """Mock close with code"""
@@ -45,16 +75,26 @@ class MockWebSocketConnection:
         self.close_code = code
 
     def clear_messages(self):
-        """Clear sent messages"""
-        self.messages_sent.clear()
+        """Clear sent messages and restore the initial connection state"""
+        self._sent.clear()
+        self._decoded_upto = 0
+        self.is_connected = True
+        self.close_code = None
+        self.send_delay = 0
 
 
-@pytest.fixture
-async def mock_ws():
-    """Create mock WebSocket connection"""
+@pytest.fixture(scope="module")
+def mock_ws():
+    """Create mock WebSocket connection shared across the module"""
     return MockWebSocketConnection()
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_ws(mock_ws):
+    """Reset the shared mock WebSocket before each test"""
+    mock_ws.clear_messages()
+
+
 @pytest.fixture
 async def session_mgr():
     """Create session manager"""
@@ -320,16 +360,7 @@ async def test_message_batching(mock_ws, session_mgr):
     handler = WebSocketHandler(mock_ws, "test-session", session_mgr)
 
     # Send batch of messages
-    batch_message = {
-        "type": "batch",
-        "messages": [
-            {"type": "message", "content": "Message 1", "metadata": {}},
-            {"type": "message", "content": "Message 2", "metadata": {}},
-            {"type": "message", "content": "Message 3", "metadata": {}}
-        ]
-    }
-
-    await handler.handle_message(json.dumps(batch_message))
+    await handler.handle_message(_BATCH_PAYLOAD)
     await asyncio.sleep(0.1)
 
     # Should handle batch efficiently (if implemented)
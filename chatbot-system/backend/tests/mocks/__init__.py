@@ -1,17 +1,29 @@
 """Mock objects for testing"""
 
 from .mock_llm import MockLLMProvider
+from .mock_clock import FakeClock
 from .mock_adapters import (
     MockPostgreSQLAdapter,
     MockOracleAdapter,
     MockRESTAdapter,
     MockSOAPAdapter
 )
+from .mock_responses import (
+    MockLLMResponses,
+    MockDataAdapterResponses,
+    MockSessionData,
+    MockWebSocketMessages
+)
 
 __all__ = [
     'MockLLMProvider',
+    'FakeClock',
     'MockPostgreSQLAdapter',
     'MockOracleAdapter',
     'MockRESTAdapter',
-    'MockSOAPAdapter'
+    'MockSOAPAdapter',
+    'MockLLMResponses',
+    'MockDataAdapterResponses',
+    'MockSessionData',
+    'MockWebSocketMessages'
 ]
@@ -1,14 +1,42 @@
 """Mock Data Adapters for testing"""
 from typing import List, Dict, Any, Optional
 from contextlib import asynccontextmanager
-from app.data_access.base_adapter import BaseAdapter
+from app.data_access.base_adapter import BaseDataAdapter
 
 
-class MockPostgreSQLAdapter(BaseAdapter):
+def _failing(message: str):
+    """
+    Build an async stand-in that always raises.
+
+    Failing mocks bind this over their real methods at construction, so the
+    happy path carries no per-call should_fail check.
+    """
+    async def _fail(*args, **kwargs):
+        raise Exception(message)
+    return _fail
+
+
+# Shared default SOAP envelope; built once instead of per MockSOAPAdapter instance
+_DEFAULT_SOAP_RESPONSE = """
+            <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+                <soap:Body>
+                    <GetCaseResponse>
+                        <Case>
+                            <Id>soap-1</Id>
+                            <Title>SOAP Case 1</Title>
+                            <Status>Active</Status>
+                        </Case>
+                    </GetCaseResponse>
+                </soap:Body>
+            </soap:Envelope>
+        """
+
+
+class MockPostgreSQLAdapter(BaseDataAdapter):
     """Mock PostgreSQL adapter for testing"""
 
     def __init__(self, responses: Optional[List[Dict]] = None, should_fail: bool = False):
-        super().__init__()
+        super().__init__({})
         self.responses = responses or [
             {"id": 1, "name": "Test Case", "status": "Open"},
             {"id": 2, "name": "Another Case", "status": "Closed"}
@@ -16,6 +44,11 @@ class MockPostgreSQLAdapter(BaseAdapter):
         self.should_fail = should_fail
         self.query_history = []
         self._is_connected = False
+        if should_fail:
+            self.query = _failing("Mock PostgreSQL query failure")
+            self.query_one = _failing("Mock PostgreSQL query_one failure")
+            self.execute = _failing("Mock PostgreSQL execute failure")
+            self.execute_many = _failing("Mock PostgreSQL execute_many failure")
 
     async def connect(self) -> bool:
         """Mock connection"""
@@ -28,35 +61,27 @@ class MockPostgreSQLAdapter(BaseAdapter):
         """Mock disconnection"""
         self._is_connected = False
 
+    async def health_check(self) -> bool:
+        """Mock health check"""
+        return not self.should_fail
+
     async def query(self, sql: str, *params) -> List[Dict[str, Any]]:
         """Mock query execution"""
-        if self.should_fail:
-            raise Exception("Mock PostgreSQL query failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return self.responses
 
     async def query_one(self, sql: str, *params) -> Optional[Dict[str, Any]]:
         """Mock single row query"""
-        if self.should_fail:
-            raise Exception("Mock PostgreSQL query_one failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return self.responses[0] if self.responses else None
 
     async def execute(self, sql: str, *params) -> int:
         """Mock execute"""
-        if self.should_fail:
-            raise Exception("Mock PostgreSQL execute failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return 1
 
     async def execute_many(self, sql: str, params_list: List[tuple]) -> int:
         """Mock execute many"""
-        if self.should_fail:
-            raise Exception("Mock PostgreSQL execute_many failure")
-
         self.query_history.append({"sql": sql, "params_list": params_list})
         return len(params_list)
 
@@ -74,11 +99,11 @@ class MockPostgreSQLAdapter(BaseAdapter):
         }
 
 
-class MockOracleAdapter(BaseAdapter):
+class MockOracleAdapter(BaseDataAdapter):
     """Mock Oracle adapter for testing"""
 
     def __init__(self, responses: Optional[List[Dict]] = None, should_fail: bool = False):
-        super().__init__()
+        super().__init__({})
         self.responses = responses or [
             {"CASE_ID": 101, "CASE_NAME": "Oracle Case", "STATUS": "PENDING"},
             {"CASE_ID": 102, "CASE_NAME": "Another Oracle Case", "STATUS": "RESOLVED"}
@@ -86,6 +111,10 @@ class MockOracleAdapter(BaseAdapter):
         self.should_fail = should_fail
         self.query_history = []
         self._is_connected = False
+        if should_fail:
+            self.query = _failing("Mock Oracle query failure")
+            self.query_one = _failing("Mock Oracle query_one failure")
+            self.execute = _failing("Mock Oracle execute failure")
 
     async def connect(self) -> bool:
         """Mock connection"""
@@ -98,27 +127,22 @@ class MockOracleAdapter(BaseAdapter):
         """Mock disconnection"""
         self._is_connected = False
 
+    async def health_check(self) -> bool:
+        """Mock health check"""
+        return not self.should_fail
+
     async def query(self, sql: str, *params) -> List[Dict[str, Any]]:
         """Mock query execution"""
-        if self.should_fail:
-            raise Exception("Mock Oracle query failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return self.responses
 
     async def query_one(self, sql: str, *params) -> Optional[Dict[str, Any]]:
         """Mock single row query"""
-        if self.should_fail:
-            raise Exception("Mock Oracle query_one failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return self.responses[0] if self.responses else None
 
     async def execute(self, sql: str, *params) -> int:
         """Mock execute"""
-        if self.should_fail:
-            raise Exception("Mock Oracle execute failure")
-
         self.query_history.append({"sql": sql, "params": params})
         return 1
 
@@ -131,11 +155,11 @@ class MockOracleAdapter(BaseAdapter):
         }
 
 
-class MockRESTAdapter(BaseAdapter):
+class MockRESTAdapter(BaseDataAdapter):
     """Mock REST API adapter for testing"""
 
     def __init__(self, responses: Optional[Dict] = None, should_fail: bool = False):
-        super().__init__()
+        super().__init__({})
         self.responses = responses or {
             "cases": [
                 {"id": "rest-1", "title": "REST Case 1", "priority": "High"},
@@ -145,6 +169,9 @@ class MockRESTAdapter(BaseAdapter):
         self.should_fail = should_fail
         self.request_history = []
         self._is_connected = False
+        if should_fail:
+            self.get = _failing("Mock REST GET failure")
+            self.post = _failing("Mock REST POST failure")
 
     async def connect(self) -> bool:
         """Mock connection"""
@@ -157,11 +184,12 @@ class MockRESTAdapter(BaseAdapter):
         """Mock disconnection"""
         self._is_connected = False
 
+    async def health_check(self) -> bool:
+        """Mock health check"""
+        return not self.should_fail
+
     async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Mock GET request"""
-        if self.should_fail:
-            raise Exception("Mock REST GET failure")
-
         self.request_history.append({
             "method": "GET",
             "endpoint": endpoint,
@@ -171,9 +199,6 @@ class MockRESTAdapter(BaseAdapter):
 
     async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Mock POST request"""
-        if self.should_fail:
-            raise Exception("Mock REST POST failure")
-
         self.request_history.append({
             "method": "POST",
             "endpoint": endpoint,
@@ -181,6 +206,12 @@ class MockRESTAdapter(BaseAdapter):
         })
         return {"status": "success", "id": "new-rest-item"}
 
+    async def execute(self, operation: str, **kwargs) -> Dict[str, Any]:
+        """Mock generic request; operation is the HTTP method"""
+        if operation.upper() == "POST":
+            return await self.post(kwargs.get("endpoint", ""), kwargs.get("data") or {})
+        return await self.get(kwargs.get("endpoint", ""), kwargs.get("params"))
+
     def get_connection_info(self) -> Dict[str, Any]:
         """Get mock connection info"""
         return {
@@ -190,27 +221,17 @@ class MockRESTAdapter(BaseAdapter):
         }
 
 
-class MockSOAPAdapter(BaseAdapter):
+class MockSOAPAdapter(BaseDataAdapter):
     """Mock SOAP adapter for testing"""
 
     def __init__(self, responses: Optional[str] = None, should_fail: bool = False):
-        super().__init__()
-        self.responses = responses or """
-            <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
-                <soap:Body>
-                    <GetCaseResponse>
-                        <Case>
-                            <Id>soap-1</Id>
-                            <Title>SOAP Case 1</Title>
-                            <Status>Active</Status>
-                        </Case>
-                    </GetCaseResponse>
-                </soap:Body>
-            </soap:Envelope>
-        """
+        super().__init__({})
+        self.responses = responses or _DEFAULT_SOAP_RESPONSE
         self.should_fail = should_fail
         self.request_history = []
         self._is_connected = False
+        if should_fail:
+            self.call_operation = _failing("Mock SOAP call failure")
 
     async def connect(self) -> bool:
         """Mock connection"""
@@ -223,21 +244,26 @@ class MockSOAPAdapter(BaseAdapter):
         """Mock disconnection"""
         self._is_connected = False
 
+    async def health_check(self) -> bool:
+        """Mock health check"""
+        return not self.should_fail
+
     async def call_operation(
         self,
         operation: str,
         parameters: Optional[Dict] = None
     ) -> str:
         """Mock SOAP operation call"""
-        if self.should_fail:
-            raise Exception("Mock SOAP call failure")
-
         self.request_history.append({
             "operation": operation,
             "parameters": parameters
         })
         return self.responses
 
+    async def execute(self, operation: str, **kwargs) -> str:
+        """Mock generic operation call"""
+        return await self.call_operation(operation, kwargs.get("parameters"))
+
     def get_connection_info(self) -> Dict[str, Any]:
         """Get mock connection info"""
         return {
@@ -0,0 +1,21 @@
+"""Mock clock for testing time-dependent code without sleeping"""
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic"""
+
+    def __init__(self, now: float = 0.0):
+        """
+        Initialize fake clock
+
+        Args:
+            now: Starting time in seconds
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        """Move the clock forward"""
+        self.now += seconds
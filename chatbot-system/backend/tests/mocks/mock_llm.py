@@ -3,6 +3,9 @@ from typing import List, Dict, Any, Optional, AsyncGenerator
 from app.llm.base_provider import BaseLLMProvider
 
 
+_MESSAGE_ID_PREFIX = "mock-"
+
+
 class MockLLMProvider(BaseLLMProvider):
     """Mock LLM provider for testing"""
 
@@ -21,6 +24,14 @@ class MockLLMProvider(BaseLLMProvider):
         super().__init__()
         self.responses = responses or ["This is a mock response"]
         self.should_fail = should_fail
+        # Split each response into streamed words once instead of per call
+        self._stream_words = [
+            tuple(word + " " for word in response.split())
+            for response in self.responses
+        ]
+        if should_fail:
+            self.chat_completion = self._fail_chat_completion
+            self.stream_completion = self._fail_stream_completion
         self.call_count = 0
         self.last_messages = None
         self._is_connected = False
@@ -55,9 +66,6 @@ class MockLLMProvider(BaseLLMProvider):
         Returns:
             Mock response dictionary
         """
-        if self.should_fail:
-            raise Exception("Mock LLM failure")
-
         self.last_messages = messages
         response_idx = self.call_count % len(self.responses)
         response_text = self.responses[response_idx]
@@ -73,7 +81,7 @@ class MockLLMProvider(BaseLLMProvider):
                 "total_tokens": 30
             },
             "model": "mock-model",
-            "message_id": f"mock-{self.call_count}"
+            "message_id": _MESSAGE_ID_PREFIX + str(self.call_count)
         }
 
     async def stream_completion(
@@ -95,28 +103,27 @@ class MockLLMProvider(BaseLLMProvider):
         Yields:
             Mock response chunks
         """
-        if self.should_fail:
-            raise Exception("Mock LLM streaming failure")
-
         self.last_messages = messages
         response_idx = self.call_count % len(self.responses)
-        response_text = self.responses[response_idx]
         self.call_count += 1
 
-        # Stream response word by word
-        words = response_text.split()
-        for word in words:
-            yield {
-                "content": word + " ",
-                "done": False
-            }
-
-        # Final chunk
-        yield {
-            "content": "",
-            "done": True,
-            "finish_reason": "stop"
-        }
+        # Stream response word by word; every chunk is a new dict, so a
+        # consumer that edits one can't change later streams
+        for word in self._stream_words[response_idx]:
+            yield {"content": word, "done": False}
+
+        yield {"content": "", "done": True, "finish_reason": "stop"}
+
+    async def _fail_chat_completion(self, *args, **kwargs) -> Dict[str, Any]:
+        """Failing chat completion, bound in place of chat_completion"""
+        raise Exception("Mock LLM failure")
+
+    async def _fail_stream_completion(
+        self, *args, **kwargs
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Failing streaming completion, bound in place of stream_completion"""
+        raise Exception("Mock LLM streaming failure")
+        yield  # Makes this an async generator like stream_completion
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get mock model info"""
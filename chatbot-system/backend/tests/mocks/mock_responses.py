@@ -1,84 +1,323 @@
 """
 Mock response generators for testing
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+from xml.etree import ElementTree as ET
+import copy
+import itertools
 import json
 from datetime import datetime
 
 
+# Source payloads, built once at import; accessors return a deep copy so a
+# test that edits its payload never leaks the change into another test
+_CASE_STATUS_RESPONSE = {
+    "response": "Case #12345 is currently in 'Open' status. It was created on January 10, 2024, "
+               "and is assigned to Agent Sarah Johnson. The priority level is High, and the last "
+               "update was made 2 hours ago regarding customer account verification.",
+    "message_id": "llm-msg-001",
+    "usage": {
+        "prompt_tokens": 45,
+        "completion_tokens": 52,
+        "total_tokens": 97
+    },
+    "metadata": {
+        "model": "eliza-v1",
+        "temperature": 0.7,
+        "finish_reason": "stop"
+    }
+}
+
+_LIST_CASES_RESPONSE = {
+    "response": "I found 5 open cases:\n\n"
+               "1. Case #12345 - Account Access Issue (High Priority)\n"
+               "2. Case #12346 - Payment Processing Error (Medium Priority)\n"
+               "3. Case #12347 - Data Sync Problem (Low Priority)\n"
+               "4. Case #12348 - Login Failure (High Priority)\n"
+               "5. Case #12349 - Report Generation Bug (Medium Priority)\n\n"
+               "Would you like details on any specific case?",
+    "message_id": "llm-msg-002",
+    "usage": {
+        "prompt_tokens": 38,
+        "completion_tokens": 89,
+        "total_tokens": 127
+    }
+}
+
+_POSTGRES_CASES = [
+    {
+        "id": 12345,
+        "title": "Account Access Issue",
+        "status": "open",
+        "priority": "high",
+        "assigned_to": "agent-sarah-johnson",
+        "created_at": "2024-01-10T09:30:00Z",
+        "updated_at": "2024-01-15T14:22:00Z",
+        "customer_id": "cust-001",
+        "description": "Customer unable to access account after password reset"
+    },
+    {
+        "id": 12346,
+        "title": "Payment Processing Error",
+        "status": "open",
+        "priority": "medium",
+        "assigned_to": "agent-mike-chen",
+        "created_at": "2024-01-12T11:15:00Z",
+        "updated_at": "2024-01-15T10:45:00Z",
+        "customer_id": "cust-002",
+        "description": "Transaction failing with error code E402"
+    },
+    {
+        "id": 12347,
+        "title": "Data Sync Problem",
+        "status": "open",
+        "priority": "low",
+        "assigned_to": "agent-emma-davis",
+        "created_at": "2024-01-13T08:00:00Z",
+        "updated_at": "2024-01-14T16:30:00Z",
+        "customer_id": "cust-003",
+        "description": "Customer data not syncing across mobile and web"
+    }
+]
+
+# Case timeline stored column-wise; column scans read a tuple directly and
+# the record form used by the REST payload is rebuilt from it
+_TIMELINE_SOA = {
+    "timestamp": (
+        "2024-01-10T09:30:00Z",
+        "2024-01-10T10:15:00Z",
+        "2024-01-15T14:22:00Z"
+    ),
+    "event": ("case_created", "assigned", "status_update"),
+    "actor": ("system", "supervisor-001", "agent-sarah-johnson"),
+    "details": (
+        "Case automatically created from support ticket",
+        "Assigned to Agent Sarah Johnson",
+        "Waiting for customer verification"
+    )
+}
+
+
+def _timeline_records() -> List[Dict[str, Any]]:
+    """Rebuild the timeline as a list of per-event dicts"""
+    keys = tuple(_TIMELINE_SOA)
+    return [dict(zip(keys, row)) for row in zip(*_TIMELINE_SOA.values())]
+
+
+_REST_CASE_DETAILS = {
+    "case": {
+        "id": "12345",
+        "title": "Account Access Issue",
+        "status": "open",
+        "priority": "high",
+        "customer": {
+            "id": "cust-001",
+            "name": "John Doe",
+            "email": "john.doe@example.com",
+            "phone": "+1-555-0123"
+        },
+        "timeline": _timeline_records(),
+        "attachments": [
+            {
+                "id": "att-001",
+                "filename": "screenshot.png",
+                "type": "image/png",
+                "size": 245680,
+                "url": "/api/attachments/att-001"
+            }
+        ]
+    }
+}
+
+_ORACLE_TRANSACTIONS = [
+    {
+        "transaction_id": "TXN-2024-001",
+        "case_id": 12345,
+        "amount": 1500.00,
+        "currency": "USD",
+        "status": "failed",
+        "error_code": "E402",
+        "timestamp": "2024-01-15T12:30:00Z",
+        "payment_method": "credit_card",
+        "card_last_four": "4532"
+    },
+    {
+        "transaction_id": "TXN-2024-002",
+        "case_id": 12345,
+        "amount": 1500.00,
+        "currency": "USD",
+        "status": "pending_retry",
+        "error_code": None,
+        "timestamp": "2024-01-15T13:00:00Z",
+        "payment_method": "credit_card",
+        "card_last_four": "4532"
+    }
+]
+
+_SOAP_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+    <soap:Body>
+        <GetCaseResponse xmlns="http://example.com/case-service">
+            <Case>
+                <CaseId>12345</CaseId>
+                <Title>Account Access Issue</Title>
+                <Status>Open</Status>
+                <Priority>High</Priority>
+                <CreatedDate>2024-01-10T09:30:00Z</CreatedDate>
+                <AssignedAgent>
+                    <AgentId>agent-sarah-johnson</AgentId>
+                    <Name>Sarah Johnson</Name>
+                    <Email>sarah.johnson@example.com</Email>
+                </AssignedAgent>
+            </Case>
+        </GetCaseResponse>
+    </soap:Body>
+</soap:Envelope>"""
+
+_SESSION_WITH_HISTORY = {
+    "session_id": "sess-test-001",
+    "created_at": "2024-01-15T10:00:00Z",
+    "updated_at": "2024-01-15T10:15:00Z",
+    "user_context": {
+        "user_id": "user-123",
+        "role": "customer_service",
+        "permissions": ["view_cases", "update_cases"]
+    },
+    "conversation_history": [
+        {
+            "role": "user",
+            "content": "Show me case #12345",
+            "timestamp": "2024-01-15T10:00:00Z",
+            "message_id": "msg-001"
+        },
+        {
+            "role": "assistant",
+            "content": "Case #12345 is an Account Access Issue with high priority...",
+            "timestamp": "2024-01-15T10:00:05Z",
+            "message_id": "msg-002"
+        },
+        {
+            "role": "user",
+            "content": "What's the latest update?",
+            "timestamp": "2024-01-15T10:15:00Z",
+            "message_id": "msg-003"
+        }
+    ],
+    "metadata": {
+        "message_count": 3,
+        "last_activity": "2024-01-15T10:15:00Z"
+    }
+}
+
+_STREAM_CHUNKS = (
+    "Based ",
+    "on ",
+    "the ",
+    "database ",
+    "query, ",
+    "I ",
+    "can ",
+    "see ",
+    "that ",
+    "case ",
+    "#12345 ",
+    "has ",
+    "the ",
+    "following ",
+    "details:\n\n",
+    "- Status: Open\n",
+    "- Priority: High\n",
+    "- Assigned: Agent Sarah\n",
+    "- Created: Jan 10, 2024\n\n",
+    "The ",
+    "customer ",
+    "is ",
+    "waiting ",
+    "for ",
+    "account ",
+    "verification."
+)
+
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationMessage:
+    """Single message in a mock session's conversation history"""
+    role: str
+    content: str
+    timestamp: str
+    message_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class SessionFixture:
+    """Attribute-access mirror of the mock session with history"""
+    session_id: str
+    created_at: str
+    updated_at: str
+    user_context: Mapping[str, Any]
+    conversation_history: Tuple[ConversationMessage, ...]
+    metadata: Mapping[str, Any]
+
+
+def _build_session_fixture() -> SessionFixture:
+    """Build the frozen dataclass mirror of the mock session with history"""
+    session = copy.deepcopy(_SESSION_WITH_HISTORY)
+    return SessionFixture(
+        session_id=session["session_id"],
+        created_at=session["created_at"],
+        updated_at=session["updated_at"],
+        user_context=session["user_context"],
+        conversation_history=tuple(
+            ConversationMessage(**message)
+            for message in session["conversation_history"]
+        ),
+        metadata=session["metadata"]
+    )
+
+
+# Derived payloads (wire bytes, parsed XML, SSE frames), built once at import
+_CASE_STATUS_BYTES = json.dumps(_CASE_STATUS_RESPONSE).encode("utf-8")
+_SOAP_TREE = ET.fromstring(_SOAP_XML.encode("utf-8"))
+_ENCODED_STREAM_CHUNKS = tuple(
+    f"data: {chunk}\n\n".encode("utf-8") for chunk in _STREAM_CHUNKS
+)
+
+
 class MockLLMResponses:
     """Mock responses for LLM provider testing"""
 
     @staticmethod
     def get_case_status_response() -> Dict[str, Any]:
         """Mock response for case status query"""
-        return {
-            "response": "Case #12345 is currently in 'Open' status. It was created on January 10, 2024, "
-                       "and is assigned to Agent Sarah Johnson. The priority level is High, and the last "
-                       "update was made 2 hours ago regarding customer account verification.",
-            "message_id": "llm-msg-001",
-            "usage": {
-                "prompt_tokens": 45,
-                "completion_tokens": 52,
-                "total_tokens": 97
-            },
-            "metadata": {
-                "model": "eliza-v1",
-                "temperature": 0.7,
-                "finish_reason": "stop"
-            }
-        }
+        return copy.deepcopy(_CASE_STATUS_RESPONSE)
+
+    @staticmethod
+    def get_case_status_response_bytes() -> bytes:
+        """Case status response pre-serialized to JSON bytes"""
+        return _CASE_STATUS_BYTES
 
     @staticmethod
     def get_list_cases_response() -> Dict[str, Any]:
         """Mock response for listing cases"""
-        return {
-            "response": "I found 5 open cases:\n\n"
-                       "1. Case #12345 - Account Access Issue (High Priority)\n"
-                       "2. Case #12346 - Payment Processing Error (Medium Priority)\n"
-                       "3. Case #12347 - Data Sync Problem (Low Priority)\n"
-                       "4. Case #12348 - Login Failure (High Priority)\n"
-                       "5. Case #12349 - Report Generation Bug (Medium Priority)\n\n"
-                       "Would you like details on any specific case?",
-            "message_id": "llm-msg-002",
-            "usage": {
-                "prompt_tokens": 38,
-                "completion_tokens": 89,
-                "total_tokens": 127
-            }
-        }
+        return copy.deepcopy(_LIST_CASES_RESPONSE)
 
     @staticmethod
-    def get_streaming_chunks() -> List[str]:
+    def get_streaming_chunks() -> Tuple[str, ...]:
         """Mock streaming response chunks"""
-        return [
-            "Based ",
-            "on ",
-            "the ",
-            "database ",
-            "query, ",
-            "I ",
-            "can ",
-            "see ",
-            "that ",
-            "case ",
-            "#12345 ",
-            "has ",
-            "the ",
-            "following ",
-            "details:\n\n",
-            "- Status: Open\n",
-            "- Priority: High\n",
-            "- Assigned: Agent Sarah\n",
-            "- Created: Jan 10, 2024\n\n",
-            "The ",
-            "customer ",
-            "is ",
-            "waiting ",
-            "for ",
-            "account ",
-            "verification."
-        ]
+        return _STREAM_CHUNKS
+
+    @staticmethod
+    def iter_streaming_chunks() -> Iterator[str]:
+        """Iterate the mock streaming response chunks"""
+        yield from _STREAM_CHUNKS
+
+    @staticmethod
+    async def iter_stream_bytes() -> AsyncIterator[bytes]:
+        """Stream the mock chunks as pre-encoded SSE data frames"""
+        for frame in _ENCODED_STREAM_CHUNKS:
+            yield frame
 
     @staticmethod
     def get_error_response() -> Dict[str, Any]:
@@ -96,139 +335,37 @@ class MockDataAdapterResponses:
     @staticmethod
     def get_postgres_cases() -> List[Dict[str, Any]]:
         """Mock PostgreSQL cases query result"""
-        return [
-            {
-                "id": 12345,
-                "title": "Account Access Issue",
-                "status": "open",
-                "priority": "high",
-                "assigned_to": "agent-sarah-johnson",
-                "created_at": "2024-01-10T09:30:00Z",
-                "updated_at": "2024-01-15T14:22:00Z",
-                "customer_id": "cust-001",
-                "description": "Customer unable to access account after password reset"
-            },
-            {
-                "id": 12346,
-                "title": "Payment Processing Error",
-                "status": "open",
-                "priority": "medium",
-                "assigned_to": "agent-mike-chen",
-                "created_at": "2024-01-12T11:15:00Z",
-                "updated_at": "2024-01-15T10:45:00Z",
-                "customer_id": "cust-002",
-                "description": "Transaction failing with error code E402"
-            },
-            {
-                "id": 12347,
-                "title": "Data Sync Problem",
-                "status": "open",
-                "priority": "low",
-                "assigned_to": "agent-emma-davis",
-                "created_at": "2024-01-13T08:00:00Z",
-                "updated_at": "2024-01-14T16:30:00Z",
-                "customer_id": "cust-003",
-                "description": "Customer data not syncing across mobile and web"
-            }
-        ]
+        return copy.deepcopy(_POSTGRES_CASES)
 
     @staticmethod
     def get_rest_api_case_details() -> Dict[str, Any]:
         """Mock REST API case details"""
-        return {
-            "case": {
-                "id": "12345",
-                "title": "Account Access Issue",
-                "status": "open",
-                "priority": "high",
-                "customer": {
-                    "id": "cust-001",
-                    "name": "John Doe",
-                    "email": "john.doe@example.com",
-                    "phone": "+1-555-0123"
-                },
-                "timeline": [
-                    {
-                        "timestamp": "2024-01-10T09:30:00Z",
-                        "event": "case_created",
-                        "actor": "system",
-                        "details": "Case automatically created from support ticket"
-                    },
-                    {
-                        "timestamp": "2024-01-10T10:15:00Z",
-                        "event": "assigned",
-                        "actor": "supervisor-001",
-                        "details": "Assigned to Agent Sarah Johnson"
-                    },
-                    {
-                        "timestamp": "2024-01-15T14:22:00Z",
-                        "event": "status_update",
-                        "actor": "agent-sarah-johnson",
-                        "details": "Waiting for customer verification"
-                    }
-                ],
-                "attachments": [
-                    {
-                        "id": "att-001",
-                        "filename": "screenshot.png",
-                        "type": "image/png",
-                        "size": 245680,
-                        "url": "/api/attachments/att-001"
-                    }
-                ]
-            }
-        }
+        return copy.deepcopy(_REST_CASE_DETAILS)
+
+    @staticmethod
+    def get_timeline_column(field: str) -> Tuple[str, ...]:
+        """One column (timestamp, event, actor or details) of the case timeline"""
+        return _TIMELINE_SOA[field]
+
+    @staticmethod
+    def get_timeline_timestamps() -> Tuple[str, ...]:
+        """Timestamps of every event in the case timeline"""
+        return _TIMELINE_SOA["timestamp"]
 
     @staticmethod
     def get_oracle_transaction_data() -> List[Dict[str, Any]]:
         """Mock Oracle database transaction data"""
-        return [
-            {
-                "transaction_id": "TXN-2024-001",
-                "case_id": 12345,
-                "amount": 1500.00,
-                "currency": "USD",
-                "status": "failed",
-                "error_code": "E402",
-                "timestamp": "2024-01-15T12:30:00Z",
-                "payment_method": "credit_card",
-                "card_last_four": "4532"
-            },
-            {
-                "transaction_id": "TXN-2024-002",
-                "case_id": 12345,
-                "amount": 1500.00,
-                "currency": "USD",
-                "status": "pending_retry",
-                "error_code": None,
-                "timestamp": "2024-01-15T13:00:00Z",
-                "payment_method": "credit_card",
-                "card_last_four": "4532"
-            }
-        ]
+        return copy.deepcopy(_ORACLE_TRANSACTIONS)
 
     @staticmethod
     def get_soap_service_response() -> str:
         """Mock SOAP service XML response"""
-        return """<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
-    <soap:Body>
-        <GetCaseResponse xmlns="http://example.com/case-service">
-            <Case>
-                <CaseId>12345</CaseId>
-                <Title>Account Access Issue</Title>
-                <Status>Open</Status>
-                <Priority>High</Priority>
-                <CreatedDate>2024-01-10T09:30:00Z</CreatedDate>
-                <AssignedAgent>
-                    <AgentId>agent-sarah-johnson</AgentId>
-                    <Name>Sarah Johnson</Name>
-                    <Email>sarah.johnson@example.com</Email>
-                </AssignedAgent>
-            </Case>
-        </GetCaseResponse>
-    </soap:Body>
-</soap:Envelope>"""
+        return _SOAP_XML
+
+    @staticmethod
+    def get_soap_service_etree() -> ET.Element:
+        """Parsed copy of the mock SOAP service response"""
+        return copy.deepcopy(_SOAP_TREE)
 
 
 class MockSessionData:
@@ -237,40 +374,12 @@ class MockSessionData:
     @staticmethod
     def get_session_with_history() -> Dict[str, Any]:
         """Mock session with conversation history"""
-        return {
-            "session_id": "sess-test-001",
-            "created_at": "2024-01-15T10:00:00Z",
-            "updated_at": "2024-01-15T10:15:00Z",
-            "user_context": {
-                "user_id": "user-123",
-                "role": "customer_service",
-                "permissions": ["view_cases", "update_cases"]
-            },
-            "conversation_history": [
-                {
-                    "role": "user",
-                    "content": "Show me case #12345",
-                    "timestamp": "2024-01-15T10:00:00Z",
-                    "message_id": "msg-001"
-                },
-                {
-                    "role": "assistant",
-                    "content": "Case #12345 is an Account Access Issue with high priority...",
-                    "timestamp": "2024-01-15T10:00:05Z",
-                    "message_id": "msg-002"
-                },
-                {
-                    "role": "user",
-                    "content": "What's the latest update?",
-                    "timestamp": "2024-01-15T10:15:00Z",
-                    "message_id": "msg-003"
-                }
-            ],
-            "metadata": {
-                "message_count": 3,
-                "last_activity": "2024-01-15T10:15:00Z"
-            }
-        }
+        return copy.deepcopy(_SESSION_WITH_HISTORY)
+
+    @staticmethod
+    def get_session_fixture() -> "SessionFixture":
+        """Mock session with history as a frozen dataclass"""
+        return _build_session_fixture()
 
     @staticmethod
     def get_empty_session() -> Dict[str, Any]:
@@ -288,67 +397,99 @@ class MockSessionData:
         }
 
 
+_utcnow = datetime.utcnow
+# Process-unique action message ids
+_action_seq = itertools.count()
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in the ISO-8601 'Z' form used by mock messages"""
+    return f"{_utcnow().isoformat()}Z"
+
+
 class MockWebSocketMessages:
-    """Mock WebSocket message formats"""
+    """
+    Mock WebSocket message formats
+
+    Every builder accepts an optional timestamp; tests emitting a burst of
+    messages can compute one with utc_timestamp() and pass it to each call
+    instead of reading the clock per message.
+    """
 
     @staticmethod
-    def get_connection_message(session_id: str) -> Dict[str, Any]:
+    def get_connection_message(session_id: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Mock connection established message"""
         return {
             "type": "connection",
             "status": "connected",
             "session_id": session_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": timestamp or utc_timestamp()
         }
 
     @staticmethod
-    def get_chat_message(content: str, message_id: str) -> Dict[str, Any]:
+    def get_chat_message(content: str, message_id: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Mock chat message from user"""
         return {
             "type": "chat",
             "content": content,
             "message_id": message_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": timestamp or utc_timestamp()
         }
 
     @staticmethod
-    def get_response_message(content: str, message_id: str) -> Dict[str, Any]:
+    def get_response_message(
+        content: str,
+        message_id: str,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Mock response message from assistant"""
         return {
             "type": "message",
             "content": content,
             "role": "assistant",
             "message_id": message_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": timestamp or utc_timestamp()
         }
 
     @staticmethod
-    def get_stream_chunk(content: str, done: bool = False) -> Dict[str, Any]:
+    def get_stream_chunk(
+        content: str,
+        done: bool = False,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Mock streaming chunk"""
         return {
             "type": "stream_chunk",
             "content": content,
             "done": done,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": timestamp or utc_timestamp()
         }
 
     @staticmethod
-    def get_action_message(action: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_action_message(
+        action: str,
+        data: Dict[str, Any],
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Mock action message"""
         return {
             "type": "action",
             "action": action,
             "data": data,
-            "message_id": f"action-{datetime.utcnow().timestamp()}",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "message_id": f"action-{next(_action_seq)}",
+            "timestamp": timestamp or utc_timestamp()
         }
 
     @staticmethod
-    def get_error_message(error: str, details: str = None) -> Dict[str, Any]:
+    def get_error_message(
+        error: str,
+        details: str = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Mock error message"""
         return {
             "type": "error",
             "error": error,
             "message": details or "An error occurred",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": timestamp or utc_timestamp()
         }
@@ -1,340 +1,328 @@
 """
 Data Adapter Integration Tests
 """
+import base64
 import pytest
+import asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
 import httpx
 import json
+from tenacity import wait_none
 
-from app.data.rest_adapter import RESTAPIAdapter
-from app.data.postgres_adapter import PostgreSQLAdapter
+from app.data_access.adapters.rest_adapter import RESTAdapter
+from app.data_access.adapters.postgresql_adapter import PostgreSQLAdapter
 from tests.mocks import MockDataAdapterResponses
 
 
-class TestRESTAPIAdapter:
-    """Test REST API data adapter"""
+# SQL shared across the PostgreSQL tests
+_Q_CASES_BY_STATUS = "SELECT * FROM cases WHERE status = :status"
+_Q_CASE_BY_ID = "SELECT * FROM cases WHERE id = :id"
+_Q_CASES_BY_NAME = "SELECT * FROM cases WHERE name = :name"
+_Q_ALL_CASES = "SELECT * FROM cases"
+_Q_INSERT_CASE = "INSERT INTO cases (name) VALUES ($1)"
 
-    @pytest.mark.asyncio
-    async def test_get_request(self, mock_api_responses):
-        """Test GET request to REST API"""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.return_value = httpx.Response(
-                200,
-                json=mock_api_responses["/api/cases"]
-            )
+# httpx.Response(json=...) re-serializes on every construction; feed bytes instead
+_JSON_HEADERS = {"content-type": "application/json"}
+_CASES_BYTES = json.dumps({
+    "cases": [
+        {"id": "12345", "title": "Account Issue", "status": "open"},
+        {"id": "67890", "title": "Payment Problem", "status": "resolved"}
+    ],
+    "total": 2
+}).encode("utf-8")
+_CREATED_BYTES = json.dumps({"id": "12350", "status": "created"}).encode("utf-8")
+_NOT_FOUND_BYTES = json.dumps({"error": "Not Found"}).encode("utf-8")
 
-            adapter = RESTAPIAdapter(base_url="http://api.example.com")
-            result = await adapter.get("/api/cases")
+# Canned responses built once and reused; their bytes content is re-readable
+_RESP_CASES = httpx.Response(200, content=_CASES_BYTES, headers=_JSON_HEADERS)
+_RESP_CREATED = httpx.Response(201, content=_CREATED_BYTES, headers=_JSON_HEADERS)
+_RESP_NOT_FOUND = httpx.Response(404, content=_NOT_FOUND_BYTES, headers=_JSON_HEADERS)
+_RESP_EMPTY = httpx.Response(200, json={})
+_RESP_SUCCESS = httpx.Response(200, json={"success": True})
+
+_API_CONFIG = {"base_url": "http://api.example.com"}
+
+
+def _mock_client(handler):
+    """HTTP client whose requests are answered by handler instead of the network"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
-            assert result is not None
-            assert "cases" in result
-            assert len(result["cases"]) == 2
+
+@pytest.fixture
+async def mock_api_client(mock_api_response_bytes):
+    """HTTP client that answers requests with the canned mock API payloads"""
+    def route(request):
+        return httpx.Response(
+            200, content=mock_api_response_bytes[request.url.path], headers=_JSON_HEADERS
+        )
+
+    async with _mock_client(route) as client:
+        yield client
+
+
+class TestRESTAPIAdapter:
+    """Test REST API data adapter"""
 
     @pytest.mark.asyncio
-    async def test_post_request(self):
-        """Test POST request to REST API"""
-        with patch('httpx.AsyncClient.post') as mock_post:
-            mock_post.return_value = httpx.Response(
-                201,
-                json={"id": "12350", "status": "created"}
-            )
+    @pytest.mark.parametrize("method,path,kwargs,response,expected", [
+        pytest.param(
+            "get", "/api/cases", {}, _RESP_CASES, json.loads(_CASES_BYTES),
+            id="get"
+        ),
+        pytest.param(
+            "post", "/api/cases", {"json_data": {"title": "New Case", "priority": "high"}},
+            _RESP_CREATED, {"id": "12350", "status": "created"},
+            id="post"
+        ),
+        pytest.param(
+            "get", "/api/invalid", {}, _RESP_NOT_FOUND,
+            {"error": True, "status_code": 404, "message": _NOT_FOUND_BYTES.decode("utf-8")},
+            id="error"
+        ),
+    ])
+    async def test_request(self, method, path, kwargs, response, expected):
+        """Test GET/POST requests and error handling against the REST API"""
+        requests = []
+
+        def respond(request):
+            requests.append(request)
+            return response
+
+        async with _mock_client(respond) as client:
+            adapter = RESTAdapter(_API_CONFIG, client=client)
+            result = await getattr(adapter, method)(path, **kwargs)
+
+        assert result == expected
+        request, = requests
+        assert request.method == method.upper()
+        assert request.url.path == path
+        if "json_data" in kwargs:
+            assert json.loads(request.content) == kwargs["json_data"]
 
-            adapter = RESTAPIAdapter(base_url="http://api.example.com")
-            result = await adapter.post(
-                "/api/cases",
-                data={"title": "New Case", "priority": "high"}
-            )
+    @pytest.mark.asyncio
+    async def test_retry_logic(self, monkeypatch):
+        """Test retry logic for transient failures"""
+        # Retry straight away instead of backing off
+        monkeypatch.setattr(RESTAdapter.execute.retry, "wait", wait_none())
+
+        # First call fails to connect, second succeeds
+        responses = iter([httpx.ConnectError("Connection refused"), _RESP_SUCCESS])
+        calls = []
+
+        def respond(request):
+            calls.append(request)
+            result = next(responses)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        async with _mock_client(respond) as client:
+            adapter = RESTAdapter(_API_CONFIG, client=client)
+            result = await adapter.get("/api/cases")
 
-            assert result["status"] == "created"
-            assert "id" in result
+        assert result["success"] is True
+        assert len(calls) == 2
 
     @pytest.mark.asyncio
     async def test_authentication_headers(self):
         """Test API authentication header injection"""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.return_value = httpx.Response(200, json={})
+        requests = []
+
+        def respond(request):
+            requests.append(request)
+            return _RESP_EMPTY
 
-            adapter = RESTAPIAdapter(
-                base_url="http://api.example.com",
-                auth_token="Bearer test-token-123"
+        async with _mock_client(respond) as client:
+            adapter = RESTAdapter(
+                {**_API_CONFIG, "auth_token": "test-token-123", "config": {"auth_type": "bearer"}},
+                client=client
             )
             await adapter.get("/api/cases")
 
-            # Verify auth header was included
-            call_kwargs = mock_get.call_args.kwargs
-            assert "headers" in call_kwargs
-            assert call_kwargs["headers"]["Authorization"] == "Bearer test-token-123"
+        # Verify auth header was included
+        assert requests[0].headers["Authorization"] == "Bearer test-token-123"
 
     @pytest.mark.asyncio
-    async def test_error_handling(self):
-        """Test error handling for failed API requests"""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.return_value = httpx.Response(
-                404,
-                json={"error": "Not Found"}
-            )
+    async def test_timeout_configuration(self):
+        """Test timeout configuration"""
+        requests = []
 
-            adapter = RESTAPIAdapter(base_url="http://api.example.com")
+        def respond(request):
+            requests.append(request)
+            return _RESP_EMPTY
 
-            with pytest.raises(Exception):
-                await adapter.get("/api/invalid")
+        async with _mock_client(respond) as client:
+            adapter = RESTAdapter({**_API_CONFIG, "config": {"timeout": 5.0}}, client=client)
+            await adapter.get("/api/cases")
+
+        assert requests[0].extensions["timeout"]["read"] == 5.0
 
     @pytest.mark.asyncio
-    async def test_retry_logic(self):
-        """Test retry logic for transient failures"""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            # First call fails, second succeeds
-            mock_get.side_effect = [
-                httpx.Response(500, json={"error": "Internal Server Error"}),
-                httpx.Response(200, json={"success": True})
-            ]
-
-            adapter = RESTAPIAdapter(
-                base_url="http://api.example.com",
-                max_retries=2
+    async def test_shared_client_keeps_auth_per_adapter(self):
+        """Test adapters sharing one client each send only their own credentials"""
+        requests = []
+
+        def record(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        async with _mock_client(record) as client:
+            bearer = RESTAdapter(
+                {**_API_CONFIG, "auth_token": "token-a",
+                 "config": {"auth_type": "bearer", "timeout": 5}},
+                client=client
             )
-            result = await adapter.get("/api/cases")
+            basic = RESTAdapter(
+                {**_API_CONFIG, "username": "user-b", "password": "secret-b",
+                 "config": {"auth_type": "basic", "timeout": 10}},
+                client=client
+            )
+            await bearer.get("/api/cases")
+            await basic.get("/api/cases")
+            await bearer.get("/api/cases")
 
-            assert result["success"] is True
-            assert mock_get.call_count == 2
+            # The shared client itself never picks up either adapter's credentials
+            assert "Authorization" not in client.headers
+            assert client.auth is None
 
-    @pytest.mark.asyncio
-    async def test_timeout_configuration(self):
-        """Test timeout configuration"""
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.return_value = httpx.Response(200, json={})
+        bearer_first, basic_request, bearer_again = requests
+        assert bearer_first.headers["Authorization"] == "Bearer token-a"
+        assert basic_request.headers["Authorization"] == "Basic " + base64.b64encode(b"user-b:secret-b").decode()
+        assert bearer_again.headers["Authorization"] == "Bearer token-a"
 
-            adapter = RESTAPIAdapter(
-                base_url="http://api.example.com",
-                timeout=5.0
-            )
-            await adapter.get("/api/cases")
-
-            call_kwargs = mock_get.call_args.kwargs
-            assert "timeout" in call_kwargs
-            assert call_kwargs["timeout"] == 5.0
+        # Each adapter's own timeout is applied per request
+        assert bearer_first.extensions["timeout"]["read"] == 5
+        assert basic_request.extensions["timeout"]["read"] == 10
 
 
 class TestPostgreSQLAdapter:
     """Test PostgreSQL data adapter"""
 
     @pytest.mark.asyncio
-    async def test_query_execution(self, mock_postgres_pool):
+    async def test_query_execution(self, pg_adapter):
         """Test executing a query"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            await adapter.connect()
-
-            result = await adapter.query("SELECT * FROM cases WHERE status = $1", "open")
+        result = await pg_adapter.execute_query(_Q_CASES_BY_STATUS, {"status": "open"})
 
-            assert len(result) == 2
-            assert result[0]["name"] == "Test Case"
+        assert len(result) == 2
+        assert result[0]["name"] == "Test Case"
 
     @pytest.mark.asyncio
-    async def test_query_one(self, mock_postgres_pool):
+    async def test_query_one(self, pg_adapter):
         """Test fetching single row"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            await adapter.connect()
+        result = await pg_adapter.execute_query(_Q_CASE_BY_ID, {"id": 1})
 
-            result = await adapter.query_one("SELECT * FROM cases WHERE id = $1", 1)
-
-            assert result is not None
-            assert result["id"] == 1
-            assert result["name"] == "Test Case"
+        assert result
+        assert result[0]["id"] == 1
+        assert result[0]["name"] == "Test Case"
 
     @pytest.mark.asyncio
-    async def test_execute_statement(self, mock_postgres_pool):
+    async def test_execute_statement(self, pg_adapter):
         """Test executing INSERT/UPDATE/DELETE"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            await adapter.connect()
-
-            result = await adapter.execute(
-                "INSERT INTO cases (name, status) VALUES ($1, $2)",
-                "New Case",
-                "open"
-            )
+        result = await pg_adapter.execute(
+            "insert",
+            table="cases",
+            data={"name": "New Case", "status": "open"}
+        )
 
-            assert result is not None
+        assert result is not None
 
     @pytest.mark.asyncio
-    async def test_transaction(self, mock_postgres_pool):
+    async def test_transaction(self, pg_adapter):
         """Test transaction handling"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            await adapter.connect()
-
-            async with adapter.transaction():
-                await adapter.execute(
-                    "INSERT INTO cases (name) VALUES ($1)",
-                    "Case 1"
-                )
-                await adapter.execute(
-                    "INSERT INTO cases (name) VALUES ($1)",
-                    "Case 2"
-                )
+        results = await pg_adapter.execute("transaction", operations=[
+            {"type": "execute", "query": _Q_INSERT_CASE, "params": ["Case 1"]},
+            {"type": "execute", "query": _Q_INSERT_CASE, "params": ["Case 2"]},
+        ])
 
-            # Both inserts should be committed
+        # Both inserts should be committed
+        assert results == ["INSERT 0 1", "INSERT 0 1"]
 
     @pytest.mark.asyncio
-    async def test_connection_pooling(self, mock_postgres_pool):
+    async def test_connection_pooling(self, pg_config, mock_postgres_pool):
         """Test connection pool management"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password",
-                min_pool_size=2,
-                max_pool_size=10
-            )
+        create_pool = AsyncMock(return_value=mock_postgres_pool)
+        with patch('asyncpg.create_pool', new=create_pool):
+            adapter = PostgreSQLAdapter({**pg_config, "pool_min": 2, "pool_max": 10})
             await adapter.connect()
 
             # Execute multiple concurrent queries
-            results = await asyncio.gather(*[
-                adapter.query("SELECT * FROM cases")
-                for _ in range(5)
-            ])
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(adapter.execute_query(_Q_ALL_CASES))
+                    for _ in range(5)
+                ]
+            results = [task.result() for task in tasks]
 
             assert len(results) == 5
+            assert create_pool.call_args.kwargs["min_size"] == 2
+            assert create_pool.call_args.kwargs["max_size"] == 10
 
     @pytest.mark.asyncio
-    async def test_parameterized_queries(self, mock_postgres_pool):
+    async def test_parameterized_queries(self, pg_adapter):
         """Test SQL injection protection via parameterized queries"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            await adapter.connect()
-
-            # Malicious input should be safely parameterized
-            malicious_input = "'; DROP TABLE cases; --"
-            result = await adapter.query(
-                "SELECT * FROM cases WHERE name = $1",
-                malicious_input
-            )
+        # Malicious input should be safely parameterized
+        malicious_input = "'; DROP TABLE cases; --"
+        result = await pg_adapter.execute_query(
+            _Q_CASES_BY_NAME,
+            {"name": malicious_input}
+        )
 
-            # Should execute safely without SQL injection
-            assert result is not None
+        # Should execute safely without SQL injection
+        assert result is not None
 
     @pytest.mark.asyncio
-    async def test_connection_error_handling(self):
+    async def test_connection_error_handling(self, pg_config):
         """Test handling of connection failures"""
-        with patch('asyncpg.create_pool', side_effect=Exception("Connection failed")):
-            adapter = PostgreSQLAdapter(
-                host="invalid-host",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
+        with patch('asyncpg.create_pool', new=AsyncMock(side_effect=Exception("Connection failed"))):
+            adapter = PostgreSQLAdapter({**pg_config, "host": "invalid-host"})
 
             with pytest.raises(Exception):
                 await adapter.connect()
 
     @pytest.mark.asyncio
-    async def test_disconnect(self, mock_postgres_pool):
+    async def test_disconnect(self, pg_config, mock_postgres_pool):
         """Test graceful disconnection"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool):
-            adapter = PostgreSQLAdapter(
-                host="localhost",
-                port=5432,
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
+        with patch('asyncpg.create_pool', new=AsyncMock(return_value=mock_postgres_pool)):
+            adapter = PostgreSQLAdapter(pg_config)
             await adapter.connect()
             await adapter.disconnect()
 
             # Pool should be closed
-            assert adapter.pool is None or not adapter.pool._closed
+            assert adapter.pool is None
+            mock_postgres_pool.close.assert_awaited_once()
 
 
 class TestDataAdapterIntegration:
     """Test integration between multiple data adapters"""
 
     @pytest.mark.asyncio
-    async def test_multi_source_query(self, mock_postgres_pool, mock_api_responses):
+    async def test_multi_source_query(self, pg_config, mock_postgres_pool, mock_api_client):
         """Test querying multiple data sources"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool), \
-             patch('httpx.AsyncClient.get') as mock_get:
-
-            mock_get.return_value = httpx.Response(
-                200,
-                json=mock_api_responses["/api/cases/12345"]
-            )
-
+        with patch('asyncpg.create_pool', new=AsyncMock(return_value=mock_postgres_pool)):
             # Initialize adapters
-            pg_adapter = PostgreSQLAdapter(
-                host="localhost",
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            rest_adapter = RESTAPIAdapter(base_url="http://api.example.com")
+            pg_adapter = PostgreSQLAdapter(pg_config)
+            rest_adapter = RESTAdapter(_API_CONFIG, client=mock_api_client)
 
             await pg_adapter.connect()
 
             # Query both sources
-            db_results = await pg_adapter.query("SELECT * FROM cases")
+            db_results = await pg_adapter.execute_query(_Q_ALL_CASES)
             api_results = await rest_adapter.get("/api/cases/12345")
 
             assert len(db_results) > 0
             assert api_results["id"] == "12345"
 
     @pytest.mark.asyncio
-    async def test_data_aggregation(self, mock_postgres_pool, mock_api_responses):
+    async def test_data_aggregation(self, pg_config, mock_postgres_pool, mock_api_client):
         """Test aggregating data from multiple sources"""
-        with patch('asyncpg.create_pool', return_value=mock_postgres_pool), \
-             patch('httpx.AsyncClient.get') as mock_get:
-
-            mock_get.return_value = httpx.Response(
-                200,
-                json=mock_api_responses["/api/cases"]
-            )
-
-            pg_adapter = PostgreSQLAdapter(
-                host="localhost",
-                database="test_db",
-                user="test_user",
-                password="test_password"
-            )
-            rest_adapter = RESTAPIAdapter(base_url="http://api.example.com")
+        with patch('asyncpg.create_pool', new=AsyncMock(return_value=mock_postgres_pool)):
+            pg_adapter = PostgreSQLAdapter(pg_config)
+            rest_adapter = RESTAdapter(_API_CONFIG, client=mock_api_client)
 
             await pg_adapter.connect()
 
             # Aggregate results
-            db_cases = await pg_adapter.query("SELECT * FROM cases")
+            db_cases = await pg_adapter.execute_query(_Q_ALL_CASES)
             api_cases = await rest_adapter.get("/api/cases")
 
             all_cases = list(db_cases) + api_cases["cases"]
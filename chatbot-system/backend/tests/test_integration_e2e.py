@@ -4,150 +4,182 @@ End-to-End Integration Tests for Chatbot System
 import pytest
 import asyncio
 import json
+import msgpack
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from unittest.mock import patch, AsyncMock, MagicMock
-from websocket import create_connection
-import websocket
 
 from app.main import app
 from fastapi.testclient import TestClient
+from tests.ws_helpers import receive_many
+
+
+_WS_CHAT_URL = "/ws/chat"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_eliza_provider(module_monkeypatch, shared_eliza_provider):
+    """Route the app's ElizaProvider construction to the shared mock for the whole module"""
+    # The lifespan in app.main builds the provider the handler is given; without
+    # an Anthropic key it falls through to ElizaProvider
+    module_monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    module_monkeypatch.setattr(
+        "app.main.ElizaProvider",
+        lambda *args, **kwargs: shared_eliza_provider
+    )
 
 
 class TestEndToEndFlow:
     """Test complete message flow through the system"""
 
     @pytest.mark.asyncio
-    async def test_websocket_connection_lifecycle(self, sync_test_client, mock_session_manager):
+    async def test_websocket_connection_lifecycle(self, async_ws_client, mock_session_manager):
         """Test WebSocket connection establishment and lifecycle"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
+        async with async_ws_client(_WS_CHAT_URL) as ws:
             # Test connection message
-            data = ws.receive_json()
+            data = await ws.receive_json()
             assert data["type"] == "connection"
             assert data["status"] == "connected"
             assert "session_id" in data
 
             # Send a ping to test heartbeat
-            ws.send_json({"type": "ping"})
-            response = ws.receive_json()
+            await ws.send_json({"type": "ping"})
+            response = await ws.receive_json()
             assert response["type"] == "pong"
 
     @pytest.mark.asyncio
-    async def test_chat_message_flow(self, sync_test_client, mock_eliza_provider):
+    async def test_msgpack_subprotocol(self, sync_test_client, msgpack_ws_client):
+        """Test MessagePack frames carry the same messages as JSON frames"""
+        with sync_test_client.websocket_connect(_WS_CHAT_URL) as json_ws:
+            json_conn = json_ws.receive_json()
+            json_ws.send_json({"type": "ping"})
+            json_pong = json_ws.receive_json()
+
+        msgpack_conn = msgpack.unpackb(msgpack_ws_client.receive_bytes(), raw=False)
+        msgpack_ws_client.send_bytes(msgpack.packb({"type": "ping"}))
+        msgpack_pong = msgpack.unpackb(msgpack_ws_client.receive_bytes(), raw=False)
+
+        assert msgpack_conn.keys() == json_conn.keys()
+        assert msgpack_conn["type"] == json_conn["type"]
+        assert msgpack_pong["type"] == json_pong["type"] == "pong"
+
+    @pytest.mark.asyncio
+    async def test_chat_message_flow(self, async_ws_client, mock_eliza_provider):
         """Test sending and receiving chat messages"""
-        with patch('app.orchestration.websocket_handler.ElizaProvider', return_value=mock_eliza_provider):
-            with sync_test_client.websocket_connect("/ws/chat") as ws:
-                # Get connection confirmation
-                connection_msg = ws.receive_json()
-                session_id = connection_msg["session_id"]
-
-                # Send chat message
-                chat_message = {
-                    "type": "chat",
-                    "content": "What is the status of case #12345?",
-                    "message_id": "test-msg-001"
-                }
-                ws.send_json(chat_message)
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            # Get connection confirmation
+            connection_msg = await ws.receive_json()
+            session_id = connection_msg["session_id"]
 
-                # Receive response
-                response = ws.receive_json()
-                assert response["type"] == "message"
-                assert "content" in response
-                assert response["role"] == "assistant"
-                assert response["message_id"] == "test-msg-001"
+            # Send chat message
+            chat_message = {
+                "type": "chat",
+                "content": "What is the status of case #12345?",
+                "message_id": "test-msg-001"
+            }
+            await ws.send_json(chat_message)
+
+            # Receive response
+            response = await ws.receive_json()
+            assert response["type"] == "message"
+            assert "content" in response
+            assert response["role"] == "assistant"
+            assert response["message_id"] == "test-msg-001"
 
     @pytest.mark.asyncio
-    async def test_streaming_response(self, sync_test_client, mock_eliza_provider):
+    async def test_streaming_response(self, async_ws_client, mock_eliza_provider):
         """Test streaming response from LLM"""
-        with patch('app.orchestration.websocket_handler.ElizaProvider', return_value=mock_eliza_provider):
-            with sync_test_client.websocket_connect("/ws/chat") as ws:
-                # Get connection confirmation
-                ws.receive_json()
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            # Get connection confirmation
+            await ws.receive_json()
 
-                # Send message requesting stream
-                chat_message = {
-                    "type": "chat",
-                    "content": "Explain the case in detail",
-                    "message_id": "test-msg-002",
-                    "stream": True
-                }
-                ws.send_json(chat_message)
-
-                # Collect streamed chunks
-                chunks = []
-                while True:
-                    response = ws.receive_json()
-                    if response["type"] == "stream_chunk":
-                        chunks.append(response["content"])
-                        if response.get("done", False):
-                            break
-
-                # Verify we received multiple chunks
-                assert len(chunks) > 1
-                full_response = "".join(chunks[:-1])  # Last chunk is empty with done=True
-                assert len(full_response) > 0
+            # Send message requesting stream
+            chat_message = {
+                "type": "chat",
+                "content": "Explain the case in detail",
+                "message_id": "test-msg-002",
+                "stream": True
+            }
+            await ws.send_json(chat_message)
+
+            # Collect streamed chunks
+            chunks = []
+            while True:
+                response = await ws.receive_json()
+                if response["type"] == "stream_chunk":
+                    chunks.append(response["content"])
+                    if response.get("done", False):
+                        break
+
+            # Verify we received multiple chunks
+            assert len(chunks) > 1
+            full_response = "".join(chunks[:-1])  # Last chunk is empty with done=True
+            assert len(full_response) > 0
 
     @pytest.mark.asyncio
-    async def test_error_handling(self, sync_test_client):
+    async def test_error_handling(self, async_ws_client):
         """Test error handling for invalid messages"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
+        async with async_ws_client(_WS_CHAT_URL) as ws:
             # Get connection confirmation
-            ws.receive_json()
+            await ws.receive_json()
 
             # Send invalid message
             invalid_message = {
                 "type": "invalid_type",
                 "data": "some data"
             }
-            ws.send_json(invalid_message)
+            await ws.send_json(invalid_message)
 
             # Should receive error response
-            response = ws.receive_json()
+            response = await ws.receive_json()
             assert response["type"] == "error"
             assert "message" in response
 
     @pytest.mark.asyncio
-    async def test_session_persistence(self, sync_test_client, mock_session_manager):
+    async def test_session_persistence(self, async_ws_client, mock_session_manager):
         """Test session persistence across connections"""
         # First connection
-        with sync_test_client.websocket_connect("/ws/chat") as ws1:
-            conn_msg = ws1.receive_json()
+        async with async_ws_client(_WS_CHAT_URL) as ws1:
+            conn_msg = await ws1.receive_json()
             session_id = conn_msg["session_id"]
 
             # Send a message to establish history
-            ws1.send_json({
+            await ws1.send_json({
                 "type": "chat",
                 "content": "Remember this: Project Alpha",
                 "message_id": "msg-001"
             })
-            ws1.receive_json()
+            await ws1.receive_json()
 
         # Second connection with same session
-        with sync_test_client.websocket_connect(f"/ws/chat?session_id={session_id}") as ws2:
-            conn_msg = ws2.receive_json()
+        async with async_ws_client(f"{_WS_CHAT_URL}?session_id={session_id}") as ws2:
+            conn_msg = await ws2.receive_json()
             assert conn_msg["session_id"] == session_id
 
             # Send message referencing previous context
-            ws2.send_json({
+            await ws2.send_json({
                 "type": "chat",
                 "content": "What project did I mention?",
                 "message_id": "msg-002"
             })
-            response = ws2.receive_json()
+            response = await ws2.receive_json()
             # In real scenario, LLM would reference Project Alpha
             assert response["type"] == "message"
 
     @pytest.mark.asyncio
     async def test_concurrent_connections(self, sync_test_client):
         """Test multiple concurrent WebSocket connections"""
-        connections = []
-        session_ids = []
+        def open_connection(_):
+            return sync_test_client.websocket_connect(_WS_CHAT_URL).__enter__()
 
-        try:
-            # Create multiple connections
-            for i in range(3):
-                ws = sync_test_client.websocket_connect("/ws/chat").__enter__()
-                connections.append(ws)
-                conn_msg = ws.receive_json()
-                session_ids.append(conn_msg["session_id"])
+        with ExitStack() as stack, ThreadPoolExecutor(max_workers=3) as pool:
+            # Perform the three handshakes concurrently; each sync session blocks its own thread
+            connections = list(pool.map(open_connection, range(3)))
+            for ws in connections:
+                stack.push(ws.__exit__)
+
+            conn_msgs = list(pool.map(lambda ws: ws.receive_json(), connections))
+            session_ids = [conn_msg["session_id"] for conn_msg in conn_msgs]
 
             # Verify all sessions are unique
             assert len(set(session_ids)) == 3
@@ -161,60 +193,54 @@ class TestEndToEndFlow:
                 })
 
             # Receive responses
-            for ws in connections:
-                response = ws.receive_json()
-                assert response["type"] == "message"
-
-        finally:
-            # Cleanup connections
-            for ws in connections:
-                ws.__exit__(None, None, None)
+            responses = list(pool.map(lambda ws: ws.receive_json(), connections))
+            assert all(response["type"] == "message" for response in responses)
 
     @pytest.mark.asyncio
-    async def test_reconnection_with_session(self, sync_test_client, mock_session_manager):
+    async def test_reconnection_with_session(self, async_ws_client, mock_session_manager):
         """Test reconnection with existing session ID"""
         # Initial connection
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
-            conn_msg = ws.receive_json()
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            conn_msg = await ws.receive_json()
             original_session_id = conn_msg["session_id"]
 
             # Send some messages
-            ws.send_json({
+            await ws.send_json({
                 "type": "chat",
                 "content": "Initial message",
                 "message_id": "msg-001"
             })
-            ws.receive_json()
+            await ws.receive_json()
 
         # Simulate reconnection with same session
-        with sync_test_client.websocket_connect(f"/ws/chat?session_id={original_session_id}") as ws:
-            conn_msg = ws.receive_json()
+        async with async_ws_client(f"{_WS_CHAT_URL}?session_id={original_session_id}") as ws:
+            conn_msg = await ws.receive_json()
             assert conn_msg["session_id"] == original_session_id
             assert conn_msg["status"] == "connected"
 
     @pytest.mark.asyncio
-    async def test_data_adapter_integration(self, sync_test_client, mock_postgres_pool):
+    async def test_data_adapter_integration(self, async_ws_client, mock_postgres_pool):
         """Test integration with data adapters"""
-        with patch('app.data.postgres_adapter.create_pool', return_value=mock_postgres_pool):
-            with sync_test_client.websocket_connect("/ws/chat") as ws:
-                ws.receive_json()  # Connection message
+        with patch('asyncpg.create_pool', new=AsyncMock(return_value=mock_postgres_pool)):
+            async with async_ws_client(_WS_CHAT_URL) as ws:
+                await ws.receive_json()  # Connection message
 
                 # Send query that triggers database lookup
-                ws.send_json({
+                await ws.send_json({
                     "type": "chat",
                     "content": "Show me all cases from the database",
                     "message_id": "msg-db-001"
                 })
 
-                response = ws.receive_json()
+                response = await ws.receive_json()
                 assert response["type"] == "message"
                 # Response would contain database results in real scenario
 
     @pytest.mark.asyncio
-    async def test_action_message_handling(self, sync_test_client):
+    async def test_action_message_handling(self, async_ws_client):
         """Test handling of action messages for parent-child communication"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
-            ws.receive_json()  # Connection message
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            await ws.receive_json()  # Connection message
 
             # Send action message
             action_message = {
@@ -226,10 +252,10 @@ class TestEndToEndFlow:
                 },
                 "message_id": "action-001"
             }
-            ws.send_json(action_message)
+            await ws.send_json(action_message)
 
             # Should receive acknowledgment
-            response = ws.receive_json()
+            response = await ws.receive_json()
             assert response["type"] == "action_response"
             assert response["action"] == "update_filters"
             assert response["status"] == "success"
@@ -237,7 +263,7 @@ class TestEndToEndFlow:
     @pytest.mark.asyncio
     async def test_rate_limiting(self, sync_test_client):
         """Test rate limiting for message sending"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
+        with sync_test_client.websocket_connect(_WS_CHAT_URL) as ws:
             ws.receive_json()  # Connection message
 
             # Send multiple messages rapidly
@@ -249,22 +275,16 @@ class TestEndToEndFlow:
                 })
 
             # Should still receive responses (rate limiting would be configured)
-            responses_received = 0
-            for _ in range(10):
-                try:
-                    response = ws.receive_json(timeout=1)
-                    if response["type"] == "message":
-                        responses_received += 1
-                except:
-                    break
+            responses = receive_many(ws, 10, timeout=1)
+            responses_received = sum(1 for response in responses if response["type"] == "message")
 
             assert responses_received > 0
 
     @pytest.mark.asyncio
-    async def test_message_validation(self, sync_test_client):
+    async def test_message_validation(self, async_ws_client):
         """Test message validation and error responses"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
-            ws.receive_json()  # Connection message
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            await ws.receive_json()  # Connection message
 
             # Test missing required fields
             invalid_messages = [
@@ -275,23 +295,23 @@ class TestEndToEndFlow:
             ]
 
             for msg in invalid_messages:
-                ws.send_json(msg)
-                response = ws.receive_json()
+                await ws.send_json(msg)
+                response = await ws.receive_json()
                 assert response["type"] == "error"
 
     @pytest.mark.asyncio
-    async def test_graceful_shutdown(self, sync_test_client):
+    async def test_graceful_shutdown(self, async_ws_client):
         """Test graceful shutdown of connections"""
-        with sync_test_client.websocket_connect("/ws/chat") as ws:
-            ws.receive_json()  # Connection message
+        async with async_ws_client(_WS_CHAT_URL) as ws:
+            await ws.receive_json()  # Connection message
 
             # Send close message
-            ws.send_json({
+            await ws.send_json({
                 "type": "close",
                 "reason": "user_initiated"
             })
 
             # Should receive close confirmation
-            response = ws.receive_json()
+            response = await ws.receive_json()
             assert response["type"] == "close"
             assert response["status"] == "connection_closed"
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Orchestration Hot-Path Benchmarks
+
+Throughput of the per-step routing, response extraction and merging code,
+measured with pytest-benchmark so slowdowns show up in the saved runs:
+
+    pytest -m slow tests/test_phase3_perf.py --benchmark-autosave
+    pytest -m slow tests/test_phase3_perf.py --benchmark-compare --benchmark-compare-fail=mean:25%
+
+They are marked slow, which the default pytest options deselect.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+pytest.importorskip("pytest_benchmark")
+
+from app.intelligence.orchestration.consolidator_node import ConsolidatorNode
+from app.intelligence.orchestration.data_merger import DataMerger
+from app.intelligence.orchestration.routing import route_from_supervisor
+from app.intelligence.orchestration.state import StateFactory
+from app.intelligence.orchestration.types import AgentType
+
+
+# Calls per benchmark round
+_SIZES = [1, 100, 10_000]
+
+# Response shapes of the supported providers, with the text each yields
+_PROVIDER_RESPONSES = [
+    ({"content": [{"type": "text", "text": "anthropic"}]}, "anthropic"),
+    ({"choices": [{"message": {"content": "openai"}}]}, "openai"),
+    ({"content": "eliza"}, "eliza"),
+    ({"message": {"content": "message"}}, "message"),
+    ({"text": "text"}, "text"),
+]
+
+
+@pytest.fixture(scope="module")
+def supervisor_state():
+    """State routed to the SQL agent"""
+    state = StateFactory.create_initial_state("test", "session-perf")
+    state["next_agent"] = AgentType.SQL_AGENT
+    return state
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+class TestRoutingThroughput:
+    """Benchmark routing decisions"""
+
+    @pytest.mark.parametrize("n", _SIZES)
+    def test_route_from_supervisor(self, benchmark, supervisor_state, n):
+        """Route n steps from the supervisor"""
+        routes = benchmark(lambda: [route_from_supervisor(supervisor_state) for _ in range(n)])
+        assert routes == ["sql_agent"] * n
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+class TestResponseExtractionThroughput:
+    """Benchmark ConsolidatorNode._extract_response_text"""
+
+    @pytest.mark.parametrize("response,expected", _PROVIDER_RESPONSES)
+    @pytest.mark.parametrize("n", _SIZES)
+    def test_extract_response_text(self, benchmark, response, expected, n):
+        """Extract n responses of one provider format"""
+        extract = ConsolidatorNode(MagicMock())._extract_response_text
+        texts = benchmark(lambda: [extract(response) for _ in range(n)])
+        assert texts == [expected] * n
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+class TestMergerThroughput:
+    """Benchmark DataMerger on result-set sized inputs"""
+
+    @pytest.mark.parametrize("n", _SIZES)
+    def test_deduplicate(self, benchmark, n):
+        """Deduplicate n records, half of them repeats"""
+        data = [{"id": i % max(n // 2, 1), "name": f"record-{i % max(n // 2, 1)}"} for i in range(n)]
+        unique = benchmark(DataMerger().deduplicate, data, key_fields=["id", "name"])
+        assert len(unique) == max(n // 2, 1)
+
+    @pytest.mark.parametrize("n", _SIZES)
+    def test_correlate_by_field(self, benchmark, n):
+        """Group n records by user"""
+        data = [{"user_id": i % 50, "alert_id": i} for i in range(n)]
+        groups = benchmark(DataMerger().correlate_by_field, data, "user_id")
+        assert sum(len(group) for group in groups.values()) == n
@@ -8,7 +8,6 @@ import json
 from datetime import datetime, timedelta
 
 from app.orchestration.session_manager import SessionManager
-from tests.mocks import MockSessionData
 
 
 class TestSessionManagement:
@@ -24,14 +23,13 @@ class TestSessionManagement:
         assert session_id.startswith("sess-")
 
     @pytest.mark.asyncio
-    async def test_get_existing_session(self, mock_session_manager):
+    async def test_get_existing_session(self, mock_session_manager, session_with_history):
         """Test retrieving an existing session"""
         # Create session
         session_id = await mock_session_manager.create_session()
 
         # Store some data
-        session_data = MockSessionData.get_session_with_history()
-        await mock_session_manager.update_session(session_id, session_data)
+        await mock_session_manager.update_session(session_id, session_with_history)
 
         # Retrieve session
         retrieved = await mock_session_manager.get_session(session_id)
@@ -56,19 +54,30 @@ class TestSessionManagement:
         assert len(session["conversation_history"]) >= 2
 
     @pytest.mark.asyncio
-    async def test_session_expiration(self, mock_session_manager):
+    async def test_session_expiration(self, fake_clock):
         """Test session expiration handling"""
-        session_id = await mock_session_manager.create_session()
+        # Redis ping fails, so the manager falls back to in-memory storage
+        # without attempting a real connection
+        unreachable = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+        with patch('app.orchestration.session_manager.redis.Redis.ping', new=unreachable):
+            manager = SessionManager({"host": "localhost", "port": 6379}, clock=fake_clock)
+            await manager.connect()
+        assert manager.redis_client is None
+        session = manager.create_session()
+        await manager.save_session(session)
 
         # Set TTL
-        await mock_session_manager.set_session_ttl(session_id, ttl_seconds=1)
+        await manager.set_session_ttl(session.id, ttl_seconds=1)
+
+        # Still live just before the deadline
+        fake_clock.advance(0.5)
+        assert await manager.get_session(session.id) is not None
 
-        # Wait for expiration
-        await asyncio.sleep(2)
+        # Advance virtual time past the TTL instead of sleeping
+        fake_clock.advance(1)
 
         # Session should be expired
-        session = await mock_session_manager.get_session(session_id)
-        assert session is None or session.get("expired", False)
+        assert await manager.get_session(session.id) is None
 
     @pytest.mark.asyncio
     async def test_delete_session(self, mock_session_manager):
@@ -102,23 +111,38 @@ class TestSessionManagement:
         assert retrieved is not None
 
     @pytest.mark.asyncio
-    async def test_concurrent_session_updates(self, mock_session_manager):
-        """Test concurrent updates to same session"""
-        session_id = await mock_session_manager.create_session()
-
-        # Simulate concurrent updates
+    async def test_concurrent_session_updates(self, mock_redis):
+        """Test concurrent updates to same session land in one ordered write"""
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock(return_value=[])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        with patch('app.orchestration.session_manager.redis.Redis', return_value=mock_redis):
+            manager = SessionManager({"host": "localhost", "port": 6379})
+            await manager.connect()
+
+        # Simulate concurrent updates, each producing a batch of messages
         async def update_session(msg_id: int):
-            await mock_session_manager.add_messages(
-                session_id,
-                [{"role": "user", "content": f"Message {msg_id}"}]
-            )
-
-        # Run multiple updates concurrently
-        await asyncio.gather(*[update_session(i) for i in range(5)])
-
-        # Verify all messages were added
-        session = await mock_session_manager.get_session(session_id)
-        assert len(session["conversation_history"]) >= 5
+            return [
+                {"role": "user", "content": f"Message {msg_id}"},
+                {"role": "assistant", "content": f"Reply {msg_id}"}
+            ]
+
+        batches = await asyncio.gather(*[update_session(i) for i in range(5)])
+        await manager.add_messages_bulk("sess-bulk", batches)
+
+        # All batches go out in a single pipeline write
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        pipe.rpush.assert_called_once()
+
+        # Flattened in batch order, oldest first
+        key, *pushed = pipe.rpush.call_args.args
+        assert key == "history:sess-bulk"
+        assert [json.loads(message) for message in pushed] == [
+            message for batch in batches for message in batch
+        ]
 
     @pytest.mark.asyncio
     async def test_session_context_persistence(self, mock_session_manager):
@@ -0,0 +1,45 @@
+"""Helpers for driving Starlette WebSocket test sessions"""
+import queue
+import threading
+from typing import Any, Dict, List
+
+
+def receive_many(ws, n: int, timeout: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Receive up to n JSON messages from a WebSocket test session.
+
+    One background thread drains the frames back to back while the caller
+    collects them, stopping early once a frame takes longer than timeout
+    seconds to arrive or the session closes. A read left pending after a
+    timeout only ends when the session closes, so call this last.
+
+    Args:
+        ws: Session returned by TestClient.websocket_connect()
+        n: Maximum number of messages to receive
+        timeout: Seconds to wait for each message
+
+    Returns:
+        Messages received, in order
+    """
+    received: queue.Queue = queue.Queue()
+
+    def drain():
+        for _ in range(n):
+            try:
+                received.put(ws.receive_json())
+            except Exception as e:
+                received.put(e)
+                return
+
+    threading.Thread(target=drain, daemon=True).start()
+
+    messages = []
+    for _ in range(n):
+        try:
+            message = received.get(timeout=timeout)
+        except queue.Empty:
+            break
+        if isinstance(message, Exception):
+            break
+        messages.append(message)
+    return messages
@@ -6,16 +6,26 @@ Uses REAL database metadata only - never generates imaginary columns
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import re
 import yaml
 import sys
 import os
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from dotenv import load_dotenv
 
 
-class InlineListDumper(yaml.SafeDumper):
+# libyaml's C emitter is an order of magnitude faster; PyYAML builds without it
+# fall back to the pure-Python dumper
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+
+
+class InlineListDumper(_BaseDumper):
     """Custom YAML dumper that formats lists inline"""
     pass
 
@@ -26,6 +36,309 @@ def represent_list(dumper, data):
 # Register the custom list representer
 InlineListDumper.add_representer(list, represent_list)
 
+# One row per (foreign key, column pair), read straight from pg_catalog: the
+# information_schema views re-run permission checks and joins on every use.
+# unnest(conkey, confkey) pairs each local column with the column it references
+_FOREIGN_KEY_COLUMNS = """
+    SELECT
+        src_ns.nspname AS table_schema,
+        src.relname AS table_name,
+        src_att.attname AS column_name,
+        ref_ns.nspname AS foreign_table_schema,
+        ref.relname AS foreign_table_name,
+        ref_att.attname AS foreign_column_name,
+        con.conname AS constraint_name,
+        con.conrelid AS relid,
+        con.confrelid AS foreign_relid
+    FROM pg_constraint con
+    CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS k(attnum, ref_attnum)
+    JOIN pg_class src ON src.oid = con.conrelid
+    JOIN pg_namespace src_ns ON src_ns.oid = src.relnamespace
+    JOIN pg_attribute src_att ON src_att.attrelid = con.conrelid AND src_att.attnum = k.attnum
+    JOIN pg_class ref ON ref.oid = con.confrelid
+    JOIN pg_namespace ref_ns ON ref_ns.oid = ref.relnamespace
+    JOIN pg_attribute ref_att ON ref_att.attrelid = con.confrelid AND ref_att.attnum = k.ref_attnum
+    WHERE con.contype = 'f'
+"""
+
+# One row per column, read from pg_attribute with only the fields the config
+# needs. The values match information_schema.columns (data_type spellings such
+# as 'USER-DEFINED' and 'ARRAY', domains resolved to their base type), which
+# map_postgres_type keys on, without that view's stack of joins
+_CATALOG_COLUMNS = """
+    SELECT
+        a.attrelid AS relid,
+        n.nspname AS table_schema,
+        cl.relname AS table_name,
+        a.attnum AS ordinal_position,
+        a.attname AS column_name,
+        CASE
+            WHEN ut.typelem <> 0 AND ut.typlen = -1 THEN 'ARRAY'
+            WHEN ut_ns.nspname = 'pg_catalog' THEN format_type(ut.oid, NULL)
+            ELSE 'USER-DEFINED'
+        END AS data_type,
+        information_schema._pg_char_max_length(ut.oid, m.typmod) AS character_maximum_length,
+        information_schema._pg_numeric_precision(ut.oid, m.typmod) AS numeric_precision,
+        information_schema._pg_numeric_scale(ut.oid, m.typmod) AS numeric_scale,
+        CASE WHEN a.attnotnull OR (t.typtype = 'd' AND t.typnotnull) THEN 'NO' ELSE 'YES' END AS is_nullable,
+        CASE WHEN a.attgenerated = '' THEN pg_get_expr(ad.adbin, ad.adrelid) END AS column_default,
+        ut.typname AS udt_name,
+        col_description(a.attrelid, a.attnum) AS column_comment
+    FROM pg_attribute a
+    JOIN pg_class cl ON cl.oid = a.attrelid
+    JOIN pg_namespace n ON n.oid = cl.relnamespace
+    JOIN pg_type t ON t.oid = a.atttypid
+    JOIN pg_type ut ON ut.oid = CASE WHEN t.typtype = 'd' THEN t.typbasetype ELSE t.oid END
+    JOIN pg_namespace ut_ns ON ut_ns.oid = ut.typnamespace
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN t.typtype = 'd' THEN t.typtypmod ELSE a.atttypmod END AS typmod
+    ) m
+    LEFT JOIN pg_attrdef ad ON a.atthasdef AND ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+    WHERE a.attnum > 0
+    AND NOT a.attisdropped
+    AND cl.relkind IN ('r', 'p', 'v', 'f')
+"""
+
+# Per-table metadata queries. The relation is identified by its pg_class OID
+# where the catalogs allow it, so no query re-resolves schema.table by name
+# (params: _COLUMNS_QUERY and _PRIMARY_KEY_QUERY (relid,), the foreign key
+# queries (schema, table))
+_COLUMNS_QUERY = f"""
+    SELECT
+        c.column_name,
+        c.data_type,
+        c.character_maximum_length,
+        c.numeric_precision,
+        c.numeric_scale,
+        c.is_nullable,
+        c.column_default,
+        c.udt_name,
+        c.column_comment
+    FROM ({_CATALOG_COLUMNS}) c
+    WHERE c.relid = %s::oid
+    ORDER BY c.ordinal_position
+"""
+
+_PRIMARY_KEY_QUERY = """
+    SELECT a.attname
+    FROM pg_index i
+    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+    WHERE i.indrelid = %s::oid
+    AND i.indisprimary
+    ORDER BY a.attnum
+"""
+
+_FOREIGN_KEYS_QUERY = f"""
+    SELECT
+        fk.column_name,
+        fk.foreign_table_schema,
+        fk.foreign_table_name,
+        fk.foreign_column_name,
+        fk.constraint_name
+    FROM ({_FOREIGN_KEY_COLUMNS}) fk
+    WHERE fk.table_schema = %s
+    AND fk.table_name = %s
+"""
+
+_REFERENCED_BY_QUERY = f"""
+    SELECT DISTINCT
+        fk.table_schema,
+        fk.table_name,
+        fk.column_name,
+        fk.foreign_column_name AS referenced_column_name
+    FROM ({_FOREIGN_KEY_COLUMNS}) fk
+    WHERE fk.foreign_table_schema = %s
+    AND fk.foreign_table_name = %s
+"""
+
+
+class _ConfigYamlWriter:
+    """
+    Streams a generated config to a YAML file one table at a time.
+
+    Tables are appended as items of the top-level tables list as they are
+    written, instead of dumping the whole config in one call at the end.
+    Writing is skipped (with a message) when no file is given or it cannot
+    be written.
+    """
+
+    __slots__ = ('output_file', '_stream', '_tables_written')
+
+    def __init__(self, output_file: Optional[str]):
+        self.output_file = output_file
+        self._stream = None
+        self._tables_written = 0
+
+    def __enter__(self):
+        if self.output_file:
+            try:
+                self._stream = open(self.output_file, 'w')
+                self._stream.write('tables:')
+            except Exception as e:
+                print(f"✗ Failed to write file: {e}")
+                self._stream = None
+        return self
+
+    def write(self, table_config: Dict[str, Any]):
+        """Append one table config as a list item"""
+        if self._stream is None:
+            return
+        text = yaml.dump(table_config, Dumper=InlineListDumper, default_flow_style=False, sort_keys=False, allow_unicode=True, width=120)
+        self._stream.write('\n- ' + text.rstrip('\n').replace('\n', '\n  '))
+        self._tables_written += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._stream is None:
+            return False
+        self._stream.write('\n' if self._tables_written else ' []\n')
+        self._stream.close()
+        if exc_type is None:
+            print(f"✓ Configuration written to: {self.output_file}")
+        return False
+
+
+# Rows per round trip when streaming the schema-wide enum prefetch
+ENUM_PREFETCH_ITERSIZE = 10000
+
+# Metadata for a table absent from a prefetched schema (e.g. it has no columns)
+_EMPTY_TABLE_METADATA = {
+    'columns': [],
+    'primary_key': None,
+    'foreign_keys': [],
+    'referenced_by': [],
+}
+
+
+# Name fragments that drive table keywords and descriptions. The lookahead makes
+# findall report overlapping hits (e.g. both tags in "alertype") in one scan
+_NAME_TAG_RE = re.compile(
+    r'(?=(alert|case|user|role|type|mapping|junction|category|audit|log'
+    r'|workflow|step|status|priority))'
+)
+
+
+def _name_tags(name: str) -> Set[str]:
+    """Tags from _NAME_TAG_RE that occur anywhere in a lowercased name"""
+    return set(_NAME_TAG_RE.findall(name))
+
+
+_ROLE_MAPPING_KEYWORDS = frozenset({
+    'user role', 'role mapping', 'role assignment', 'permission', 'access', 'user access',
+    'role membership', 'authorization', 'user permission'
+})
+
+# (tags required, tags excluded, keywords added) for generate_keywords_from_actual_data
+_TABLE_KEYWORD_RULES = (
+    (frozenset({'alert'}), frozenset(),
+     frozenset({'alert', 'notification', 'warning', 'incident', 'event', 'trigger'})),
+    (frozenset({'alert', 'type'}), frozenset(),
+     frozenset({'alarm', 'message', 'severity', 'category', 'classification'})),
+    (frozenset({'alert'}), frozenset({'type'}),
+     frozenset({'alarm', 'message', 'severity', 'emergency'})),
+    (frozenset({'case'}), frozenset(),
+     frozenset({'case', 'ticket', 'issue', 'problem', 'support', 'request', 'incident'})),
+    (frozenset({'case'}), frozenset({'alert'}),
+     frozenset({'service request', 'bug', 'task', 'work item', 'assignment'})),
+    (frozenset({'user'}), frozenset({'role'}),
+     frozenset({'user', 'person', 'employee', 'member', 'account', 'profile', 'team', 'people',
+                'staff', 'operator', 'admin', 'contact', 'assignee'})),
+    (frozenset({'role', 'mapping'}), frozenset(), _ROLE_MAPPING_KEYWORDS),
+    (frozenset({'role', 'user'}), frozenset(), _ROLE_MAPPING_KEYWORDS),
+    (frozenset({'role'}), frozenset({'mapping', 'user'}),
+     frozenset({'role', 'permission', 'access level', 'user role', 'security role', 'access rights',
+                'privileges', 'authorization', 'admin', 'operator', 'viewer'})),
+    (frozenset({'type'}), frozenset(),
+     frozenset({'type', 'category', 'classification'})),
+)
+
+# Column-name tags that become keywords as-is
+_COLUMN_KEYWORDS = frozenset({'status', 'priority', 'workflow', 'step'})
+
+
+# Column description rules for generate_column_description, checked in this order:
+# exact names, key suffixes, score/flag prefixes, time suffixes, then substrings
+_COLUMN_EXACT_DESCRIPTIONS = {
+    'name': "Name",
+    'priority': "Priority level indicating urgency",
+    'severity': "Severity level indicating impact",
+    'created_at': "Timestamp when the record was created",
+    'updated_at': "Timestamp of the last update to the record",
+    'deleted_at': "Timestamp when the record was soft deleted",
+    'description': "Detailed description",
+    'details': "Additional details and information",
+    'notes': "Additional notes or comments",
+    'resolution': "Description of how the issue was resolved",
+}
+
+# Exact names described in terms of the table's entity
+_COLUMN_ENTITY_TEMPLATES = {
+    'id': "Unique identifier for the {} record",
+    'status': "Current status of the {} in its lifecycle",
+}
+
+# <entity>_id columns naming the table's own key: (table keyword, description)
+_OWN_ID_COLUMNS = {
+    'alert_id': ('alert', "Unique identifier for the alert"),
+    'case_id': ('case', "Unique identifier for the case"),
+    'user_id': ('user', "Unique identifier for the user"),
+    'role_id': ('role', "Unique identifier for the role"),
+}
+
+# Last name segment -> (fragments stripped to get the entity, description template)
+_COLUMN_KEY_SUFFIX_RULES = {
+    'name': (('_name',), "Name of the {}"),
+    'code': (('_code', '_slug'), "Unique code or identifier for the {}"),
+    'slug': (('_code', '_slug'), "Unique code or identifier for the {}"),
+    'number': (('_number',), "Human-readable {} number"),
+}
+_COLUMN_TIME_SUFFIX_RULES = {
+    'at': (('_at',), "Timestamp when {}"),
+    'date': (('_date',), "Date for {}"),
+}
+
+# Substring matches, first hit wins
+_COLUMN_CONTACT_DESCRIPTIONS = (
+    ('email', "Email address"),
+    ('phone', "Phone number"),
+    ('address', "Address information"),
+)
+_COLUMN_CONTEXT_DESCRIPTIONS = (
+    ('branch', "Branch identifier or information"),
+    ('department', "Department information"),
+    ('workflow', "Workflow identifier or information"),
+    ('step', "Workflow step identifier or information"),
+    ('transition', "Workflow transition information"),
+)
+
+
+# One match yields both the flag/org prefix and the last name segment
+_COLUMN_NAME_RE = re.compile(r'(?:(?=(?P<prefix>is|has|org)_))?.*?(?:_(?P<suffix>[^_]*))?', re.DOTALL)
+
+
+# psycopg2 placeholders (%s, %(name)s) and escaped percent signs (%%), as psycopg2
+# itself reads them; a lone % elsewhere in the query text is left as it is
+_PLACEHOLDER_RE = re.compile(r'%(?:\((\w+)\))?s|%%')
+
+
+def _rows_as_dicts(cursor) -> List[Dict[str, Any]]:
+    """Rows of a cursor's last query as plain dicts, reading the column names once per result"""
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def _entity_name(table_name: str) -> str:
+    """Human-readable entity for a table: cm_user_roles -> 'user roles'"""
+    return table_name.replace('cm_', '').replace('_', ' ')
+
+
+def _describe_from_suffix_rule(col_lower: str, rule) -> str:
+    """Apply a suffix rule: strip its fragments to get the entity and fill the template"""
+    fragments, template = rule
+    entity = col_lower
+    for fragment in fragments:
+        entity = entity.replace(fragment, '')
+    return template.format(entity.replace('_', ' '))
+
 
 class RealPostgresSchemaAnalyzer:
     """
@@ -45,16 +358,79 @@ class RealPostgresSchemaAnalyzer:
                 port=port,
                 connect_timeout=10
             )
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+            # Plain tuple cursor: rows that need names go through _fetchall_dicts
+            self.cursor = self.conn.cursor()
+            # schema -> table_name -> prefetched metadata (see prefetch_all_metadata)
+            self._meta_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            self._prefetched_schemas = set()  # schemas whose metadata was fetched in full
+            # udt_name -> enum labels, or None for non-enum types already looked up
+            self._enum_cache: Dict[str, Optional[List[str]]] = {}
+            self._enums_prefetched = False
+            self._prepared: Set[str] = set()  # server-side prepared statement names
+            # (schema, table) -> pg_class OID, or None for relations not found
+            self._relids: Dict[tuple, Optional[int]] = {}
+            # A connection just opened needs no SELECT 1 round-trip to prove it works
+            self._connection_verified = True
             print(f"✓ Connected to database: {database}")
         except Exception as e:
             print(f"✗ Failed to connect to database: {e}")
             sys.exit(1)
     
+    def _fetchall_dicts(self) -> List[Dict[str, Any]]:
+        """Rows of the last query as plain dicts, reading the column names once per result"""
+        return _rows_as_dicts(self.cursor)
+    
+    def _relid(self, schema: str, table: str) -> Optional[int]:
+        """pg_class OID of schema.table, looked up once and remembered"""
+        key = (schema, table)
+        if key not in self._relids:
+            query = """
+                SELECT c.oid
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                AND c.relname = %s
+            """
+            try:
+                self._execute_prepared('table_relid', query, key)
+                row = self.cursor.fetchone()
+            except Exception as e:
+                self.conn.rollback()
+                return None
+            self._relids[key] = row[0] if row else None
+        return self._relids[key]
+    
+    def _execute_prepared(self, name: str, query: str, params):
+        """
+        Execute a %s- or %(name)s-parameterized query as a server-side prepared
+        statement, preparing it on first use so repeat calls skip parsing and
+        planning.
+        """
+        if isinstance(params, dict):
+            # Named parameters become $1..$n in the dict's order
+            names = list(params)
+            numbers = {key: i for i, key in enumerate(names, 1)}
+            params = tuple(params[key] for key in names)
+        if name not in self._prepared:
+            positional = iter(range(1, len(params) + 1))
+            
+            def placeholder(match) -> str:
+                if match.group(0) == '%%':
+                    return '%'
+                key = match.group(1)
+                return f"${numbers[key] if key is not None else next(positional)}"
+            
+            self.cursor.execute(f"PREPARE {name} AS {_PLACEHOLDER_RE.sub(placeholder, query)}")
+            self._prepared.add(name)
+        self.cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    
     def test_connection(self) -> bool:
-        """Test if we can query the database"""
+        """Test if we can query the database, skipping the ping once that is known"""
+        if self._connection_verified:
+            return True
         try:
             self.cursor.execute("SELECT 1")
+            self._connection_verified = True
             return True
         except Exception as e:
             print(f"✗ Database connection test failed: {e}")
@@ -63,50 +439,225 @@ class RealPostgresSchemaAnalyzer:
     def get_tables_and_views(self, schema: str) -> List[Dict[str, Any]]:
         """Get all tables and views in the schema - REAL DATA ONLY"""
         query = """
-            SELECT 
-                table_name,
-                table_type
-            FROM information_schema.tables
-            WHERE table_schema = %s
-            AND table_type IN ('BASE TABLE', 'VIEW')
-            ORDER BY table_name;
+            SELECT
+                c.relname AS table_name,
+                CASE WHEN c.relkind = 'v' THEN 'VIEW' ELSE 'BASE TABLE' END AS table_type,
+                c.oid
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+            AND c.relkind IN ('r', 'p', 'v')
+            ORDER BY c.relname;
         """
         try:
-            self.cursor.execute(query, (schema,))
-            results = self.cursor.fetchall()
+            self._execute_prepared('schema_tables', query, (schema,))
+            results = []
+            # The OIDs are kept so per-table queries can skip name resolution
+            for table_name, table_type, relid in self.cursor.fetchall():
+                self._relids[(schema, table_name)] = relid
+                results.append({'table_name': table_name, 'table_type': table_type})
             print(f"✓ Found {len(results)} tables/views in schema '{schema}'")
             return results
         except Exception as e:
             print(f"✗ Failed to get tables: {e}")
             return []
     
+    def _schema_query_params(self, schema: str, tables: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Parameters for the schema-wide queries. A table list is passed as the
+        tables' OIDs (already known from get_tables_and_views), so the catalogs
+        are filtered by key instead of by name.
+        """
+        relids = None
+        if tables is not None:
+            relids = [relid for relid in (self._relid(schema, table) for table in tables) if relid is not None]
+        return {'schema': schema, 'relids': relids}
+
+    def prefetch_all_metadata(self, schema: str, tables: Optional[List[str]] = None) -> bool:
+        """
+        Fetch columns, primary keys, foreign keys, referencing tables and enum
+        values for every table in the schema (or only the given tables) in a
+        single round-trip.
+
+        Results are cached so the per-table getters below answer from memory
+        instead of issuing four or more queries per table.
+        """
+        query = f"""
+            WITH cols AS (
+                SELECT
+                    c.table_name,
+                    json_agg(json_build_object(
+                        'column_name', c.column_name,
+                        'data_type', c.data_type,
+                        'character_maximum_length', c.character_maximum_length,
+                        'numeric_precision', c.numeric_precision,
+                        'numeric_scale', c.numeric_scale,
+                        'is_nullable', c.is_nullable,
+                        'column_default', c.column_default,
+                        'udt_name', c.udt_name,
+                        'column_comment', c.column_comment
+                    ) ORDER BY c.ordinal_position) AS columns
+                FROM ({_CATALOG_COLUMNS}) c
+                WHERE c.table_schema = %(schema)s
+                AND (%(relids)s::oid[] IS NULL OR c.relid = ANY(%(relids)s::oid[]))
+                GROUP BY c.table_name
+            ),
+            pks AS (
+                SELECT
+                    cl.relname AS table_name,
+                    string_agg(a.attname, ',' ORDER BY a.attnum) AS primary_key
+                FROM pg_index i
+                JOIN pg_class cl ON cl.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = cl.relnamespace
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                WHERE n.nspname = %(schema)s
+                AND (%(relids)s::oid[] IS NULL OR i.indrelid = ANY(%(relids)s::oid[]))
+                AND i.indisprimary
+                GROUP BY cl.relname
+            ),
+            fk_rows AS (
+                SELECT *
+                FROM ({_FOREIGN_KEY_COLUMNS}) fk
+                WHERE (fk.table_schema = %(schema)s
+                       AND (%(relids)s::oid[] IS NULL OR fk.relid = ANY(%(relids)s::oid[])))
+                OR (fk.foreign_table_schema = %(schema)s
+                    AND (%(relids)s::oid[] IS NULL OR fk.foreign_relid = ANY(%(relids)s::oid[])))
+            ),
+            fks AS (
+                SELECT
+                    table_name,
+                    json_agg(json_build_object(
+                        'column_name', column_name,
+                        'foreign_table_schema', foreign_table_schema,
+                        'foreign_table_name', foreign_table_name,
+                        'foreign_column_name', foreign_column_name,
+                        'constraint_name', constraint_name
+                    )) AS foreign_keys
+                FROM fk_rows
+                WHERE table_schema = %(schema)s
+                GROUP BY table_name
+            ),
+            refs AS (
+                SELECT
+                    foreign_table_name AS table_name,
+                    jsonb_agg(DISTINCT jsonb_build_object(
+                        'table_schema', table_schema,
+                        'table_name', table_name,
+                        'column_name', column_name,
+                        'referenced_column_name', foreign_column_name
+                    )) AS referenced_by
+                FROM fk_rows
+                WHERE foreign_table_schema = %(schema)s
+                GROUP BY foreign_table_name
+            ),
+            enums AS (
+                SELECT
+                    t.typname,
+                    json_agg(e.enumlabel ORDER BY e.enumsortorder) AS labels
+                FROM pg_type t
+                JOIN pg_enum e ON t.oid = e.enumtypid
+                GROUP BY t.typname
+            )
+            SELECT json_build_object(
+                'tables', (
+                    SELECT json_object_agg(cols.table_name, json_build_object(
+                        'columns', cols.columns,
+                        'primary_key', pks.primary_key,
+                        'foreign_keys', COALESCE(fks.foreign_keys, '[]'::json),
+                        'referenced_by', COALESCE(refs.referenced_by, '[]'::jsonb)
+                    ))
+                    FROM cols
+                    LEFT JOIN pks USING (table_name)
+                    LEFT JOIN fks USING (table_name)
+                    LEFT JOIN refs USING (table_name)
+                ),
+                'enums', (SELECT json_object_agg(typname, labels) FROM enums)
+            ) AS metadata;
+        """
+        try:
+            self._execute_prepared('schema_metadata', query, self._schema_query_params(schema, tables))
+            metadata = self.cursor.fetchone()[0]
+        except Exception as e:
+            print(f"✗ Failed to prefetch metadata, falling back to per-table queries: {e}")
+            self.conn.rollback()
+            return False
+
+        prefetched = metadata['tables'] or {}
+        self._store_prefetched(schema, prefetched, tables)
+        self._enum_cache.update(metadata['enums'] or {})
+        self._enums_prefetched = True
+        print(f"✓ Prefetched metadata for {len(prefetched)} tables")
+        return True
+
+    def _store_prefetched(self, schema: str, prefetched: Dict[str, Dict[str, Any]],
+                          tables: Optional[List[str]]):
+        """
+        Cache metadata fetched for a whole schema, or for just the listed
+        tables; listed tables with no rows are cached as empty.
+        """
+        if tables is None:
+            self._meta_cache[schema] = prefetched
+            self._prefetched_schemas.add(schema)
+            return
+        cache = self._meta_cache.setdefault(schema, {})
+        for table in tables:
+            cache[table] = prefetched.get(table, _EMPTY_TABLE_METADATA)
+
+    def _cached_metadata(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
+        """Prefetched metadata for a table, or None if it has not been prefetched"""
+        tables = self._meta_cache.get(schema, {})
+        if table in tables:
+            return tables[table]
+        if schema in self._prefetched_schemas:
+            return _EMPTY_TABLE_METADATA
+        return None
+
     def get_columns(self, schema: str, table: str) -> List[Dict[str, Any]]:
         """Get REAL columns for a table with their actual metadata"""
-        query = """
-            SELECT 
-                c.column_name,
-                c.data_type,
-                c.character_maximum_length,
-                c.numeric_precision,
-                c.numeric_scale,
-                c.is_nullable,
-                c.column_default,
-                c.udt_name,
-                col_description((quote_ident(c.table_schema)||'.'||quote_ident(c.table_name))::regclass, c.ordinal_position) as column_comment
-            FROM information_schema.columns c
-            WHERE c.table_schema = %s
-            AND c.table_name = %s
-            ORDER BY c.ordinal_position;
-        """
+        cached = self._cached_metadata(schema, table)
+        if cached is not None:
+            return cached['columns']
+
         try:
-            self.cursor.execute(query, (schema, table))
-            return self.cursor.fetchall()
+            self._execute_prepared('table_columns', _COLUMNS_QUERY, (self._relid(schema, table),))
+            return self._fetchall_dicts()
         except Exception as e:
             print(f"  ✗ Failed to get columns for {table}: {e}")
             return []
     
+    def prefetch_enum_values(self) -> bool:
+        """Load every enum type's values in one query so lookups never hit the database"""
+        query = """
+            SELECT
+                t.typname,
+                array_agg(e.enumlabel ORDER BY e.enumsortorder) AS labels
+            FROM pg_type t
+            JOIN pg_enum e ON t.oid = e.enumtypid
+            GROUP BY t.typname;
+        """
+        try:
+            # Server-side cursor: rows arrive in ENUM_PREFETCH_ITERSIZE batches
+            # rather than the whole result being buffered client-side at once
+            with self.conn.cursor(name='enum_prefetch') as cursor:
+                cursor.itersize = ENUM_PREFETCH_ITERSIZE
+                cursor.execute(query)
+                enums = dict(cursor)  # (typname, labels) rows
+        except Exception as e:
+            print(f"✗ Failed to prefetch enum values: {e}")
+            self.conn.rollback()
+            return False
+
+        self._enum_cache.update(enums)
+        self._enums_prefetched = True
+        return True
+
     def get_enum_values(self, udt_name: str) -> Optional[List[str]]:
         """Get actual enum values from database"""
+        if udt_name in self._enum_cache:
+            return self._enum_cache[udt_name]
+        if self._enums_prefetched:
+            return None
+
         query = """
             SELECT e.enumlabel
             FROM pg_type t
@@ -115,81 +666,52 @@ class RealPostgresSchemaAnalyzer:
             ORDER BY e.enumsortorder;
         """
         try:
-            self.cursor.execute(query, (udt_name,))
+            self._execute_prepared('enum_values', query, (udt_name,))
             results = self.cursor.fetchall()
-            if results:
-                return [r['enumlabel'] for r in results]
         except Exception as e:
-            pass
-        return None
+            return None
+
+        # Memoized either way: the same udt_name recurs across columns and tables
+        values = [label for (label,) in results] or None
+        self._enum_cache[udt_name] = values
+        return values
     
     def get_primary_key(self, schema: str, table: str) -> Optional[str]:
         """Get REAL primary key column(s) for a table"""
-        query = """
-            SELECT a.attname
-            FROM pg_index i
-            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-            WHERE i.indrelid = (quote_ident(%s)||'.'||quote_ident(%s))::regclass
-            AND i.indisprimary
-            ORDER BY a.attnum;
-        """
+        cached = self._cached_metadata(schema, table)
+        if cached is not None:
+            return cached['primary_key']
+
         try:
-            self.cursor.execute(query, (schema, table))
+            self._execute_prepared('table_primary_key', _PRIMARY_KEY_QUERY, (self._relid(schema, table),))
             results = self.cursor.fetchall()
             if results:
-                return results[0]['attname'] if len(results) == 1 else ','.join([r['attname'] for r in results])
+                return ','.join([attname for (attname,) in results])
         except Exception as e:
             pass
         return None
     
     def get_foreign_keys(self, schema: str, table: str) -> List[Dict[str, Any]]:
         """Get REAL foreign key relationships"""
-        query = """
-            SELECT
-                kcu.column_name,
-                ccu.table_schema AS foreign_table_schema,
-                ccu.table_name AS foreign_table_name,
-                ccu.column_name AS foreign_column_name,
-                tc.constraint_name
-            FROM information_schema.table_constraints AS tc
-            JOIN information_schema.key_column_usage AS kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-            JOIN information_schema.constraint_column_usage AS ccu
-                ON ccu.constraint_name = tc.constraint_name
-                AND ccu.table_schema = tc.table_schema
-            WHERE tc.constraint_type = 'FOREIGN KEY'
-            AND tc.table_schema = %s
-            AND tc.table_name = %s;
-        """
+        cached = self._cached_metadata(schema, table)
+        if cached is not None:
+            return cached['foreign_keys']
+
         try:
-            self.cursor.execute(query, (schema, table))
-            return self.cursor.fetchall()
+            self._execute_prepared('table_foreign_keys', _FOREIGN_KEYS_QUERY, (schema, table))
+            return self._fetchall_dicts()
         except Exception as e:
             return []
     
     def get_referenced_by(self, schema: str, table: str) -> List[Dict[str, Any]]:
         """Get tables that reference this table via foreign keys"""
-        query = """
-            SELECT DISTINCT
-                tc.table_schema,
-                tc.table_name,
-                kcu.column_name,
-                ccu.column_name AS referenced_column_name
-            FROM information_schema.table_constraints AS tc
-            JOIN information_schema.key_column_usage AS kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-            JOIN information_schema.constraint_column_usage AS ccu
-                ON ccu.constraint_name = tc.constraint_name
-                AND ccu.table_schema = tc.table_schema
-            WHERE tc.constraint_type = 'FOREIGN KEY'
-            AND ccu.table_schema = %s
-            AND ccu.table_name = %s;
-        """
+        cached = self._cached_metadata(schema, table)
+        if cached is not None:
+            return cached['referenced_by']
+
         try:
-            self.cursor.execute(query, (schema, table))
-            return self.cursor.fetchall()
+            self._execute_prepared('table_referenced_by', _REFERENCED_BY_QUERY, (schema, table))
+            return self._fetchall_dicts()
         except Exception as e:
             return []
     
@@ -202,47 +724,19 @@ class RealPostgresSchemaAnalyzer:
         keywords.update(table_lower.split())
         
         # Add keywords based on actual column names and table context
-        table_lower_full = table_name.lower()
-        
-        if 'alert' in table_lower_full:
-            keywords.update(['alert', 'notification', 'warning', 'incident', 'event', 'trigger'])
-            if 'type' in table_lower_full:
-                keywords.update(['alarm', 'message', 'severity', 'category', 'classification'])
-            else:
-                keywords.update(['alarm', 'message', 'severity', 'emergency'])
-        
-        if 'case' in table_lower_full:
-            keywords.update(['case', 'ticket', 'issue', 'problem', 'support', 'request', 'incident'])
-            if not 'alert' in table_lower_full:
-                keywords.update(['service request', 'bug', 'task', 'work item', 'assignment'])
-        
-        if 'user' in table_lower_full and 'role' not in table_lower_full:
-            keywords.update(['user', 'person', 'employee', 'member', 'account', 'profile', 'team', 'people', 'staff', 'operator', 'admin', 'contact', 'assignee'])
-        
-        if 'role' in table_lower_full:
-            if 'mapping' in table_lower_full or 'user' in table_lower_full:
-                keywords.update(['user role', 'role mapping', 'role assignment', 'permission', 'access', 'user access', 'role membership', 'authorization', 'user permission'])
-            else:
-                keywords.update(['role', 'permission', 'access level', 'user role', 'security role', 'access rights', 'privileges', 'authorization', 'admin', 'operator', 'viewer'])
-        
-        if 'type' in table_lower_full:
-            keywords.update(['type', 'category', 'classification'])
-        
-        # Add from column names
-        for col in columns:
-            col_name = col['column_name'].lower()
-            if 'status' in col_name:
-                keywords.add('status')
-            if 'priority' in col_name:
-                keywords.add('priority')
-            if 'workflow' in col_name:
-                keywords.add('workflow')
-            if 'step' in col_name:
-                keywords.add('step')
-        
-        return sorted(list(keywords))
+        table_tags = _name_tags(table_name.lower())
+        for required, excluded, rule_keywords in _TABLE_KEYWORD_RULES:
+            if required <= table_tags and not excluded & table_tags:
+                keywords |= rule_keywords
+        
+        # Add from column names; the tags found are the keywords themselves
+        col_names = ' '.join(col['column_name'] for col in columns).lower()
+        keywords |= _name_tags(col_names) & _COLUMN_KEYWORDS
+        
+        return sorted(keywords)
     
-    def generate_description_from_actual_data(self, table_name: str, columns: List[Dict]) -> str:
+    def generate_description_from_actual_data(self, table_name: str, columns: List[Dict],
+                                              entity_name: Optional[str] = None) -> str:
         """Generate description based on REAL table structure"""
         col_names = {col['column_name'].lower() for col in columns}
         table_lower = table_name.lower()
@@ -272,155 +766,111 @@ class RealPostgresSchemaAnalyzer:
             return "User-role relationship mapping, role assignments, user permissions mapping, and access control associations. This junction table manages the many-to-many relationship between users and roles, allowing users to have multiple roles and roles to be assigned to multiple users. Use this when user asks about user roles, role assignments, who has what role, user permissions, access levels, role membership, or user-role relationships."
         
         # Generic descriptions for other tables
-        elif 'workflow' in table_lower:
+        table_tags = _name_tags(table_lower)
+        if 'workflow' in table_tags:
             return f"Workflow configuration and management. Contains workflow definitions, steps, transitions, and execution tracking. Use this when querying workflow information, process flows, or workflow execution status."
         
-        elif 'step' in table_lower:
+        elif 'step' in table_tags:
             return f"Workflow step definitions and execution tracking. Contains information about individual steps in workflows including their status, assignments, and completion details. Use this when querying workflow steps or process stages."
         
-        elif 'mapping' in table_lower or 'junction' in table_lower:
+        elif 'mapping' in table_tags or 'junction' in table_tags:
             entities = table_name.replace('cm_', '').replace('_mapping', '').replace('_', ' and ')
             return f"Relationship mapping table managing associations between {entities}. This junction table enables many-to-many relationships. Use this for queries about {entities} relationships and associations."
         
-        elif 'type' in table_lower or 'category' in table_lower:
+        elif 'type' in table_tags or 'category' in table_tags:
             entity = table_name.replace('cm_', '').replace('_type', '').replace('_', ' ')
             return f"Type definitions and categories for {entity}. This lookup table contains classification and configuration data. Use this when querying {entity} types, categories, or classifications."
         
-        elif 'audit' in table_lower or 'log' in table_lower:
+        elif 'audit' in table_tags or 'log' in table_tags:
             return f"Audit trail and logging records. Tracks changes, actions, and events in the system for compliance and tracking purposes. Use this when querying system activity, change history, or audit information."
         
         else:
-            entity = table_name.replace('cm_', '').replace('_', ' ')
+            entity = entity_name or _entity_name(table_name)
             return f"Data table for {entity}. Contains {len(columns)} columns of information related to {entity}. Use this when querying {entity} information."
     
-    def generate_column_description(self, table_name: str, column_name: str, data_type: str, column_comment: Optional[str]) -> str:
-        """Generate detailed description for a column"""
+    def generate_column_description(self, table_name: str, column_name: str, data_type: str, column_comment: Optional[str],
+                                    entity_name: Optional[str] = None, col_lower: Optional[str] = None) -> str:
+        """
+        Generate detailed description for a column
+
+        entity_name and col_lower may be passed in when the caller already has
+        them, so they are not recomputed for every column of a table.
+        """
         if column_comment:
             return column_comment
         
-        col_lower = column_name.lower()
-        table_lower = table_name.lower()
+        if col_lower is None:
+            col_lower = column_name.lower()
+        
+        # Exact column names
+        description = _COLUMN_EXACT_DESCRIPTIONS.get(col_lower)
+        if description is not None:
+            return description
+        template = _COLUMN_ENTITY_TEMPLATES.get(col_lower)
+        if template is not None:
+            return template.format(entity_name or _entity_name(table_name))
+        
+        prefix, suffix = _COLUMN_NAME_RE.fullmatch(col_lower).group('prefix', 'suffix')
         
-        # ID fields
-        if col_lower == 'id':
-            return f"Unique identifier for the {table_name.replace('cm_', '').replace('_', ' ')} record"
-        elif col_lower.endswith('_id'):
-            ref_entity = col_lower.replace('_id', '').replace('_', ' ')
-            if col_lower == 'alert_id' and 'alert' in table_lower:
-                return "Unique identifier for the alert"
-            elif col_lower == 'case_id' and 'case' in table_lower:
-                return "Unique identifier for the case"
-            elif col_lower == 'user_id' and 'user' in table_lower:
-                return "Unique identifier for the user"
-            elif col_lower == 'role_id' and 'role' in table_lower:
-                return "Unique identifier for the role"
-            elif 'type' in col_lower:
-                return f"Foreign key reference to {ref_entity} definition"
-            elif col_lower == 'owner_id':
-                return "User ID of the owner or person responsible"
-            elif col_lower == 'created_by':
-                return "User ID of the person who created this record"
-            elif col_lower == 'updated_by':
-                return "User ID of the person who last updated this record"
-            elif col_lower == 'assigned_to':
-                return "User ID of the person assigned to this item"
-            else:
-                return f"Foreign key reference to {ref_entity}"
-        
-        # Name fields
-        elif col_lower.endswith('_name'):
-            entity = col_lower.replace('_name', '').replace('_', ' ')
-            return f"Name of the {entity}"
-        elif col_lower == 'name':
-            return "Name"
-        
-        # Code/identifier fields
-        elif col_lower.endswith('_code') or col_lower.endswith('_slug'):
-            entity = col_lower.replace('_code', '').replace('_slug', '').replace('_', ' ')
-            return f"Unique code or identifier for the {entity}"
-        
-        # Number/count fields
-        elif col_lower.endswith('_number'):
-            entity = col_lower.replace('_number', '').replace('_', ' ')
-            return f"Human-readable {entity} number"
-        
-        # Status and state
-        elif col_lower == 'status':
-            return f"Current status of the {table_name.replace('cm_', '').replace('_', ' ')} in its lifecycle"
-        elif col_lower == 'priority':
-            return "Priority level indicating urgency"
-        elif col_lower == 'severity':
-            return "Severity level indicating impact"
+        # Key, name, code and number suffixes
+        if suffix is not None:
+            if suffix == 'id':
+                return self._describe_id_column(table_name, col_lower)
+            rule = _COLUMN_KEY_SUFFIX_RULES.get(suffix)
+            if rule is not None:
+                return _describe_from_suffix_rule(col_lower, rule)
         
         # Scores
-        elif 'score' in col_lower:
+        if 'score' in col_lower:
             return "Calculated risk or relevance score"
         
         # Boolean flags
-        elif col_lower.startswith('is_'):
+        if prefix == 'is':
             condition = col_lower.replace('is_', '').replace('_', ' ')
             return f"Flag indicating whether {condition}"
-        elif col_lower.startswith('has_'):
+        if prefix == 'has':
             condition = col_lower.replace('has_', '').replace('_', ' ')
             return f"Flag indicating if it has {condition}"
         
         # Timestamps
-        elif col_lower == 'created_at':
-            return "Timestamp when the record was created"
-        elif col_lower == 'updated_at':
-            return "Timestamp of the last update to the record"
-        elif col_lower == 'deleted_at':
-            return "Timestamp when the record was soft deleted"
-        elif col_lower.endswith('_at'):
-            event = col_lower.replace('_at', '').replace('_', ' ')
-            return f"Timestamp when {event}"
-        elif col_lower.endswith('_date'):
-            event = col_lower.replace('_date', '').replace('_', ' ')
-            return f"Date for {event}"
-        
-        # Description and details
-        elif col_lower == 'description':
-            return "Detailed description"
-        elif col_lower == 'details':
-            return "Additional details and information"
-        elif col_lower == 'notes':
-            return "Additional notes or comments"
-        elif col_lower == 'resolution':
-            return "Description of how the issue was resolved"
+        if suffix is not None:
+            rule = _COLUMN_TIME_SUFFIX_RULES.get(suffix)
+            if rule is not None:
+                return _describe_from_suffix_rule(col_lower, rule)
         
         # Contact information
-        elif 'email' in col_lower:
-            return "Email address"
-        elif 'phone' in col_lower:
-            return "Phone number"
-        elif 'address' in col_lower:
-            return "Address information"
-        
-        # Organization/hierarchy
-        elif col_lower.startswith('org_'):
+        for needle, description in _COLUMN_CONTACT_DESCRIPTIONS:
+            if needle in col_lower:
+                return description
+        
+        # Organization/hierarchy and workflow
+        if prefix == 'org':
             entity = col_lower.replace('org_', '').replace('_', ' ')
             return f"Organization {entity}"
-        elif 'branch' in col_lower:
-            return "Branch identifier or information"
-        elif 'department' in col_lower:
-            return "Department information"
-        
-        # Workflow related
-        elif 'workflow' in col_lower:
-            return "Workflow identifier or information"
-        elif 'step' in col_lower:
-            return "Workflow step identifier or information"
-        elif 'transition' in col_lower:
-            return "Workflow transition information"
+        for needle, description in _COLUMN_CONTEXT_DESCRIPTIONS:
+            if needle in col_lower:
+                return description
         
         # JSON/complex fields
-        elif data_type in ['jsonb', 'json']:
+        if data_type in ['jsonb', 'json']:
             entity = col_lower.replace('_', ' ')
             return f"JSON object containing {entity}"
         
         # Default
-        else:
-            return f"{column_name.replace('_', ' ').title()}"
+        return f"{column_name.replace('_', ' ').title()}"
+    
+    def _describe_id_column(self, table_name: str, col_lower: str) -> str:
+        """Describe a column ending in _id: the table's own key or a foreign key"""
+        own_key = _OWN_ID_COLUMNS.get(col_lower)
+        if own_key is not None and own_key[0] in table_name.lower():
+            return own_key[1]
+        
+        ref_entity = col_lower.replace('_id', '').replace('_', ' ')
+        if 'type' in col_lower:
+            return f"Foreign key reference to {ref_entity} definition"
+        elif col_lower == 'owner_id':
+            return "User ID of the owner or person responsible"
+        return f"Foreign key reference to {ref_entity}"
     
     def map_postgres_type(self, col: Dict) -> Dict[str, Any]:
         """Map PostgreSQL type to YAML format using REAL data"""
@@ -461,8 +911,14 @@ class RealPostgresSchemaAnalyzer:
         
         return {'type': type_map.get(pg_type, pg_type)}
     
-    def generate_yaml_config(self, schema: str, table_filter: List[str] = None, output_file: str = None) -> Dict:
-        """Generate YAML config using ONLY real database data"""
+    def generate_yaml_config(self, schema: str, table_filter: List[str] = None, output_file: str = None,
+                             writer: Optional[_ConfigYamlWriter] = None) -> Dict:
+        """
+        Generate YAML config using ONLY real database data.
+        
+        Tables go to writer when one is given (its caller keeps it open across
+        schemas), else to output_file.
+        """
         
         if not self.test_connection():
             print("Cannot proceed without database connection")
@@ -478,122 +934,133 @@ class RealPostgresSchemaAnalyzer:
         
         # Filter tables if specified
         if table_filter:
-            tables_data = [t for t in tables_data if t['table_name'] in table_filter]
+            wanted = set(table_filter)  # list membership would rescan the filter per table
+            tables_data = [t for t in tables_data if t['table_name'] in wanted]
             print(f"✓ Filtered to {len(tables_data)} tables: {', '.join(table_filter)}\n")
         
+        # One round-trip for all per-table metadata; if that fails, the getters
+        # below fall back to plain per-table queries. A table filter is pushed
+        # down so only the listed tables are read
+        filtered_tables = [t['table_name'] for t in tables_data] if table_filter else None
+        if not self.prefetch_all_metadata(schema, filtered_tables):
+            self.prefetch_enum_values()
+        
         config = {'tables': []}
         
-        for table_info in tables_data:
-            table_name = table_info['table_name']
-            print(f"Processing: {table_name}")
+        # Each table is written out as soon as it is built, so only one table's
+        # YAML node graph is alive at a time and the file shows progress
+        with self._config_writer(output_file, writer) as writer:
+            for table_info in tables_data:
+                table_name = table_info['table_name']
+                entity_name = _entity_name(table_name)
+                print(f"Processing: {table_name}")
             
-            # Get REAL columns
-            columns = self.get_columns(schema, table_name)
-            if not columns:
-                print(f"  ✗ No columns found, skipping table\n")
-                continue
+                # Get REAL columns
+                columns = self.get_columns(schema, table_name)
+                if not columns:
+                    print(f"  ✗ No columns found, skipping table\n")
+                    continue
             
-            print(f"  ✓ Found {len(columns)} columns")
+                print(f"  ✓ Found {len(columns)} columns")
             
-            # Get REAL relationships
-            primary_key = self.get_primary_key(schema, table_name)
-            foreign_keys = self.get_foreign_keys(schema, table_name)
-            referenced_by = self.get_referenced_by(schema, table_name)
+                # Get REAL relationships
+                primary_key = self.get_primary_key(schema, table_name)
+                foreign_keys = self.get_foreign_keys(schema, table_name)
+                referenced_by = self.get_referenced_by(schema, table_name)
             
-            # Build searchable columns from REAL column names
-            searchable_columns = [col['column_name'] for col in columns]
+                # Build searchable columns from REAL column names
+                searchable_columns = [col['column_name'] for col in columns]
             
-            # Build common joins from REAL foreign keys
-            common_joins = []
-            for fk in foreign_keys:
-                common_joins.append({
-                    'table': fk['foreign_table_name'],
-                    'schema': fk['foreign_table_schema'],
-                    'join_on': f"{fk['column_name']} = {fk['foreign_column_name']}",
-                    'description': f"Join with {fk['foreign_table_name'].replace('cm_', '').replace('_', ' ')} to get related information"
-                })
+                # Build common joins from REAL foreign keys
+                common_joins = []
+                for fk in foreign_keys:
+                    common_joins.append({
+                        'table': fk['foreign_table_name'],
+                        'schema': fk['foreign_table_schema'],
+                        'join_on': f"{fk['column_name']} = {fk['foreign_column_name']}",
+                        'description': f"Join with {_entity_name(fk['foreign_table_name'])} to get related information"
+                    })
             
-            for ref in referenced_by:
-                common_joins.append({
-                    'table': ref['table_name'],
-                    'schema': ref['table_schema'],
-                    'join_on': f"{ref['referenced_column_name']} = {ref['column_name']}",
-                    'description': f"Join with {ref['table_name'].replace('cm_', '').replace('_', ' ')} to get related records"
-                })
+                for ref in referenced_by:
+                    common_joins.append({
+                        'table': ref['table_name'],
+                        'schema': ref['table_schema'],
+                        'join_on': f"{ref['referenced_column_name']} = {ref['column_name']}",
+                        'description': f"Join with {_entity_name(ref['table_name'])} to get related records"
+                    })
             
-            # Build column metadata from REAL columns - MATCHING EXACT FORMAT
-            column_metadata = {}
-            for col in columns:
-                col_meta = {}
-                
-                # Type first (matching your format)
-                type_info = self.map_postgres_type(col)
-                col_meta['type'] = type_info['type']
-                
-                # Description second
-                col_meta['description'] = self.generate_column_description(
-                    table_name,
-                    col['column_name'],
-                    col['data_type'],
-                    col['column_comment']
-                )
+                # Build column metadata from REAL columns - MATCHING EXACT FORMAT
+                column_metadata = {}
+                for col in columns:
+                    col_lower = col['column_name'].lower()
+                    type_info = self.map_postgres_type(col)
                 
-                # Then nullable
-                col_meta['nullable'] = col['is_nullable'] == 'YES'
+                    # Type, description, then nullable (matching your format),
+                    # built as one literal rather than key by key
+                    col_meta = {
+                        'type': type_info['type'],
+                        'description': self.generate_column_description(
+                            table_name,
+                            col['column_name'],
+                            col['data_type'],
+                            col['column_comment'],
+                            entity_name=entity_name,
+                            col_lower=col_lower
+                        ),
+                        'nullable': col['is_nullable'] == 'YES',
+                    }
                 
-                # Add enum values if exists
-                if 'possible_values' in type_info:
-                    col_meta['possible_values'] = type_info['possible_values']
-                    col_meta['case_sensitive'] = type_info['case_sensitive']
+                    # Add enum values if exists
+                    if 'possible_values' in type_info:
+                        col_meta['possible_values'] = type_info['possible_values']
+                        col_meta['case_sensitive'] = type_info['case_sensitive']
                 
-                # Add max length for varchar
-                if col['character_maximum_length']:
-                    col_meta['max_length'] = col['character_maximum_length']
+                    # Add max length for varchar
+                    if col['character_maximum_length']:
+                        col_meta['max_length'] = col['character_maximum_length']
                 
-                # Add range for numeric if it looks like a score
-                if col['data_type'] in ['numeric', 'double precision'] and 'score' in col['column_name'].lower():
-                    col_meta['range'] = [0, 1000]
+                    # Add range for numeric if it looks like a score
+                    if col['data_type'] in ['numeric', 'double precision'] and 'score' in col_lower:
+                        col_meta['range'] = [0, 1000]
                 
-                column_metadata[col['column_name']] = col_meta
+                    column_metadata[col['column_name']] = col_meta
             
-            # Build table config in exact order
-            table_config = {
-                'name': table_name,
-                'schema': schema,
-                'description': self.generate_description_from_actual_data(table_name, columns),
-                'keywords': self.generate_keywords_from_actual_data(table_name, columns),
-            }
+                # Build table config in exact order
+                table_config = {
+                    'name': table_name,
+                    'schema': schema,
+                    'description': self.generate_description_from_actual_data(table_name, columns, entity_name),
+                    'keywords': self.generate_keywords_from_actual_data(table_name, columns),
+                }
             
-            # Add primary key if exists
-            if primary_key:
-                table_config['primary_key'] = primary_key
+                # Add primary key if exists
+                if primary_key:
+                    table_config['primary_key'] = primary_key
             
-            # Add searchable columns
-            table_config['searchable_columns'] = searchable_columns
+                # Add searchable columns
+                table_config['searchable_columns'] = searchable_columns
             
-            # Add common joins if any
-            if common_joins:
-                table_config['common_joins'] = common_joins
+                # Add common joins if any
+                if common_joins:
+                    table_config['common_joins'] = common_joins
             
-            # Add column metadata
-            table_config['column_metadata'] = column_metadata
+                # Add column metadata
+                table_config['column_metadata'] = column_metadata
             
-            config['tables'].append(table_config)
-            print(f"  ✓ Configuration generated\n")
-        
-        # Write to file if specified
-        if output_file:
-            try:
-                with open(output_file, 'w') as f:
-                    yaml.dump(config, f, Dumper=InlineListDumper, default_flow_style=False, sort_keys=False, allow_unicode=True, width=120)
-                print(f"✓ Configuration written to: {output_file}")
-            except Exception as e:
-                print(f"✗ Failed to write file: {e}")
+                config['tables'].append(table_config)
+                writer.write(table_config)
+                print(f"  ✓ Configuration generated\n")
         
         return config
     
+    @staticmethod
+    def _config_writer(output_file: Optional[str], writer: Optional[_ConfigYamlWriter]):
+        """Context manager yielding writer left open, or a new writer for output_file"""
+        return nullcontext(writer) if writer is not None else _ConfigYamlWriter(output_file)
+    
     def close(self):
         """Close database connection"""
+        self._connection_verified = False
         try:
             self.cursor.close()
             self.conn.close()
@@ -602,8 +1069,14 @@ class RealPostgresSchemaAnalyzer:
             print(f"✗ Error closing connection: {e}")
 
 
+@lru_cache(maxsize=1)
 def load_env_config() -> Dict[str, Any]:
-    """Load database configuration from .env file"""
+    """
+    Load database configuration from .env file.
+
+    The .env file is located and parsed once per process; later calls return
+    the same (read-only) dict.
+    """
     # Try to find .env file in project root
     current_dir = Path(__file__).resolve().parent
     
@@ -673,10 +1146,13 @@ Examples:
   
   # Generate for specific tables only
   python postgre_real_schema_analyzer.py --schema info_alert --tables cm_alerts cm_case cm_users --output config.yaml
+  
+  # Generate for several schemas over one connection, into one file
+  python postgre_real_schema_analyzer.py --schema info_alert info_case --output config.yaml
         '''
     )
     
-    parser.add_argument('--schema', default='info_alert', help='Schema name to analyze (default: info_alert)')
+    parser.add_argument('--schema', nargs='+', default=['info_alert'], help='Schema name(s) to analyze (default: info_alert)')
     parser.add_argument('--tables', nargs='+', help='Specific tables to include (optional, analyzes all if not specified)')
     parser.add_argument('--output', default='schema_config.yaml', help='Output YAML file (default: schema_config.yaml)')
     
@@ -704,11 +1180,21 @@ Examples:
             port=db_config['port']
         )
         
-        config = analyzer.generate_yaml_config(
-            schema=args.schema,
-            table_filter=args.tables,
-            output_file=args.output
-        )
+        # All schemas share one connection and its prepared statements, and
+        # stream their tables into one output file as each table is built
+        tables = []
+        try:
+            with _ConfigYamlWriter(args.output) as writer:
+                for schema in args.schema:
+                    schema_config = analyzer.generate_yaml_config(
+                        schema=schema,
+                        table_filter=args.tables,
+                        writer=writer
+                    )
+                    tables.extend(schema_config.get('tables', []))
+        finally:
+            analyzer.close()
+        config = {'tables': tables}
         
         print(f"\n{'='*60}")
         print("Summary:")
@@ -718,8 +1204,6 @@ Examples:
             print(f"  • {table['name']}: {len(table['column_metadata'])} columns")
         print(f"{'='*60}\n")
         
-        analyzer.close()
-        
     except Exception as e:
         print(f"\n✗ Error: {e}")
         import traceback
@@ -0,0 +1,49 @@
+"""
+Combined Validation Script: Phases 3 and 4
+
+Runs the Phase 3 (orchestration) and Phase 4 (data consolidation) validators
+concurrently in one process, sharing a single connected AnthropicProvider.
+Each phase's output is printed in full, Phase 3 first.
+"""
+
+import asyncio
+import os
+import sys
+
+from validate_phase3 import Phase3Validator
+from validate_phase4 import Phase4Validator
+from app.llm.providers.anthropic_provider import AnthropicProvider
+
+
+async def main():
+    """Main validation entry point."""
+    llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
+    await llm_provider.connect()
+
+    validators = (
+        Phase3Validator(llm_provider, hold_output=True),
+        Phase4Validator(llm_provider, hold_output=True),
+    )
+    try:
+        results = await asyncio.gather(*(v.run_all_validations() for v in validators))
+    finally:
+        await llm_provider.disconnect()
+    for validator in validators:
+        validator._flush(force=True)
+
+    if all(results):
+        print("\n✅ Phase 3 and Phase 4 validation PASSED! Ready for Phase 5.")
+        sys.exit(0)
+    else:
+        print("\n❌ Phase 3 and/or Phase 4 validation FAILED. Please review errors above.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # uvloop (pinned in requirements.txt) when installed, else the default loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,80 +4,86 @@ Validates all infrastructure components are working correctly.
 """
 import asyncio
 import sys
-from pathlib import Path
+from contextvars import ContextVar
 
-# Color codes for terminal output
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-RESET = "\033[0m"
-BOLD = "\033[1m"
+from validation_common import BOLD, GREEN, RED, RESET, YELLOW, scan_paths
+
+# Output lines of the check running in the current context; None prints directly
+_output = ContextVar("output", default=None)
+
+def emit(line=""):
+    """Print a line, or buffer it while checks run concurrently"""
+    lines = _output.get()
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
 
 def print_header(text):
     """Print a formatted header"""
-    print(f"\n{BOLD}{'='*70}{RESET}")
-    print(f"{BOLD}{text.center(70)}{RESET}")
-    print(f"{BOLD}{'='*70}{RESET}\n")
+    emit(f"\n{BOLD}{'='*70}{RESET}")
+    emit(f"{BOLD}{text.center(70)}{RESET}")
+    emit(f"{BOLD}{'='*70}{RESET}\n")
 
 def print_success(text):
     """Print success message"""
-    print(f"{GREEN}✅ {text}{RESET}")
+    emit(f"{GREEN}✅ {text}{RESET}")
 
 def print_error(text):
     """Print error message"""
-    print(f"{RED}❌ {text}{RESET}")
+    emit(f"{RED}❌ {text}{RESET}")
 
 def print_warning(text):
     """Print warning message"""
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    emit(f"{YELLOW}⚠️  {text}{RESET}")
 
 def print_info(text):
     """Print info message"""
-    print(f"   {text}")
-
-async def validate_phase1():
-    """Run all Phase 1 validation checks"""
-
-    print_header("PHASE 1: INFRASTRUCTURE VALIDATION")
-
-    validation_passed = True
+    emit(f"   {text}")
 
-    # Test 1: Directory Structure
-    print(f"{BOLD}📁 Checking Directory Structure...{RESET}")
+def check_directory_structure():
+    """Test 1: Directory Structure"""
+    passed = True
+    emit(f"{BOLD}📁 Checking Directory Structure...{RESET}")
     try:
         required_dirs = [
             "app/intelligence/orchestration",
             "app/intelligence/agents"
         ]
 
-        for dir_path in required_dirs:
-            full_path = Path(dir_path)
-            if full_path.exists():
-                print_success(f"Directory exists: {dir_path}")
-            else:
-                print_error(f"Directory missing: {dir_path}")
-                validation_passed = False
-
         # Check __init__.py files
         init_files = [
             "app/intelligence/orchestration/__init__.py",
             "app/intelligence/agents/__init__.py"
         ]
 
+        # One directory listing per parent instead of a stat() per path
+        entries = scan_paths(required_dirs + init_files)
+
+        for dir_path in required_dirs:
+            if entries[dir_path] is not None:
+                print_success(f"Directory exists: {dir_path}")
+            else:
+                print_error(f"Directory missing: {dir_path}")
+                passed = False
+
         for init_file in init_files:
-            full_path = Path(init_file)
-            if full_path.exists():
+            if entries[init_file] is not None:
                 print_success(f"Init file exists: {init_file}")
             else:
                 print_error(f"Init file missing: {init_file}")
-                validation_passed = False
+                passed = False
 
     except Exception as e:
         print_error(f"Directory validation failed: {e}")
-        validation_passed = False
+        passed = False
+
+    return passed
 
-    # Test 2: Type Definitions
-    print(f"\n{BOLD}📋 Checking Type Definitions...{RESET}")
+def check_type_definitions():
+    """Test 2: Type Definitions"""
+    passed = True
+    emit(f"\n{BOLD}📋 Checking Type Definitions...{RESET}")
     try:
         from app.intelligence.orchestration.types import (
             AgentState, AgentType, DataSourceType,
@@ -88,28 +94,32 @@ async def validate_phase1():
         print_success("All type definitions imported successfully")
 
         # Test enum values
-        assert AgentType.SUPERVISOR.value == "supervisor"
-        assert AgentType.SQL_AGENT.value == "sql_agent"
-        assert AgentType.API_AGENT.value == "api_agent"
+        assert AgentType.SUPERVISOR == "supervisor"
+        assert AgentType.SQL_AGENT == "sql_agent"
+        assert AgentType.API_AGENT == "api_agent"
         print_success("AgentType enum values are correct")
 
-        assert DataSourceType.POSTGRESQL.value == "postgresql"
-        assert DataSourceType.REST_API.value == "rest_api"
+        assert DataSourceType.POSTGRESQL == "postgresql"
+        assert DataSourceType.REST_API == "rest_api"
         print_success("DataSourceType enum values are correct")
 
-        assert ExecutionStepStatus.PENDING.value == "pending"
-        assert ExecutionStepStatus.COMPLETED.value == "completed"
+        assert ExecutionStepStatus.PENDING == "pending"
+        assert ExecutionStepStatus.COMPLETED == "completed"
         print_success("ExecutionStepStatus enum values are correct")
 
     except Exception as e:
         print_error(f"Type definitions validation failed: {e}")
-        validation_passed = False
+        passed = False
 
-    # Test 3: State Management
-    print(f"\n{BOLD}🔄 Checking State Management...{RESET}")
+    return passed
+
+def check_state_management():
+    """Test 3: State Management"""
+    passed = True
+    emit(f"\n{BOLD}🔄 Checking State Management...{RESET}")
     try:
         from app.intelligence.orchestration.state import StateFactory, StateHelper
-        from app.intelligence.orchestration.types import AgentType
+        from app.intelligence.orchestration.types import AgentType, ExecutionStepStatus
 
         # Test StateFactory.create_initial_state
         state = StateFactory.create_initial_state("Test query", "test-session-123")
@@ -158,10 +168,14 @@ async def validate_phase1():
 
     except Exception as e:
         print_error(f"State management validation failed: {e}")
-        validation_passed = False
+        passed = False
+
+    return passed
 
-    # Test 4: Base Node Class
-    print(f"\n{BOLD}🏗️  Checking Base Node Class...{RESET}")
+async def check_base_node():
+    """Test 4: Base Node Class"""
+    passed = True
+    emit(f"\n{BOLD}🏗️  Checking Base Node Class...{RESET}")
     try:
         from app.intelligence.orchestration.base_node import BaseNode, PassthroughNode
         from app.intelligence.orchestration.state import StateFactory
@@ -182,10 +196,14 @@ async def validate_phase1():
 
     except Exception as e:
         print_error(f"Base node validation failed: {e}")
-        validation_passed = False
+        passed = False
 
-    # Test 5: Configuration Settings
-    print(f"\n{BOLD}⚙️  Checking Configuration Settings...{RESET}")
+    return passed
+
+def check_configuration():
+    """Test 5: Configuration Settings"""
+    passed = True
+    emit(f"\n{BOLD}⚙️  Checking Configuration Settings...{RESET}")
     try:
         from app.core.config import get_settings
 
@@ -213,10 +231,14 @@ async def validate_phase1():
 
     except Exception as e:
         print_error(f"Configuration validation failed: {e}")
-        validation_passed = False
+        passed = False
+
+    return passed
 
-    # Test 6: Dependencies
-    print(f"\n{BOLD}📦 Checking Dependencies...{RESET}")
+def check_dependencies():
+    """Test 6: Dependencies"""
+    passed = True
+    emit(f"\n{BOLD}📦 Checking Dependencies...{RESET}")
     try:
         import langgraph
         from langgraph.graph import StateGraph
@@ -233,10 +255,14 @@ async def validate_phase1():
 
     except Exception as e:
         print_error(f"Dependency validation failed: {e}")
-        validation_passed = False
+        passed = False
 
-    # Test 7: Files Created
-    print(f"\n{BOLD}📄 Checking Created Files...{RESET}")
+    return passed
+
+def check_created_files():
+    """Test 7: Files Created"""
+    passed = True
+    emit(f"\n{BOLD}📄 Checking Created Files...{RESET}")
     try:
         required_files = [
             "app/intelligence/orchestration/__init__.py",
@@ -246,18 +272,59 @@ async def validate_phase1():
             "app/intelligence/agents/__init__.py"
         ]
 
+        entries = scan_paths(required_files)
         for file_path in required_files:
-            full_path = Path(file_path)
-            if full_path.exists():
-                size = full_path.stat().st_size
+            entry = entries[file_path]
+            if entry is not None:
+                size = entry.stat().st_size
                 print_success(f"{file_path} ({size} bytes)")
             else:
                 print_error(f"File missing: {file_path}")
-                validation_passed = False
+                passed = False
 
     except Exception as e:
         print_error(f"File validation failed: {e}")
-        validation_passed = False
+        passed = False
+
+    return passed
+
+async def run_check(check):
+    """Run one check with its output buffered; returns (passed, output lines)"""
+    lines = []
+    _output.set(lines)  # local to this check's task and the thread it runs in
+    if asyncio.iscoroutinefunction(check):
+        passed = await check()
+    else:
+        passed = await asyncio.to_thread(check)
+    return passed, lines
+
+async def validate_phase1():
+    """Run all Phase 1 validation checks"""
+    print_header("PHASE 1: INFRASTRUCTURE VALIDATION")
+
+    # The checks are independent, so they run concurrently; their output is
+    # printed afterwards in check order
+    checks = [
+        check_directory_structure,
+        check_type_definitions,
+        check_state_management,
+        check_base_node,
+        check_configuration,
+        check_dependencies,
+        check_created_files,
+    ]
+    results = await asyncio.gather(*(run_check(check) for check in checks), return_exceptions=True)
+
+    validation_passed = True
+    for check, result in zip(checks, results):
+        if isinstance(result, BaseException):
+            print_error(f"{getattr(check, '__name__', check)} crashed: {result}")
+            validation_passed = False
+            continue
+        passed, lines = result
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")  # one write per check
+        validation_passed = validation_passed and passed
 
     # Final Summary
     print_header("VALIDATION SUMMARY")
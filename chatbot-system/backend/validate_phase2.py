@@ -3,47 +3,77 @@ Phase 2 Validation Script
 Validates all specialized agents are working correctly.
 """
 import asyncio
+import importlib.util
 import sys
-from pathlib import Path
 
-# Color codes for terminal output
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-RESET = "\033[0m"
-BOLD = "\033[1m"
+from validation_common import BOLD, GREEN, RED, RESET, YELLOW, scan_paths
+
+# Backend-specific drivers, imported only when the backend is enabled in
+# settings.enabled_backends
+BACKEND_MODULES = {
+    "anthropic": "langchain_anthropic",
+    "postgresql": "asyncpg",
+    "oracle": "oracledb",
+}
+
+# Output lines of the test in progress; flush_output() writes them in one call
+_pending = []
+
+def emit(line=""):
+    """Queue a line of output"""
+    _pending.append(line)
+
+def flush_output():
+    """Write the queued lines with a single write"""
+    if _pending:
+        sys.stdout.write("\n".join(_pending) + "\n")
+        _pending.clear()
 
 def print_header(text):
     """Print a formatted header"""
-    print(f"\n{BOLD}{'='*70}{RESET}")
-    print(f"{BOLD}{text.center(70)}{RESET}")
-    print(f"{BOLD}{'='*70}{RESET}\n")
+    emit(f"\n{BOLD}{'='*70}{RESET}")
+    emit(f"{BOLD}{text.center(70)}{RESET}")
+    emit(f"{BOLD}{'='*70}{RESET}\n")
 
 def print_success(text):
     """Print success message"""
-    print(f"{GREEN}✅ {text}{RESET}")
+    emit(f"{GREEN}✅ {text}{RESET}")
 
 def print_error(text):
     """Print error message"""
-    print(f"{RED}❌ {text}{RESET}")
+    emit(f"{RED}❌ {text}{RESET}")
 
 def print_warning(text):
     """Print warning message"""
-    print(f"{YELLOW}⚠️  {text}{RESET}")
+    emit(f"{YELLOW}⚠️  {text}{RESET}")
 
 def print_info(text):
     """Print info message"""
-    print(f"   {text}")
+    emit(f"   {text}")
+
+def enabled_backends():
+    """Backends enabled in settings; all of them if settings cannot be loaded"""
+    try:
+        from app.core.config import get_settings
+        return {name.strip() for name in get_settings().enabled_backends.split(",") if name.strip()}
+    except Exception:
+        return set(BACKEND_MODULES)
+
+def print_skipped(module):
+    """Report a disabled backend's driver, checking it is installed without importing it"""
+    installed = "installed" if importlib.util.find_spec(module) is not None else "not installed"
+    print_info(f"{module} skipped (not enabled, {installed})")
 
 async def validate_phase2():
     """Run all Phase 2 validation checks"""
+    backends = enabled_backends()
 
     print_header("PHASE 2: SPECIALIZED AGENTS VALIDATION")
 
     validation_passed = True
 
     # Test 1: BaseAgent Class
-    print(f"{BOLD}🏗️  Checking BaseAgent...{RESET}")
+    emit(f"{BOLD}🏗️  Checking BaseAgent...{RESET}")
     try:
         from app.intelligence.agents.base_agent import BaseAgent
         from app.intelligence.orchestration.types import AgentType
@@ -64,8 +94,10 @@ async def validate_phase2():
         print_error(f"BaseAgent validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 2: AgentRegistry
-    print(f"\n{BOLD}📋 Checking AgentRegistry...{RESET}")
+    emit(f"\n{BOLD}📋 Checking AgentRegistry...{RESET}")
     try:
         from app.intelligence.agents.agent_registry import AgentRegistry
         from app.intelligence.orchestration.types import AgentType
@@ -88,8 +120,10 @@ async def validate_phase2():
         print_error(f"AgentRegistry validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 3: SQLAgent
-    print(f"\n{BOLD}🗄️  Checking SQLAgent...{RESET}")
+    emit(f"\n{BOLD}🗄️  Checking SQLAgent...{RESET}")
     try:
         from app.intelligence.agents.sql_agent import SQLAgent
 
@@ -113,8 +147,10 @@ async def validate_phase2():
         print_error(f"SQLAgent validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 4: APIAgent
-    print(f"\n{BOLD}🌐 Checking APIAgent...{RESET}")
+    emit(f"\n{BOLD}🌐 Checking APIAgent...{RESET}")
     try:
         from app.intelligence.agents.api_agent import APIAgent
 
@@ -137,8 +173,10 @@ async def validate_phase2():
         print_error(f"APIAgent validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 5: SOAPAgent
-    print(f"\n{BOLD}🔌 Checking SOAPAgent...{RESET}")
+    emit(f"\n{BOLD}🔌 Checking SOAPAgent...{RESET}")
     try:
         from app.intelligence.agents.soap_agent import SOAPAgent
 
@@ -161,8 +199,10 @@ async def validate_phase2():
         print_error(f"SOAPAgent validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 6: Type Compatibility
-    print(f"\n{BOLD}🔗 Checking Type Compatibility...{RESET}")
+    emit(f"\n{BOLD}🔗 Checking Type Compatibility...{RESET}")
     try:
         from app.intelligence.orchestration.types import AgentType, DataSourceType
 
@@ -182,8 +222,10 @@ async def validate_phase2():
         print_error(f"Type compatibility validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 7: Files Created
-    print(f"\n{BOLD}📄 Checking Created Files...{RESET}")
+    emit(f"\n{BOLD}📄 Checking Created Files...{RESET}")
     try:
         required_files = [
             "app/intelligence/agents/base_agent.py",
@@ -193,10 +235,11 @@ async def validate_phase2():
             "app/intelligence/agents/soap_agent.py"
         ]
 
+        entries = scan_paths(required_files)
         for file_path in required_files:
-            full_path = Path(file_path)
-            if full_path.exists():
-                size = full_path.stat().st_size
+            entry = entries[file_path]
+            if entry is not None:
+                size = entry.stat().st_size
                 print_success(f"{file_path} ({size} bytes)")
             else:
                 print_error(f"File missing: {file_path}")
@@ -206,8 +249,10 @@ async def validate_phase2():
         print_error(f"File validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 8: Dependencies
-    print(f"\n{BOLD}📦 Checking Dependencies...{RESET}")
+    emit(f"\n{BOLD}📦 Checking Dependencies...{RESET}")
     try:
         # LangChain SQL Agent dependencies
         from langchain_community.utilities import SQLDatabase
@@ -215,21 +260,32 @@ async def validate_phase2():
         from sqlalchemy import create_engine
         print_success("LangChain SQL Agent toolkit available")
 
-        from langchain_anthropic import ChatAnthropic
-        print_success("LangChain Anthropic provider available")
+        if "anthropic" in backends:
+            from langchain_anthropic import ChatAnthropic
+            print_success("LangChain Anthropic provider available")
+        else:
+            print_skipped(BACKEND_MODULES["anthropic"])
 
-        import asyncpg
-        print_success("asyncpg database driver available")
+        if "postgresql" in backends:
+            import asyncpg
+            print_success("asyncpg database driver available")
+        else:
+            print_skipped(BACKEND_MODULES["postgresql"])
 
-        import oracledb
-        print_success("oracledb driver available")
+        if "oracle" in backends:
+            import oracledb
+            print_success("oracledb driver available")
+        else:
+            print_skipped(BACKEND_MODULES["oracle"])
 
     except Exception as e:
         print_error(f"Dependency validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Test 9: Integration Check
-    print(f"\n{BOLD}🔄 Checking Integration Points...{RESET}")
+    emit(f"\n{BOLD}🔄 Checking Integration Points...{RESET}")
     try:
         # Verify Phase 1 infrastructure still works
         from app.intelligence.orchestration.types import AgentState
@@ -249,31 +305,35 @@ async def validate_phase2():
         print_error(f"Integration validation failed: {e}")
         validation_passed = False
 
+    flush_output()
+
     # Final Summary
     print_header("VALIDATION SUMMARY")
 
     if validation_passed:
-        print(f"{GREEN}{BOLD}✅ ALL VALIDATIONS PASSED!{RESET}\n")
-        print(f"{GREEN}Phase 2 specialized agents are ready for Phase 3 orchestration.{RESET}\n")
+        emit(f"{GREEN}{BOLD}✅ ALL VALIDATIONS PASSED!{RESET}\n")
+        emit(f"{GREEN}Phase 2 specialized agents are ready for Phase 3 orchestration.{RESET}\n")
 
-        print(f"{BOLD}Created Agents:{RESET}")
+        emit(f"{BOLD}Created Agents:{RESET}")
         print_info("• BaseAgent - Abstract base class for all agents")
         print_info("• SQLAgent - Natural Language to SQL conversion")
         print_info("• APIAgent - REST API endpoint interactions")
         print_info("• SOAPAgent - SOAP service operations")
         print_info("• AgentRegistry - Agent management and retrieval")
 
-        print(f"\n{BOLD}Next Phase:{RESET}")
+        emit(f"\n{BOLD}Next Phase:{RESET}")
         print_info("Phase 3 will implement:")
         print_info("• SupervisorNode for query analysis")
         print_info("• ExecutionPlanner for multi-step plans")
         print_info("• WorkflowBuilder for StateGraph construction")
         print_info("• Routing logic between agents")
 
+        flush_output()
         return 0
     else:
-        print(f"{RED}{BOLD}❌ SOME VALIDATIONS FAILED{RESET}\n")
-        print(f"{RED}Please fix the issues above before proceeding to Phase 3.{RESET}\n")
+        emit(f"{RED}{BOLD}❌ SOME VALIDATIONS FAILED{RESET}\n")
+        emit(f"{RED}Please fix the issues above before proceeding to Phase 3.{RESET}\n")
+        flush_output()
         return 1
 
 if __name__ == "__main__":
@@ -10,7 +10,9 @@ This script validates all Phase 3 components:
 """
 
 import asyncio
+import copy
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add backend to path
@@ -26,40 +28,64 @@ from app.intelligence.orchestration.workflow import WorkflowBuilder
 from app.intelligence.agents.agent_registry import AgentRegistry
 from app.intelligence.tool_registry import ToolRegistry
 from app.llm.base_provider import BaseLLMProvider
-from app.llm.providers.anthropic_provider import AnthropicProvider
-
-
-class Phase3Validator:
+from validation_common import PhaseValidator
+
+# Components only the integration check needs; a failed import is reported
+# by that check instead of stopping the script
+try:
+    from app.intelligence.orchestration.types import ExecutionPlan
+    from app.intelligence.orchestration.base_node import BaseNode
+except ImportError as e:
+    _PHASE1_IMPORT_ERROR = e
+else:
+    _PHASE1_IMPORT_ERROR = None
+
+try:
+    from app.intelligence.agents.base_agent import BaseAgent
+except ImportError as e:
+    _PHASE2_IMPORT_ERROR = e
+else:
+    _PHASE2_IMPORT_ERROR = None
+
+
+@lru_cache(maxsize=1)
+def _routing_template():
+    """Initial state and two-step plan for the routing and integration tests, built once; copy before changing"""
+    state = StateFactory.create_initial_state("test", "session-1")
+    plan = StateFactory.create_execution_plan(
+        query="test",
+        steps=[
+            StateFactory.create_execution_step(1, AgentType.SQL_AGENT, "Step 1", DataSourceType.POSTGRESQL),
+            StateFactory.create_execution_step(2, AgentType.API_AGENT, "Step 2", DataSourceType.REST_API)
+        ],
+        estimated_complexity="medium"
+    )
+    return state, plan
+
+
+@lru_cache(maxsize=1)
+def _tool_registry():
+    """The ToolRegistry shared by every validator in the process"""
+    return ToolRegistry()
+
+
+@lru_cache(maxsize=1)
+def _agent_registry():
+    """The AgentRegistry shared by every validator in the process"""
+    return AgentRegistry()
+
+
+class Phase3Validator(PhaseValidator):
     """Validates Phase 3 implementation."""
 
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.errors = []
-
-    def log_test(self, name: str, passed: bool, details: str = ""):
-        """Log test result."""
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{status}: {name}")
-        if details:
-            print(f"  ℹ️  {details}")
-
-        if passed:
-            self.passed += 1
-        else:
-            self.failed += 1
-            self.errors.append(f"{name}: {details}")
-
     async def validate_execution_planner(self):
         """Validate ExecutionPlanner."""
-        print("\n🔍 Validating ExecutionPlanner...")
+        self._say("\n🔍 Validating ExecutionPlanner...")
 
         try:
             # Create planner
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            await llm_provider.connect()
-            tool_registry = ToolRegistry()
+            llm_provider = await self._get_llm()
+            tool_registry = _tool_registry()
 
             planner = ExecutionPlanner(llm_provider, tool_registry)
             self.log_test("ExecutionPlanner instantiation", True)
@@ -89,14 +115,12 @@ class Phase3Validator:
 
     async def validate_supervisor_node(self):
         """Validate SupervisorNode."""
-        print("\n🔍 Validating SupervisorNode...")
+        self._say("\n🔍 Validating SupervisorNode...")
 
         try:
             # Create supervisor
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            await llm_provider.connect()
-            tool_registry = ToolRegistry()
+            llm_provider = await self._get_llm()
+            tool_registry = _tool_registry()
 
             planner = ExecutionPlanner(llm_provider, tool_registry)
             supervisor = SupervisorNode(planner)
@@ -122,11 +146,13 @@ class Phase3Validator:
 
     def validate_routing_logic(self):
         """Validate routing functions."""
-        print("\n🔍 Validating Routing Logic...")
+        self._say("\n🔍 Validating Routing Logic...")
 
         try:
+            base_state, plan = _routing_template()
+
             # Test route_from_supervisor
-            test_state: AgentState = StateFactory.create_initial_state("test", "session-1")
+            test_state: AgentState = base_state.copy()
             test_state["next_agent"] = AgentType.SQL_AGENT
 
             route = route_from_supervisor(test_state)
@@ -142,16 +168,9 @@ class Phase3Validator:
             route = route_from_supervisor(test_state)
             self.log_test("route_from_supervisor with SOAP_AGENT", route == "soap_agent", f"Route: {route}")
 
-            # Test route_from_agent with more steps
-            plan = StateFactory.create_execution_plan(
-                query="test",
-                steps=[
-                    StateFactory.create_execution_step(1, AgentType.SQL_AGENT, "Step 1", DataSourceType.POSTGRESQL),
-                    StateFactory.create_execution_step(2, AgentType.API_AGENT, "Step 2", DataSourceType.REST_API)
-                ],
-                estimated_complexity="medium"
-            )
-            test_state["execution_plan"] = plan
+            # Test route_from_agent with more steps (marking steps complete
+            # updates them, so the plan is copied)
+            test_state["execution_plan"] = copy.deepcopy(plan)
             test_state["current_step_index"] = 0
             StateHelper.mark_step_complete(test_state, 0, ExecutionStepStatus.COMPLETED)
             test_state["current_step_index"] = 1
@@ -171,15 +190,13 @@ class Phase3Validator:
 
     async def validate_workflow_builder(self):
         """Validate WorkflowBuilder."""
-        print("\n🔍 Validating WorkflowBuilder...")
+        self._say("\n🔍 Validating WorkflowBuilder...")
 
         try:
             # Create workflow builder
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            await llm_provider.connect()
-            tool_registry = ToolRegistry()
-            agent_registry = AgentRegistry()
+            llm_provider = await self._get_llm()
+            tool_registry = _tool_registry()
+            agent_registry = _agent_registry()
 
             planner = ExecutionPlanner(llm_provider, tool_registry)
             supervisor = SupervisorNode(planner)
@@ -199,28 +216,19 @@ class Phase3Validator:
 
     def validate_integration(self):
         """Validate integration with Phase 1 & 2."""
-        print("\n🔍 Validating Phase 1 & 2 Integration...")
+        self._say("\n🔍 Validating Phase 1 & 2 Integration...")
 
         try:
-            # Check Phase 1 components are accessible
-            from app.intelligence.orchestration.types import AgentState, ExecutionPlan
-            from app.intelligence.orchestration.state import StateFactory, StateHelper
-            from app.intelligence.orchestration.base_node import BaseNode
-            self.log_test("Phase 1 types and state accessible", True)
-
-            # Check Phase 2 components are accessible
-            from app.intelligence.agents.base_agent import BaseAgent
-            from app.intelligence.agents.agent_registry import AgentRegistry
-            self.log_test("Phase 2 agents accessible", True)
-
-            # Test state creation and manipulation
-            state = StateFactory.create_initial_state("test query", "session-123")
-            plan = StateFactory.create_execution_plan(
-                query="test",
-                steps=[StateFactory.create_execution_step(1, AgentType.SQL_AGENT, "test", DataSourceType.POSTGRESQL)],
-                estimated_complexity="low"
-            )
-            state["execution_plan"] = plan
+            # Phase 1 and 2 components are imported at module level
+            self.log_test("Phase 1 types and state accessible", _PHASE1_IMPORT_ERROR is None,
+                          str(_PHASE1_IMPORT_ERROR or ""))
+            self.log_test("Phase 2 agents accessible", _PHASE2_IMPORT_ERROR is None,
+                          str(_PHASE2_IMPORT_ERROR or ""))
+
+            # Test state manipulation on the routing tests' state and plan
+            base_state, plan = _routing_template()
+            state = base_state.copy()
+            state["execution_plan"] = copy.deepcopy(plan)
 
             # Test StateHelper methods
             update = StateHelper.mark_step_complete(state, success=True)
@@ -232,29 +240,19 @@ class Phase3Validator:
 
     async def run_all_validations(self):
         """Run all validation tests."""
-        print("=" * 60)
-        print("🚀 PHASE 3 VALIDATION: ORCHESTRATION LAYER")
-        print("=" * 60)
-
-        await self.validate_execution_planner()
-        await self.validate_supervisor_node()
-        self.validate_routing_logic()
-        await self.validate_workflow_builder()
-        self.validate_integration()
-
-        print("\n" + "=" * 60)
-        print("📊 VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%")
-
-        if self.errors:
-            print("\n❌ ERRORS:")
-            for error in self.errors:
-                print(f"  • {error}")
-
-        print("=" * 60)
+        self._write_header("🚀 PHASE 3 VALIDATION: ORCHESTRATION LAYER")
+
+        # The validators are independent, so the LLM-bound ones overlap their
+        # provider setup and calls; output is still printed in this order
+        await self.run_concurrently(
+            self.validate_execution_planner,
+            self.validate_supervisor_node,
+            self.validate_routing_logic,
+            self.validate_workflow_builder,
+            self.validate_integration,
+        )
+
+        self._write_summary()
 
         return self.failed == 0
 
@@ -262,7 +260,10 @@ class Phase3Validator:
 async def main():
     """Main validation entry point."""
     validator = Phase3Validator()
-    success = await validator.run_all_validations()
+    try:
+        success = await validator.run_all_validations()
+    finally:
+        await validator.close()
 
     if success:
         print("\n✅ Phase 3 validation PASSED! Ready for Phase 4.")
@@ -273,4 +274,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (pinned in requirements.txt) when installed, else the default loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -17,130 +17,124 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from app.intelligence.orchestration.types import AgentState, AgentType, DataSourceType
+from app.intelligence.orchestration.types import AgentType, DataSourceType
 from app.intelligence.orchestration.state import StateFactory
 from app.intelligence.orchestration.consolidator_node import ConsolidatorNode
 from app.intelligence.orchestration.data_merger import DataMerger
 from app.intelligence.orchestration.response_formatter import ResponseFormatter
-from app.llm.providers.anthropic_provider import AnthropicProvider
 from app.llm.providers.openai_provider import OpenAIProvider
-
-
-class Phase4Validator:
+from validation_common import PhaseValidator
+
+# Components only the integration check needs; a failed import is reported
+# by that check instead of stopping the script
+try:
+    from app.intelligence.orchestration.types import AgentState
+    from app.intelligence.orchestration.execution_planner import ExecutionPlanner
+    from app.intelligence.orchestration.workflow import WorkflowBuilder
+    from app.intelligence.agents.agent_registry import AgentRegistry
+except ImportError as e:
+    _IMPORT_ERROR = e
+else:
+    _IMPORT_ERROR = None
+
+
+class Phase4Validator(PhaseValidator):
     """Validates Phase 4 implementation."""
 
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.errors = []
-
-    def log_test(self, name: str, passed: bool, details: str = ""):
-        """Log test result."""
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{status}: {name}")
-        if details:
-            print(f"  ℹ️  {details}")
-
-        if passed:
-            self.passed += 1
-        else:
-            self.failed += 1
-            self.errors.append(f"{name}: {details}")
-
     def validate_data_merger(self):
         """Validate DataMerger."""
-        print("\n🔍 Validating DataMerger...")
+        log = self.log_test  # bound once for the test calls below
+        self._say("\n🔍 Validating DataMerger...")
 
         try:
             merger = DataMerger()
-            self.log_test("DataMerger instantiation", True)
+            log("DataMerger instantiation", True)
+
+            merge = merger.merge_results
+            deduplicate = merger.deduplicate
+            correlate = merger.correlate_by_field
+            flatten = merger.flatten_nested
 
-            # Test merge with common keys
             sql_data = [{"alert_id": 1, "severity": "high", "count": 5}]
             api_data = [{"alert_id": 1, "user_name": "John Doe"}]
-            soap_data = []
-
-            merged = merger.merge_results(sql_data, api_data, soap_data, merge_strategy="join")
-            self.log_test("Merge results with join strategy", len(merged) > 0, f"Merged: {len(merged)} records")
-
-            # Check if data was joined
-            if merged:
-                has_both_fields = "severity" in merged[0] and "user_name" in merged[0]
-                self.log_test("Join includes fields from both sources", has_both_fields)
-
-            # Test concat strategy
-            sql_data2 = [{"id": 1, "value": "A"}]
-            api_data2 = [{"id": 2, "value": "B"}]
-
-            concatenated = merger.merge_results(sql_data2, api_data2, [], merge_strategy="concat")
-            self.log_test("Merge with concat strategy", len(concatenated) == 2, f"Records: {len(concatenated)}")
-
-            # Test deduplicate
             dup_data = [
                 {"id": 1, "name": "A"},
                 {"id": 1, "name": "A"},
                 {"id": 2, "name": "B"}
             ]
-            unique = merger.deduplicate(dup_data, key_fields=["id", "name"])
-            self.log_test("Deduplication", len(unique) == 2, f"Unique: {len(unique)} from {len(dup_data)}")
-
-            # Test correlate by field
             data = [
                 {"user_id": 1, "alert_id": 10},
                 {"user_id": 1, "alert_id": 11},
                 {"user_id": 2, "alert_id": 20}
             ]
-            correlated = merger.correlate_by_field(data, "user_id")
-            self.log_test("Correlate by field", len(correlated) == 2, f"Groups: {len(correlated)}")
-
-            # Test flatten nested
             nested_data = [
                 {"user": {"name": "John", "age": 30}, "id": 1}
             ]
-            flattened = merger.flatten_nested(nested_data, max_depth=2)
-            has_flat_key = any("user.name" in item or "user.age" in item for item in flattened)
-            self.log_test("Flatten nested structures", has_flat_key, "Nested keys flattened")
+
+            # One join, checked twice
+            joined = merge(sql_data, api_data, [], merge_strategy="join")
+            log("Merge results with join strategy", len(joined) > 0, f"Merged: {len(joined)} records")
+            log("Join includes fields from both sources",
+                bool(joined) and "severity" in joined[0] and "user_name" in joined[0])
+
+            # (test name, operation, args, kwargs, check on the output,
+            # details with {n} = output length)
+            cases = [
+                ("Merge with concat strategy", merge, ([{"id": 1, "value": "A"}], [{"id": 2, "value": "B"}], []),
+                 {"merge_strategy": "concat"}, lambda out: len(out) == 2, "Records: {n}"),
+                ("Deduplication", deduplicate, (dup_data,), {"key_fields": ["id", "name"]},
+                 lambda out: len(out) == 2, f"Unique: {{n}} from {len(dup_data)}"),
+                ("Correlate by field", correlate, (data, "user_id"), {},
+                 lambda out: len(out) == 2, "Groups: {n}"),
+                ("Flatten nested structures", flatten, (nested_data,), {"max_depth": 2},
+                 lambda out: any("user.name" in item or "user.age" in item for item in out), "Nested keys flattened"),
+            ]
+
+            for name, operation, args, kwargs, check, details in cases:
+                out = operation(*args, **kwargs)
+                log(name, check(out), details.format(n=len(out)))
 
         except Exception as e:
-            self.log_test("DataMerger validation", False, str(e))
+            log("DataMerger validation", False, str(e))
 
     def validate_response_formatter(self):
         """Validate ResponseFormatter."""
-        print("\n🔍 Validating ResponseFormatter...")
+        log = self.log_test  # bound once for the test calls below
+        self._say("\n🔍 Validating ResponseFormatter...")
 
         try:
             formatter = ResponseFormatter()
-            self.log_test("ResponseFormatter instantiation", True)
+            log("ResponseFormatter instantiation", True)
 
             # Test JSON formatting
             test_data = [{"id": 1, "name": "Test"}]
             json_output = formatter.format(test_data, format_type="json")
-            self.log_test("JSON formatting", "data" in json_output, f"Length: {len(json_output)}")
+            log("JSON formatting", "data" in json_output, f"Length: {len(json_output)}")
 
             # Test table formatting
             table_output = formatter.format(test_data, format_type="table")
             has_borders = "+" in table_output and "|" in table_output
-            self.log_test("Table formatting", has_borders, "Has table borders")
+            log("Table formatting", has_borders, "Has table borders")
 
             # Test markdown formatting
             markdown_output = formatter.format(test_data, format_type="markdown")
             has_md_table = "|" in markdown_output and "---" in markdown_output
-            self.log_test("Markdown formatting", has_md_table, "Has markdown table")
+            log("Markdown formatting", has_md_table, "Has markdown table")
 
             # Test summary formatting
             summary_output = formatter.format(test_data, format_type="summary")
             has_summary = "Summary" in summary_output
-            self.log_test("Summary formatting", has_summary, "Has summary section")
+            log("Summary formatting", has_summary, "Has summary section")
 
             # Test text formatting
             text_output = formatter.format(test_data, format_type="text")
-            self.log_test("Text formatting", len(text_output) > 0, f"Length: {len(text_output)}")
+            log("Text formatting", len(text_output) > 0, f"Length: {len(text_output)}")
 
             # Test error formatting
             error = ValueError("Test error")
             error_output = formatter.format_error(error, context={"query": "test query"})
             has_error_info = "Error" in error_output and "Test error" in error_output
-            self.log_test("Error formatting", has_error_info, "Contains error details")
+            log("Error formatting", has_error_info, "Contains error details")
 
             # Test multi-source formatting
             multi_output = formatter.format_multi_source(
@@ -150,20 +144,18 @@ class Phase4Validator:
                 format_type="text"
             )
             has_sections = "SQL" in multi_output and "API" in multi_output
-            self.log_test("Multi-source formatting", has_sections, "Has source sections")
+            log("Multi-source formatting", has_sections, "Has source sections")
 
         except Exception as e:
-            self.log_test("ResponseFormatter validation", False, str(e))
+            log("ResponseFormatter validation", False, str(e))
 
     async def validate_consolidator_node(self):
         """Validate ConsolidatorNode."""
-        print("\n🔍 Validating ConsolidatorNode...")
+        self._say("\n🔍 Validating ConsolidatorNode...")
 
         try:
             # Test with mock provider (no actual API calls)
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            await llm_provider.connect()
+            llm_provider = await self._get_llm()
 
             consolidator = ConsolidatorNode(llm_provider)
             self.log_test("ConsolidatorNode instantiation", True)
@@ -236,17 +228,12 @@ class Phase4Validator:
 
     def validate_integration(self):
         """Validate integration with previous phases."""
-        print("\n🔍 Validating Phase 1-4 Integration...")
+        self._say("\n🔍 Validating Phase 1-4 Integration...")
 
         try:
-            # Check all phases are accessible
-            from app.intelligence.orchestration.types import AgentState
-            from app.intelligence.orchestration.state import StateFactory
-            from app.intelligence.agents.agent_registry import AgentRegistry
-            from app.intelligence.orchestration.execution_planner import ExecutionPlanner
-            from app.intelligence.orchestration.workflow import WorkflowBuilder
-
-            self.log_test("All orchestration components accessible", True)
+            # All phases' components are imported at module level
+            self.log_test("All orchestration components accessible", _IMPORT_ERROR is None,
+                          str(_IMPORT_ERROR or ""))
 
             # Test state flow with consolidation
             state = StateFactory.create_initial_state("test", "session-1")
@@ -269,7 +256,7 @@ class Phase4Validator:
 
     def validate_provider_compatibility(self):
         """Validate provider compatibility."""
-        print("\n🔍 Validating Provider Compatibility...")
+        self._say("\n🔍 Validating Provider Compatibility...")
 
         try:
             # Check ConsolidatorNode works with different providers
@@ -287,14 +274,15 @@ class Phase4Validator:
                 "Direct text": {"text": "direct"}
             }
 
-            all_passed = True
-            for name, response in formats.items():
-                extracted = consolidator._extract_response_text(response)
-                if not extracted:
-                    all_passed = False
-                    break
+            # Every format is tried, so a failure names each unsupported one
+            extract = consolidator._extract_response_text
+            results = {name: extract(response) for name, response in formats.items()}
+            for name, extracted in results.items():
+                self.log_test(f"Extract {name}", bool(extracted))
 
-            self.log_test("All provider response formats supported", all_passed, f"Tested {len(formats)} formats")
+            failed = [name for name, extracted in results.items() if not extracted]
+            details = f"Unsupported: {', '.join(failed)}" if failed else f"Tested {len(formats)} formats"
+            self.log_test("All provider response formats supported", not failed, details)
 
             # Check SQL agent provider support
             from app.intelligence.agents.sql_agent import SQLAgent
@@ -305,29 +293,19 @@ class Phase4Validator:
 
     async def run_all_validations(self):
         """Run all validation tests."""
-        print("=" * 60)
-        print("🚀 PHASE 4 VALIDATION: DATA CONSOLIDATION")
-        print("=" * 60)
+        self._write_header("🚀 PHASE 4 VALIDATION: DATA CONSOLIDATION")
 
-        self.validate_data_merger()
-        self.validate_response_formatter()
+        # Each validator's output is written in one call when it finishes
+        for validator in (self.validate_data_merger, self.validate_response_formatter):
+            validator()
+            self._flush()
         await self.validate_consolidator_node()
-        self.validate_integration()
-        self.validate_provider_compatibility()
-
-        print("\n" + "=" * 60)
-        print("📊 VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%")
+        self._flush()
+        for validator in (self.validate_integration, self.validate_provider_compatibility):
+            validator()
+            self._flush()
 
-        if self.errors:
-            print("\n❌ ERRORS:")
-            for error in self.errors:
-                print(f"  • {error}")
-
-        print("=" * 60)
+        self._write_summary()
 
         return self.failed == 0
 
@@ -335,7 +313,10 @@ class Phase4Validator:
 async def main():
     """Main validation entry point."""
     validator = Phase4Validator()
-    success = await validator.run_all_validations()
+    try:
+        success = await validator.run_all_validations()
+    finally:
+        await validator.close()
 
     if success:
         print("\n✅ Phase 4 validation PASSED! Ready for Phase 5.")
@@ -346,4 +327,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (pinned in requirements.txt) when installed, else the default loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -9,58 +9,66 @@ This script validates all Phase 5 components:
 5. End-to-End Integration - Full workflow
 """
 
+import argparse
 import asyncio
+import importlib
+import inspect
 import sys
 from pathlib import Path
 
-# Add backend to path
+# Add backend to path, unless running the script already put its directory
+# first; an extra entry costs every later import a lookup there
 backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+if sys.path[0] != str(backend_dir):
+    sys.path.insert(0, str(backend_dir))
 
 from app.intelligence.langgraph_orchestrator import LangGraphOrchestrator
 from app.intelligence.tool_registry import ToolRegistry
 from app.intelligence.agents.agent_registry import AgentRegistry
 from app.llm.providers.anthropic_provider import AnthropicProvider
-
-
-class Phase5Validator:
+from validation_common import PhaseValidator
+
+# Components the validators check; a failed import is reported as the first
+# test instead of stopping the script
+try:
+    from app.core.config import AppSettings
+    from app.orchestration.websocket_handler import WebSocketHandler, ConnectionManager
+    from app.intelligence.orchestration.types import AgentState
+    from app.intelligence.orchestration.state import StateFactory
+    from app.intelligence.orchestration.execution_planner import ExecutionPlanner
+    from app.intelligence.orchestration.supervisor_node import SupervisorNode
+    from app.intelligence.orchestration.consolidator_node import ConsolidatorNode
+    from app.intelligence.orchestration.workflow import WorkflowBuilder
+except ImportError as e:
+    _IMPORT_ERROR = e
+else:
+    _IMPORT_ERROR = None
+
+# Fields get_statistics() must report
+_REQUIRED_STATS = frozenset({"agents_registered", "tools_available"})
+
+# UniversalAgent methods the orchestrator must provide, in report order
+_UNIVERSAL_AGENT_METHODS = ("process_message", "get_available_tools", "get_tool_descriptions")
+
+
+class Phase5Validator(PhaseValidator):
     """Validates Phase 5 implementation."""
 
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.errors = []
-
-    def log_test(self, name: str, passed: bool, details: str = ""):
-        """Log test result."""
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{status}: {name}")
-        if details:
-            print(f"  ℹ️  {details}")
-
-        if passed:
-            self.passed += 1
-        else:
-            self.failed += 1
-            self.errors.append(f"{name}: {details}")
+    def __init__(self, fail_fast: bool = False):
+        super().__init__()
+        # Stop at the first validator with a failed test
+        self.fail_fast = fail_fast
 
     async def validate_langgraph_orchestrator(self):
         """Validate LangGraphOrchestrator."""
-        print("\n🔍 Validating LangGraphOrchestrator...")
+        self._say("\n🔍 Validating LangGraphOrchestrator...")
 
         try:
             # Create orchestrator
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            await llm_provider.connect()
-
-            tool_registry = ToolRegistry()
-            agent_registry = AgentRegistry()
-
             orchestrator = LangGraphOrchestrator(
-                llm_provider=llm_provider,
-                tool_registry=tool_registry,
-                agent_registry=agent_registry
+                llm_provider=await self._get_llm(),
+                tool_registry=ToolRegistry(),
+                agent_registry=AgentRegistry()
             )
 
             self.log_test("LangGraphOrchestrator instantiation", True)
@@ -75,7 +83,7 @@ class Phase5Validator:
 
             # Test get_statistics
             stats = orchestrator.get_statistics()
-            has_stats = "agents_registered" in stats and "tools_available" in stats
+            has_stats = _REQUIRED_STATS.issubset(stats)
             self.log_test("Get statistics", has_stats, f"Stats: {len(stats)} fields")
 
             # Test __repr__
@@ -92,12 +100,9 @@ class Phase5Validator:
 
     def validate_feature_flag(self):
         """Validate feature flag logic."""
-        print("\n🔍 Validating Feature Flag...")
+        self._say("\n🔍 Validating Feature Flag...")
 
         try:
-            # Test config import
-            from app.core.config import AppSettings
-
             # Create test settings
             class TestSettings(AppSettings):
                 use_langgraph: bool = False
@@ -117,13 +122,13 @@ class Phase5Validator:
 
     def validate_websocket_integration(self):
         """Validate WebSocket handler integration."""
-        print("\n🔍 Validating WebSocket Integration...")
+        self._say("\n🔍 Validating WebSocket Integration...")
 
         try:
-            # Test imports
-            from app.orchestration.websocket_handler import WebSocketHandler, ConnectionManager
-
-            self.log_test("WebSocket imports", True)
+            # WebSocket components are imported at module level
+            self.log_test("WebSocket imports", _IMPORT_ERROR is None)
+            if _IMPORT_ERROR is not None:
+                return
 
             # Test ConnectionManager
             conn_manager = ConnectionManager()
@@ -151,67 +156,43 @@ class Phase5Validator:
 
     def validate_provider_compatibility(self):
         """Validate all provider support."""
-        print("\n🔍 Validating Provider Compatibility...")
+        self._say("\n🔍 Validating Provider Compatibility...")
 
         try:
-            # Test that orchestrator works with different providers
-            from app.intelligence.langgraph_orchestrator import LangGraphOrchestrator
-
-            # All providers should be importable
-            try:
-                from app.llm.providers.anthropic_provider import AnthropicProvider
-                self.log_test("Anthropic provider import", True)
-            except:
-                self.log_test("Anthropic provider import", False)
-
-            try:
-                from app.llm.providers.openai_provider import OpenAIProvider
-                self.log_test("OpenAI provider import", True)
-            except:
-                self.log_test("OpenAI provider import", False)
-
-            try:
-                from app.llm.providers.eliza_provider import ElizaProvider
-                self.log_test("Eliza provider import", True)
-            except:
-                self.log_test("Eliza provider import", False)
-
-            try:
-                from app.llm.providers.litellm_provider import LiteLLMProvider
-                self.log_test("LiteLLM provider import", True)
-            except:
-                self.log_test("LiteLLM provider import", False)
+            # Test that orchestrator works with different providers.
+            # All providers should be importable; each is really imported, so
+            # a broken module or missing dependency fails its check
+            for name, module, cls in (
+                ("Anthropic", "app.llm.providers.anthropic_provider", "AnthropicProvider"),
+                ("OpenAI", "app.llm.providers.openai_provider", "OpenAIProvider"),
+                ("Eliza", "app.llm.providers.eliza_provider", "ElizaProvider"),
+                ("LiteLLM", "app.llm.providers.litellm_provider", "LiteLLMProvider"),
+            ):
+                try:
+                    getattr(importlib.import_module(module), cls)
+                    self.log_test(f"{name} provider import", True)
+                except Exception as e:
+                    self.log_test(f"{name} provider import", False, str(e))
 
         except Exception as e:
             self.log_test("Provider compatibility validation", False, str(e))
 
-    def validate_integration(self):
+    async def validate_integration(self):
         """Validate end-to-end integration."""
-        print("\n🔍 Validating End-to-End Integration...")
+        self._say("\n🔍 Validating End-to-End Integration...")
 
         try:
-            # Check all phases are accessible
-            from app.intelligence.orchestration.types import AgentState
-            from app.intelligence.orchestration.state import StateFactory
-            from app.intelligence.orchestration.execution_planner import ExecutionPlanner
-            from app.intelligence.orchestration.supervisor_node import SupervisorNode
-            from app.intelligence.orchestration.consolidator_node import ConsolidatorNode
-            from app.intelligence.orchestration.workflow import WorkflowBuilder
-            from app.intelligence.langgraph_orchestrator import LangGraphOrchestrator
-
-            self.log_test("All orchestration components accessible", True)
+            # Components of all phases are imported at module level
+            self.log_test("All orchestration components accessible", _IMPORT_ERROR is None)
+            if _IMPORT_ERROR is not None:
+                return
 
             # Test that orchestrator can be created with all components
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            tool_registry = ToolRegistry()
-            agent_registry = AgentRegistry()
-
             # This should not raise
             orchestrator = LangGraphOrchestrator(
-                llm_provider=llm_provider,
-                tool_registry=tool_registry,
-                agent_registry=agent_registry
+                llm_provider=await self._get_llm(),
+                tool_registry=ToolRegistry(),
+                agent_registry=AgentRegistry()
             )
 
             # Check internal components
@@ -226,33 +207,24 @@ class Phase5Validator:
         except Exception as e:
             self.log_test("End-to-end integration validation", False, str(e))
 
-    def validate_backward_compatibility(self):
+    async def validate_backward_compatibility(self):
         """Validate backward compatibility with UniversalAgent interface."""
-        print("\n🔍 Validating Backward Compatibility...")
+        self._say("\n🔍 Validating Backward Compatibility...")
 
         try:
-            # Test that LangGraphOrchestrator has same interface as UniversalAgent
-            import os
-            llm_provider = AnthropicProvider(api_key=os.getenv("ANTHROPIC_API_KEY", "test-key"))
-            tool_registry = ToolRegistry()
-
+            # Test that LangGraphOrchestrator has same interface as UniversalAgent,
+            # built with UniversalAgent's two constructor arguments (no agent registry)
             orchestrator = LangGraphOrchestrator(
-                llm_provider=llm_provider,
-                tool_registry=tool_registry
+                llm_provider=await self._get_llm(),
+                tool_registry=ToolRegistry()
             )
 
             # Check for UniversalAgent-compatible methods
-            has_process_message = hasattr(orchestrator, 'process_message')
-            has_get_available_tools = hasattr(orchestrator, 'get_available_tools')
-            has_get_tool_descriptions = hasattr(orchestrator, 'get_tool_descriptions')
-
             self.log_test("Has UniversalAgent interface methods",
-                         has_process_message and has_get_available_tools and has_get_tool_descriptions,
-                         "process_message, get_available_tools, get_tool_descriptions")
+                         all(hasattr(orchestrator, name) for name in _UNIVERSAL_AGENT_METHODS),
+                         ", ".join(_UNIVERSAL_AGENT_METHODS))
 
             # Check method signatures match
-            import inspect
-
             # process_message should accept message, session_id, context, stream
             sig = inspect.signature(orchestrator.process_message)
             params = list(sig.parameters.keys())
@@ -265,38 +237,46 @@ class Phase5Validator:
 
     async def run_all_validations(self):
         """Run all validation tests."""
-        print("=" * 60)
-        print("🚀 PHASE 5 VALIDATION: INTEGRATION & MIGRATION")
-        print("=" * 60)
-
-        await self.validate_langgraph_orchestrator()
-        self.validate_feature_flag()
-        self.validate_websocket_integration()
-        self.validate_provider_compatibility()
-        self.validate_integration()
-        self.validate_backward_compatibility()
-
-        print("\n" + "=" * 60)
-        print("📊 VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"📈 Success Rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%")
-
-        if self.errors:
-            print("\n❌ ERRORS:")
-            for error in self.errors:
-                print(f"  • {error}")
-
-        print("=" * 60)
+        self._write_header("🚀 PHASE 5 VALIDATION: INTEGRATION & MIGRATION")
+
+        if _IMPORT_ERROR is not None:
+            self.log_test("Phase 5 component imports", False, str(_IMPORT_ERROR))
+
+        validators = (
+            self.validate_langgraph_orchestrator,
+            self.validate_feature_flag,
+            self.validate_websocket_integration,
+            self.validate_provider_compatibility,
+            self.validate_integration,
+            self.validate_backward_compatibility,
+        )
+        if self.fail_fast:
+            # One at a time, so nothing runs after the first failure
+            for validator in validators:
+                if self.failed:
+                    break
+                await self.run_concurrently(validator)
+        else:
+            # The validators are independent, so they run at the same time;
+            # output is still printed in this order
+            await self.run_concurrently(*validators)
+
+        self._write_summary()
 
         return self.failed == 0
 
 
 async def main():
     """Main validation entry point."""
-    validator = Phase5Validator()
-    success = await validator.run_all_validations()
+    parser = argparse.ArgumentParser(description="Validate the Phase 5 integration")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop after the first validator with a failed test")
+    args = parser.parse_args()
+
+    validator = Phase5Validator(fail_fast=args.fail_fast)
+    try:
+        success = await validator.run_all_validations()
+    finally:
+        await validator.close()
 
     if success:
         print("\n✅ Phase 5 validation PASSED! LangGraph orchestration ready for production.")
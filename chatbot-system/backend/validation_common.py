@@ -0,0 +1,173 @@
+"""
+Helpers shared by the phase validation scripts
+"""
+import asyncio
+import os
+import sys
+from contextvars import ContextVar
+
+# Color codes for terminal output; empty when stdout is piped or captured
+# (CI logs), so no escape bytes are written there
+_isatty = sys.stdout.isatty()
+GREEN = "\033[92m" if _isatty else ""
+RED = "\033[91m" if _isatty else ""
+YELLOW = "\033[93m" if _isatty else ""
+RESET = "\033[0m" if _isatty else ""
+BOLD = "\033[1m" if _isatty else ""
+
+
+def scan_paths(paths):
+    """Look up paths with one os.scandir per parent directory; returns path -> DirEntry or None"""
+    parents = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        parents.setdefault(parent or ".", []).append((path, name))
+
+    found = {}
+    for parent, members in parents.items():
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+        for path, name in members:
+            found[path] = entries.get(name)
+    return found
+
+
+# Output and results of a validator running alongside others, as (fn, args)
+# calls replayed in order once all of them finish; None applies them directly
+_deferred = ContextVar("deferred", default=None)
+
+
+class PhaseValidator:
+    """Test bookkeeping, buffered output and the shared LLM provider of a phase validator"""
+
+    def __init__(self, llm_provider=None, hold_output: bool = False):
+        self.passed = 0
+        self.failed = 0
+        # "test name: details" of failed tests, for the summary
+        self.errors = []
+        # Output lines waiting for _flush(); with hold_output they stay queued
+        # until _flush(force=True), so another validator's output can't interleave
+        self._buf = []
+        self.hold_output = hold_output
+        # QUIET=1 prints only failures and the summary, e.g. for CI logs
+        self._verbose = os.getenv("QUIET") != "1"
+        # Provider shared by every validator, built on first use
+        # unless a connected provider is passed in
+        self._llm = llm_provider
+        self._owns_llm = llm_provider is None
+        self._llm_lock = asyncio.Lock()
+
+    async def _get_llm(self):
+        """
+        The shared AnthropicProvider, built once.
+
+        It is only connected when ANTHROPIC_API_KEY is set, since no validator
+        needs the API and a client holding the placeholder key couldn't
+        authenticate anyway.
+        """
+        async with self._llm_lock:
+            if self._llm is None:
+                from app.llm.providers.anthropic_provider import AnthropicProvider
+
+                api_key = os.getenv("ANTHROPIC_API_KEY")
+                llm_provider = AnthropicProvider(api_key=api_key or "test-key")
+                if api_key:
+                    await llm_provider.connect()
+                self._llm = llm_provider
+            return self._llm
+
+    async def close(self):
+        """Disconnect the provider if this validator created it"""
+        if self._owns_llm and self._llm is not None:
+            await self._llm.disconnect()
+            self._llm = None
+
+    def _write(self, text: str):
+        """Queue a line of output"""
+        self._buf.append(text + "\n")
+
+    def _flush(self, force: bool = False):
+        """Write the queued output in one call"""
+        if self._buf and (force or not self.hold_output):
+            sys.stdout.write("".join(self._buf))
+            self._buf.clear()
+
+    def _defer(self, fn, *args):
+        """Call fn now, or hold the call back while validators run concurrently"""
+        deferred = _deferred.get()
+        if deferred is None:
+            fn(*args)
+        else:
+            deferred.append((fn, args))
+
+    def _say(self, text: str):
+        """Print a line of validator output"""
+        self._defer(self._write, text)
+
+    def log_test(self, name: str, passed: bool, details: str = ""):
+        """Log test result."""
+        self._defer(self._record_test, name, passed, details)
+
+    def _record_test(self, name: str, passed: bool, details: str):
+        """Print and count a test result"""
+        if self._verbose or not passed:
+            status = "✅ PASSED" if passed else "❌ FAILED"
+            self._write(f"{status}: {name}")
+            if details:
+                self._write(f"  ℹ️  {details}")
+
+        if passed:
+            self.passed += 1
+        else:
+            self.failed += 1
+            self.errors.append(f"{name}: {details}")
+
+    async def _run_deferred(self, validator):
+        """Run one validator with its output and results held back; returns them"""
+        deferred = []
+        _deferred.set(deferred)  # local to this validator's task
+        if asyncio.iscoroutinefunction(validator):
+            await validator()
+        else:
+            validator()
+        return deferred
+
+    async def run_concurrently(self, *validators):
+        """Run validators at the same time, then replay their output and results in the order given"""
+        results = await asyncio.gather(*(self._run_deferred(v) for v in validators), return_exceptions=True)
+        for validator, result in zip(validators, results):
+            if isinstance(result, BaseException):
+                self.log_test(validator.__name__, False, str(result))
+                continue
+            for fn, args in result:
+                fn(*args)
+            self._flush()  # one write per validator
+
+    def _write_header(self, title: str):
+        """Write the banner that opens a validation run"""
+        self._write("=" * 60)
+        self._write(title)
+        self._write("=" * 60)
+        self._flush()
+
+    def _write_summary(self):
+        """Write the pass/fail counts and the failed tests"""
+        self._write("\n" + "=" * 60)
+        self._write("📊 VALIDATION SUMMARY")
+        self._write("=" * 60)
+        self._write(f"✅ Passed: {self.passed}")
+        self._write(f"❌ Failed: {self.failed}")
+        total = self.passed + self.failed
+        rate = self.passed / total * 100 if total else 0.0
+        self._write(f"📈 Success Rate: {rate:.1f}%")
+
+        if self.errors:
+            self._write("\n❌ ERRORS:")
+            for error in self.errors:
+                self._write(f"  • {error}")
+
+        self._write("=" * 60)
+        self._flush()